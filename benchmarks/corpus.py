@@ -0,0 +1,92 @@
+import math
+import os
+import random
+from typing import List, NamedTuple, Optional
+
+import yaml
+
+WORDS = [
+    "alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel", "india", "juliett", "kilo", "lima",
+    "mike", "november", "oscar", "papa", "quebec", "romeo", "sierra", "tango", "uniform", "victor", "whiskey",
+]  # fmt: skip
+
+
+class Corpus(NamedTuple):
+    """Shape of a synthetic docs tree"""
+
+    pages: int = 1000
+    depth: int = 3
+    files_per_dir: int = 20
+    pages_density: float = 0.5
+    rest_patterns: int = 2
+    seed: int = 0
+
+    @property
+    def name(self) -> str:
+        return "pages={}-depth={}-per_dir={}-density={}-rest={}".format(
+            self.pages, self.depth, self.files_per_dir, self.pages_density, self.rest_patterns
+        )
+
+
+def directories(corpus: Corpus) -> List[str]:
+    """Relative paths of the directories holding pages, spread evenly over a tree of the configured depth"""
+    count = max(1, math.ceil(corpus.pages / corpus.files_per_dir))
+    if corpus.depth == 0:
+        return [""] * count
+
+    branching = max(2, math.ceil(count ** (1 / corpus.depth)))
+    result = []
+    for index in range(count):
+        parts = []
+        for _ in range(corpus.depth):
+            index, digit = divmod(index, branching)
+            parts.append("dir{}".format(digit))
+        result.append(os.path.join(*reversed(parts)))
+    return result
+
+
+def generate(corpus: Corpus, docs_dir: str):
+    """Writes the corpus to docs_dir, the same corpus always produces the same files"""
+    rng = random.Random(corpus.seed)
+    dirs = directories(corpus)
+    by_dir = {}
+    for number in range(corpus.pages):
+        by_dir.setdefault(dirs[number // corpus.files_per_dir], []).append(number)
+
+    for rel_dir, numbers in by_dir.items():
+        abs_dir = os.path.join(docs_dir, rel_dir)
+        os.makedirs(abs_dir, exist_ok=True)
+
+        filenames = []
+        for number in numbers:
+            filename = "{}-{}.md".format(rng.choice(WORDS), number)
+            filenames.append(filename)
+            with open(os.path.join(abs_dir, filename), "w", encoding="utf-8") as f:
+                f.write(_page_source(rng, number))
+
+        meta = _meta(rng, corpus, filenames)
+        if meta is not None:
+            with open(os.path.join(abs_dir, ".pages"), "w", encoding="utf-8") as f:
+                yaml.safe_dump(meta, f)
+
+
+def _page_source(rng: random.Random, number: int) -> str:
+    title = "{} {}".format(rng.choice(WORDS).capitalize(), number)
+    body = " ".join(rng.choice(WORDS) for _ in range(50))
+    if rng.random() < 0.3:
+        return "---\ntitle: {}\n---\n\n{}\n".format(title, body)
+    return "# {}\n\n{}\n".format(title, body)
+
+
+def _meta(rng: random.Random, corpus: Corpus, filenames: List[str]) -> Optional[dict]:
+    if rng.random() >= corpus.pages_density:
+        return None
+
+    nav = [rng.choice(filenames)]
+    for index in range(corpus.rest_patterns):
+        if index % 2 == 0:
+            nav.append("... | glob={}-*".format(rng.choice(WORDS)))
+        else:
+            nav.append("... | regex=-{}\\.md$".format(rng.randrange(10)))
+    nav.append("...")
+    return {"title": rng.choice(WORDS).capitalize(), "nav": nav}
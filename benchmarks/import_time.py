@@ -0,0 +1,120 @@
+"""Measures how long importing the plugin takes on top of the MkDocs modules that are loaded anyway
+
+Usage: python -m benchmarks.import_time [--repeat 10] [--output import-time.json] [--max-ms 50]
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from typing import List, NamedTuple, Optional
+
+from mkdocs import __version__ as mkdocs_version
+
+from mkdocs_awesome_pages_plugin.cache import plugin_version
+
+PACKAGE = "mkdocs_awesome_pages_plugin"
+
+# Modules MkDocs has imported before it loads plugins, their cost is not attributable to the plugin
+PRELUDE = [
+    "mkdocs.config",
+    "mkdocs.config.config_options",
+    "mkdocs.config.defaults",
+    "mkdocs.plugins",
+    "mkdocs.structure.files",
+    "mkdocs.structure.nav",
+    "mkdocs.structure.pages",
+    "mkdocs.utils.meta",
+]
+
+# Dependencies that are only needed by some sites and have to be imported when they are first used
+DEFERRED = ["natsort", "wcmatch"]
+
+
+class ImportTime(NamedTuple):
+    name: str
+    depth: int
+    self_us: int
+    cumulative_us: int
+
+
+def import_times(modules: List[str]) -> List[ImportTime]:
+    """Imports the modules in a fresh interpreter and parses the output of "python -X importtime" """
+    code = "; ".join("import {}".format(module) for module in modules)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], stderr=subprocess.PIPE, universal_newlines=True, check=True
+    )
+
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        times.append(ImportTime(name.strip(), depth, int(self_us), int(cumulative_us)))
+    return times
+
+
+def measure() -> dict:
+    prelude = {time.name for time in import_times(PRELUDE)}
+    times = import_times(PRELUDE + [PACKAGE + ".plugin"])
+
+    own = [time for time in times if time.depth == 0 and time.name.split(".")[0] == PACKAGE]
+    dependencies = [
+        time for time in times if time.name not in prelude and time.name.split(".")[0] != PACKAGE and time.depth > 0
+    ]
+    return {
+        "total_ms": sum(time.cumulative_us for time in own) / 1000,
+        "dependencies": {time.name: time.self_us / 1000 for time in dependencies},
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10, help="number of dependencies to list")
+    parser.add_argument("--output", help="machine-readable results (JSON)")
+    parser.add_argument("--max-ms", type=float, help="fail if the median import time is above this threshold")
+    args = parser.parse_args(argv)
+
+    runs = [measure() for _ in range(args.repeat)]
+    totals = [run["total_ms"] for run in runs]
+    median = statistics.median(totals)
+    print("Plugin import: {:.1f}ms median, {:.1f}ms min ({} runs)".format(median, min(totals), args.repeat))
+
+    dependencies = sorted(runs[-1]["dependencies"].items(), key=lambda item: item[1], reverse=True)
+    for name, milliseconds in dependencies[: args.top]:
+        print("  {:.1f}ms {}".format(milliseconds, name))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "plugin": plugin_version(),
+                    "mkdocs": mkdocs_version,
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "runs": totals,
+                    "median_ms": median,
+                    "dependencies": dict(dependencies),
+                },
+                f,
+                indent=2,
+            )
+        print("Results written to {}".format(args.output))
+
+    failed = False
+    imported = sorted({name.split(".")[0] for name, _ in dependencies} & set(DEFERRED))
+    if imported:
+        print("Imported on load, but should be deferred until first use: {}".format(", ".join(imported)))
+        failed = True
+    if args.max_ms is not None and median > args.max_ms:
+        print("Median import time is above {:.1f}ms".format(args.max_ms))
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
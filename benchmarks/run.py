@@ -0,0 +1,183 @@
+"""Times the phases of the plugin on synthetic docs trees
+
+Usage: python -m benchmarks.run [--pages 1000 10000] [--output results.json] [--compare previous.json]
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+from unittest import mock
+
+import yaml
+from mkdocs import __version__ as mkdocs_version
+from mkdocs.config import load_config
+from mkdocs.structure.files import get_files
+from mkdocs.structure.nav import get_navigation
+
+from mkdocs_awesome_pages_plugin import git_dates, manifest, navigation
+from mkdocs_awesome_pages_plugin import plugin as awesome_pages_plugin
+from mkdocs_awesome_pages_plugin.cache import plugin_version
+from mkdocs_awesome_pages_plugin.navigation import AwesomeNavigation, NavigationMeta
+from mkdocs_awesome_pages_plugin.options import Options
+from mkdocs_awesome_pages_plugin.process_cache import process_cache
+
+from .corpus import Corpus, generate
+
+SETTINGS = {
+    "default": {},
+    "natural": {"sort_type": "natural"},
+    "desc_ignore_case": {"order": "desc", "ignore_case": True},
+    "title": {"order_by": "title"},
+}
+
+PHASES = ["on_files", "gather_metadata", "process", "to_mkdocs"]
+
+
+def load_mkdocs_config(project_dir: str, settings: dict):
+    config_file = os.path.join(project_dir, "mkdocs.yml")
+    with open(config_file, "w") as f:
+        yaml.safe_dump({"site_name": "Benchmark", "plugins": [{"awesome-pages": settings}]}, f)
+    return load_config(config_file=config_file)
+
+
+def reset_process_state():
+    """Drops everything the plugin keeps between builds of the same process, so every repetition is a cold build"""
+    process_cache.clear()
+    git_dates._loaded.clear()
+    manifest._loaded.clear()
+    awesome_pages_plugin._section_memos.clear()
+
+
+def measure(config, repeat: int) -> Dict[str, List[float]]:
+    plugin = config["plugins"]["awesome-pages"]
+    config = plugin.on_config(config)
+    timings = {phase: [] for phase in PHASES}
+
+    def timed(phase: str, function: Callable):
+        start = time.perf_counter()
+        result = function()
+        timings[phase].append(time.perf_counter() - start)
+        return result
+
+    for _ in range(repeat):
+        # Pages are modified by the plugin, so every repetition starts from freshly collected files
+        reset_process_state()
+        files = get_files(config)
+        files = timed("on_files", lambda: plugin.on_files(files, config))
+        items = get_navigation(files, config).items
+        options = Options(**plugin.config)
+
+        # Same meta loader and manifest as in on_nav, so the meta files parsed by on_files aren't parsed again
+        meta = timed(
+            "gather_metadata",
+            lambda: NavigationMeta(items, options, files, set(), plugin.meta_batch, plugin.manifest),
+        )
+        with mock.patch.object(navigation, "NavigationMeta", return_value=meta):
+            awesome_nav = timed(
+                "process",
+                lambda: AwesomeNavigation(
+                    items,
+                    options,
+                    files,
+                    set(),
+                    plugin.meta_batch,
+                    docs_dir=config["docs_dir"],
+                    manifest=plugin.manifest,
+                ),
+            )
+        timed("to_mkdocs", awesome_nav.to_mkdocs)
+
+    return timings
+
+
+def summarize(timings: Dict[str, List[float]]) -> Dict[str, dict]:
+    return {
+        phase: {"min": min(values), "median": statistics.median(values), "runs": values}
+        for phase, values in timings.items()
+    }
+
+
+def compare(results: List[dict], previous_path: str):
+    with open(previous_path) as f:
+        previous = {(result["corpus"]["name"], result["settings"]): result for result in json.load(f)["results"]}
+
+    print("\nCompared to {}:".format(previous_path))
+    for result in results:
+        before = previous.get((result["corpus"]["name"], result["settings"]))
+        if before is None:
+            continue
+        ratios = [
+            "{} {:.2f}x".format(phase, result["phases"][phase]["min"] / before["phases"][phase]["min"])
+            for phase in PHASES
+            if before["phases"].get(phase, {}).get("min")
+        ]
+        print("  {} [{}]: {}".format(result["corpus"]["name"], result["settings"], ", ".join(ratios)))
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--depth", type=int, nargs="+", default=[3])
+    parser.add_argument("--files-per-dir", type=int, nargs="+", default=[20])
+    parser.add_argument("--pages-density", type=float, nargs="+", default=[0.5])
+    parser.add_argument("--rest-patterns", type=int, nargs="+", default=[2])
+    parser.add_argument("--settings", nargs="+", choices=sorted(SETTINGS), default=list(SETTINGS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmark-results.json", help="machine-readable results (JSON)")
+    parser.add_argument("--compare", metavar="PATH", help="results of a previous run to compare against")
+    args = parser.parse_args(argv)
+
+    logging.getLogger("mkdocs").setLevel(logging.ERROR)
+    results = []
+
+    corpora = [
+        Corpus(*values, seed=args.seed)
+        for values in itertools.product(
+            args.pages, args.depth, args.files_per_dir, args.pages_density, args.rest_patterns
+        )
+    ]
+    for corpus in corpora:
+        with tempfile.TemporaryDirectory() as project_dir:
+            generate(corpus, os.path.join(project_dir, "docs"))
+            for name in args.settings:
+                timings = summarize(measure(load_mkdocs_config(project_dir, SETTINGS[name]), args.repeat))
+                results.append(
+                    {"corpus": dict(corpus._asdict(), name=corpus.name), "settings": name, "phases": timings}
+                )
+                print(
+                    "{} [{}]: {}".format(
+                        corpus.name,
+                        name,
+                        ", ".join("{} {:.3f}s".format(phase, timings[phase]["min"]) for phase in PHASES),
+                    )
+                )
+
+    with open(args.output, "w") as f:
+        json.dump(
+            {
+                "plugin": plugin_version(),
+                "mkdocs": mkdocs_version,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "results": results,
+            },
+            f,
+            indent=2,
+        )
+    print("Results written to {}".format(args.output))
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
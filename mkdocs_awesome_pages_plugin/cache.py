@@ -0,0 +1,124 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, NamedTuple, Optional
+
+from mkdocs.structure.files import File
+
+from .meta import DuplicateRestItemError, Meta
+from .utils import atomic_write
+
+
+def plugin_version() -> Optional[str]:
+    try:
+        return version("mkdocs-awesome-pages-plugin")
+    except PackageNotFoundError:
+        return None
+
+
+def write_entries(path: str, format: int, entries: dict):
+    """Stores entries as JSON together with the format and the plugin version they were written with"""
+    data = {"format": format, "version": plugin_version(), "entries": entries}
+    atomic_write(path, json.dumps(data, separators=(",", ":")).encode("utf-8"))
+
+
+def read_entries(path: str, format: int) -> dict:
+    """Loads the entries stored by write_entries, empty if the file is missing, corrupt or of another version"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or not isinstance(data.get("entries"), dict):
+        return {}
+    if data.get("format") != format or data.get("version") != plugin_version():
+        return {}
+    return data["entries"]
+
+
+def meta_from_attributes(attributes: Any, rel_path: str) -> Optional[Meta]:
+    """Rebuilds stored meta, the attributes are validated again since the file may come from another machine"""
+    try:
+        meta = Meta.from_contents(attributes, rel_path)
+    except (AttributeError, TypeError, ValueError, DuplicateRestItemError):
+        return None
+    meta.path = rel_path  # Use the relative path
+    return meta
+
+
+class CacheEntry(NamedTuple):
+    size: int
+    mtime_ns: int
+    digest: str
+    attributes: dict
+    meta: Meta
+
+
+class MetaCache:
+    """Persistent store of parsed meta files, keyed by their relative path, size, mtime and content hash
+
+    The attributes of the meta files are stored as plain JSON, the Meta objects are rebuilt when the cache is read.
+    """
+
+    FILENAME = "meta.json"
+    FORMAT = 3
+    DEFAULT_MAX_ENTRIES = 10000
+
+    def __init__(self, cache_dir: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[str, CacheEntry]" = self._read()
+        self.modified = False
+
+    def load(self, file: File) -> Meta:
+        stat = os.stat(file.abs_src_path)
+        entry = self.entries.get(file.src_path)
+
+        if entry is not None and entry.size == stat.st_size and entry.mtime_ns == stat.st_mtime_ns:
+            self.entries.move_to_end(file.src_path)
+            return entry.meta
+
+        with open(file.abs_src_path, "rb") as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+
+        if entry is not None and entry.digest == digest:
+            meta, attributes = entry.meta, entry.attributes  # only the timestamp changed, e.g. after a fresh checkout
+        else:
+            meta, attributes = Meta.parse_contents(data.decode("utf-8"), file.abs_src_path)
+            meta.path = file.src_path  # Use the relative path
+
+        self.entries[file.src_path] = CacheEntry(stat.st_size, stat.st_mtime_ns, digest, attributes, meta)
+        self.entries.move_to_end(file.src_path)
+        self.modified = True
+        return meta
+
+    def save(self):
+        if not self.modified:
+            return
+
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+        entries = {
+            src_path: [entry.size, entry.mtime_ns, entry.digest, entry.attributes]
+            for src_path, entry in self.entries.items()
+        }
+        write_entries(os.path.join(self.cache_dir, MetaCache.FILENAME), MetaCache.FORMAT, entries)
+        self.modified = False
+
+    def _read(self) -> "OrderedDict[str, CacheEntry]":
+        entries = OrderedDict()
+        # JSON objects keep their order, so the least recently used entries are still first
+        for src_path, value in read_entries(os.path.join(self.cache_dir, MetaCache.FILENAME), MetaCache.FORMAT).items():
+            try:
+                size, mtime_ns, digest, attributes = value
+            except (TypeError, ValueError):
+                continue
+            meta = meta_from_attributes(attributes, src_path)
+            if meta is not None:
+                entries[src_path] = CacheEntry(size, mtime_ns, digest, attributes, meta)
+        return entries
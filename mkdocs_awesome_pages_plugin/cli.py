@@ -0,0 +1,118 @@
+"""Command line tools that work on the .pages files of a site without building it
+
+Usage: awesome-pages compile [-f mkdocs.yml] [-d docs] [--filename .pages] -o compiled-meta.json
+       awesome-pages validate [-f mkdocs.yml] [-d docs] [--filename .pages] [--no-strict] [-j 8]
+"""
+
+import argparse
+import os
+import sys
+from typing import List, NamedTuple, Optional, Union
+
+from .compiled import CompiledMeta
+from .validate import validate_all
+
+DEFAULT_CONFIG_FILE = "mkdocs.yml"
+DEFAULT_DOCS_DIR = "docs"
+DEFAULT_FILENAME = ".pages"
+
+
+class SiteSettings(NamedTuple):
+    docs_dir: str
+    filename: Union[str, List[str]]
+    strict: bool
+
+
+def site_settings(args: argparse.Namespace) -> SiteSettings:
+    """Returns the settings of the site, read from mkdocs.yml unless they are given on the command line"""
+    docs_dir = args.docs_dir
+    filename = args.filename
+    strict = getattr(args, "strict", None)
+    # strict only exists for the commands that use it
+    missing = docs_dir is None or filename is None or (hasattr(args, "strict") and strict is None)
+    if args.config_file is not None or missing:
+        config_file = args.config_file or DEFAULT_CONFIG_FILE
+        if args.config_file is None and not os.path.isfile(config_file):
+            return SiteSettings(docs_dir or DEFAULT_DOCS_DIR, filename or DEFAULT_FILENAME, strict is not False)
+
+        from mkdocs.config import load_config
+
+        config = load_config(config_file)
+        plugin = config["plugins"].get("awesome-pages")
+        docs_dir = docs_dir or config["docs_dir"]
+        if plugin is not None:
+            filename = filename or plugin.config["filename"]
+            strict = plugin.config["strict"] if strict is None else strict
+    return SiteSettings(docs_dir, filename or DEFAULT_FILENAME, strict is not False)
+
+
+def compile_command(args: argparse.Namespace) -> int:
+    docs_dir, filename, _ = site_settings(args)
+    compiled, errors = CompiledMeta.compile(docs_dir, filename)
+    for error in errors:
+        print("Error: {}".format(error), file=sys.stderr)
+    if errors:
+        print("Not written, {} of the {} files are invalid".format(len(errors), len(compiled.entries) + len(errors)))
+        return 1
+
+    compiled.write(args.output)
+    print("Compiled {} meta files to {}".format(len(compiled.entries), args.output))
+    return 0
+
+
+def validate_command(args: argparse.Namespace) -> int:
+    docs_dir, filename, strict = site_settings(args)
+    results = validate_all(docs_dir, filename, strict, args.jobs)
+    errors = [error for result in results for error in result.errors]
+    warnings = [warning for result in results for warning in result.warnings]
+    for error in errors:
+        print("Error: {}".format(error), file=sys.stderr)
+    for warning in warnings:
+        print("Warning: {}".format(warning), file=sys.stderr)
+
+    print("Checked {} meta files: {} errors, {} warnings".format(len(results), len(errors), len(warnings)))
+    return 1 if errors else 0
+
+
+def add_site_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("-f", "--config-file", help="mkdocs.yml to read docs_dir and the plugin's filename from")
+    parser.add_argument("-d", "--docs-dir", help="docs directory, overrides the one in mkdocs.yml")
+    parser.add_argument(
+        "--filename",
+        action="append",
+        help="name of the meta files, overrides the plugin's filename option (repeat for several candidates)",
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="awesome-pages", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compile_parser = commands.add_parser(
+        "compile", help="validate all meta files and store them for the compiled_meta option of the plugin"
+    )
+    add_site_arguments(compile_parser)
+    compile_parser.add_argument("-o", "--output", required=True, help="path of the compiled meta file")
+    compile_parser.set_defaults(run=compile_command)
+
+    validate_parser = commands.add_parser(
+        "validate", help="check all meta files and their nav entries without building the site"
+    )
+    add_site_arguments(validate_parser)
+    validate_parser.add_argument(
+        "--strict", action="store_const", const=True, help="report missing nav entries as errors (default)"
+    )
+    validate_parser.add_argument(
+        "--no-strict", dest="strict", action="store_const", const=False, help="report missing nav entries as warnings"
+    )
+    validate_parser.add_argument(
+        "-j", "--jobs", type=int, help="number of worker processes, defaults to the number of CPUs"
+    )
+    validate_parser.set_defaults(run=validate_command)
+
+    args = parser.parse_args(argv)
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
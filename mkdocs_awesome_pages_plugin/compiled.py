@@ -0,0 +1,86 @@
+import hashlib
+import os
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+from mkdocs.structure.files import File
+
+from .cache import MetaCache, meta_from_attributes, read_entries, write_entries
+from .discovery import walk_meta_files
+from .meta import Meta
+from .timing import count
+
+
+class CompiledEntry(NamedTuple):
+    digest: str
+    attributes: dict
+    meta: Meta
+
+
+class CompiledMeta:
+    """All meta files of a docs directory, validated and parsed ahead of time by "awesome-pages compile"
+
+    Entries are only used while the hash of the file's contents matches, changed or new files are parsed as usual.
+    The file only holds the attributes of each meta file as plain JSON, the Meta objects are rebuilt when it's read.
+    """
+
+    FORMAT = 2
+
+    def __init__(self, entries: Dict[str, CompiledEntry], fallback: Optional[MetaCache] = None):
+        self.entries = entries
+        self.fallback = fallback
+
+    @staticmethod
+    def compile(docs_dir: str, filename: Union[str, List[str]]) -> Tuple["CompiledMeta", List[Exception]]:
+        """Parses all meta files below docs_dir, the errors of invalid files are returned instead of raised"""
+        entries = {}
+        errors = []
+        for rel_path in walk_meta_files(docs_dir, filename):
+            with open(os.path.join(docs_dir, rel_path), "rb") as f:
+                data = f.read()
+            try:
+                meta, attributes = Meta.parse_contents(data.decode("utf-8"), os.path.join(docs_dir, rel_path))
+            except Exception as e:
+                errors.append(e)
+                continue
+            meta.path = rel_path  # Use the relative path
+            entries[rel_path] = CompiledEntry(hashlib.sha256(data).hexdigest(), attributes, meta)
+        return CompiledMeta(entries), errors
+
+    def load(self, file: File) -> Meta:
+        entry = self.entries.get(file.src_path)
+        if entry is not None:
+            with open(file.abs_src_path, "rb") as f:
+                data = f.read()
+            if hashlib.sha256(data).hexdigest() == entry.digest:
+                count("compiled_meta_hits")
+                return entry.meta
+
+        if self.fallback is not None:
+            return self.fallback.load(file)
+        return Meta.load_file(file)
+
+    def save(self):
+        """Stores the files parsed by the fallback cache"""
+        if self.fallback is not None:
+            self.fallback.save()
+
+    def write(self, path: str):
+        entries = {rel_path: [entry.digest, entry.attributes] for rel_path, entry in self.entries.items()}
+        write_entries(path, CompiledMeta.FORMAT, entries)
+
+    @staticmethod
+    def read(path: str, fallback: Optional[MetaCache] = None) -> "CompiledMeta":
+        """Loads compiled meta, a missing file or one written by another plugin version has no entries
+
+        The attributes are validated again while the Meta objects are rebuilt, invalid entries are left out.
+        """
+        entries = {}
+        for rel_path, value in read_entries(path, CompiledMeta.FORMAT).items():
+            try:
+                digest, attributes = value
+            except (TypeError, ValueError):
+                continue
+            meta = meta_from_attributes(attributes, rel_path)
+            if meta is not None:
+                entries[rel_path] = CompiledEntry(digest, attributes, meta)
+        return CompiledMeta(entries, fallback)
@@ -0,0 +1,80 @@
+import os
+from typing import Dict, Iterable, List, Set, Union
+
+from mkdocs.structure.files import File, Files
+
+
+def meta_filenames(filename: Union[str, List[str]]) -> List[str]:
+    """Returns the candidate names of meta files in order of preference"""
+    return [filename] if isinstance(filename, str) else list(filename)
+
+
+def index_meta_files(files: Iterable[File], filename: Union[str, List[str]]) -> Dict[str, File]:
+    """Returns the meta file of every directory by its relative path, the earliest candidate name wins"""
+    priorities = {name: priority for priority, name in enumerate(reversed(meta_filenames(filename)))}
+    index: Dict[str, File] = {}
+    for file in files:
+        priority = priorities.get(os.path.basename(file.src_path))
+        if priority is None:
+            continue
+        directory = os.path.dirname(file.src_path)
+        current = index.get(directory)
+        if current is None or priorities[os.path.basename(current.src_path)] < priority:
+            index[directory] = file
+    return index
+
+
+def walk_meta_files(docs_dir: str, filename: Union[str, List[str]]) -> List[str]:
+    """Returns the relative paths of the meta files of all directories below docs_dir, without a Files collection"""
+    candidates = meta_filenames(filename)
+    result = []
+    for directory, dirnames, filenames in os.walk(docs_dir):
+        dirnames[:] = sorted(name for name in dirnames if not name.startswith("."))
+        # Only the first candidate that exists in a directory is used
+        name = next((name for name in candidates if name in filenames), None)
+        if name is not None:
+            result.append(os.path.relpath(os.path.join(directory, name), docs_dir))
+    return result
+
+
+def find_meta_files(files: Files, docs_dir: str, filename: Union[str, List[str]]) -> List[str]:
+    """Returns the relative paths of all meta files in docs_dir that are not part of files yet"""
+    filenames = meta_filenames(filename)
+    known_paths = set()
+    directories = set()
+
+    for file in files:
+        known_paths.add(file.src_path)
+        if _can_appear_in_nav(file):
+            _add_with_parents(directories, os.path.dirname(file.src_path))
+
+    result = []
+    for directory in sorted(directories):
+        if _is_hidden(directory):
+            continue
+        for name in filenames:
+            path = os.path.join(directory, name)
+            if path not in known_paths and os.path.isfile(os.path.join(docs_dir, path)):
+                result.append(path)
+    return result
+
+
+def _can_appear_in_nav(file: File) -> bool:
+    # Only directories containing pages end up as sections, everything else can't have a meta file that matters
+    if not file.is_documentation_page():
+        return False
+
+    # MkDocs >= 1.5 marks files matched by "exclude_docs" / "not_in_nav"
+    inclusion = getattr(file, "inclusion", None)
+    return inclusion is None or inclusion.is_in_nav()
+
+
+def _add_with_parents(directories: Set[str], directory: str):
+    while directory not in directories:
+        directories.add(directory)
+        directory = os.path.dirname(directory)
+
+
+def _is_hidden(directory: str) -> bool:
+    # Consistent with glob, which never descends into dot-directories
+    return any(part.startswith(".") for part in directory.split(os.sep))
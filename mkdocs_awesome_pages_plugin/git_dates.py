@@ -0,0 +1,121 @@
+import os
+import subprocess
+from typing import IO, Dict, Optional
+
+from .timing import count, timed
+
+
+class GitDates:
+    """Commit timestamps of all files below a directory, read with a single "git log" run
+
+    Paths are relative to the directory and use "/" as separator. Directories get the newest last commit and the
+    oldest first commit of the files below them.
+    """
+
+    COMMIT_MARKER = b"\x1e"
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self, head: str):
+        self.head = head
+        self.last: Dict[str, int] = {}
+        self.first: Dict[str, int] = {}
+
+    def last_commit(self, path: Optional[str]) -> Optional[int]:
+        if path is not None:
+            return self.last.get(path.replace(os.sep, "/"))
+
+    def first_commit(self, path: Optional[str]) -> Optional[int]:
+        if path is not None:
+            return self.first.get(path.replace(os.sep, "/"))
+
+    @staticmethod
+    def load(directory: str) -> Optional["GitDates"]:
+        """Returns the dates of the checked out commit, None if the directory is not in a git checkout"""
+        head = revision(directory)
+        if head is None:
+            return None
+
+        key = os.path.abspath(directory)
+        dates = _loaded.get(key)
+        if dates is None or dates.head != head:
+            dates = GitDates.read(directory, head)
+            if dates is None:
+                return None
+            _loaded[key] = dates
+        return dates
+
+    @staticmethod
+    @timed("git_log")
+    def read(directory: str, head: str) -> Optional["GitDates"]:
+        count("git_log_runs")
+        # -z keeps paths unquoted and --no-renames skips the expensive rename detection
+        command = ["git", "log", "--relative", "--no-renames", "--name-only", "-z", "--format=%x1e%ct", head, "--", "."]
+        try:
+            process = subprocess.Popen(command, cwd=directory, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        except OSError:
+            return None  # git is not installed
+
+        dates = GitDates(head)
+        with process:
+            dates.parse(process.stdout)
+        if process.returncode != 0:
+            return None
+
+        dates.add_directories()
+        return dates
+
+    def parse(self, stream: IO[bytes]):
+        """Reads the output of "git log" chunk by chunk, so the whole history never has to be held in memory"""
+        timestamp = None
+        pending = b""
+        for chunk in iter(lambda: stream.read(GitDates.CHUNK_SIZE), b""):
+            tokens = (pending + chunk).split(b"\0")
+            pending = tokens.pop()
+            for token in tokens:
+                if token.startswith(GitDates.COMMIT_MARKER):
+                    timestamp = int(token[len(GitDates.COMMIT_MARKER) :])
+                elif token and timestamp is not None:
+                    # The first path of a commit follows the newline ending the commit header
+                    path = token[1:] if token.startswith(b"\n") else token
+                    self.add(path.decode("utf-8", "surrogateescape"), timestamp)
+
+    def add(self, path: str, timestamp: int):
+        # Commits are listed newest first, but commit dates are not guaranteed to be monotonic
+        if timestamp > self.last.get(path, timestamp - 1):
+            self.last[path] = timestamp
+        if timestamp < self.first.get(path, timestamp + 1):
+            self.first[path] = timestamp
+
+    def add_directories(self):
+        last: Dict[str, int] = {}
+        first: Dict[str, int] = {}
+        for path in self.last:
+            directory = path
+            while directory:
+                directory = directory.rpartition("/")[0]
+                if self.last[path] > last.get(directory, self.last[path] - 1):
+                    last[directory] = self.last[path]
+                if self.first[path] < first.get(directory, self.first[path] + 1):
+                    first[directory] = self.first[path]
+        self.last.update(last)
+        self.first.update(first)
+
+
+def revision(directory: str) -> Optional[str]:
+    """Returns the commit checked out in the git repository containing the directory, None if there is none"""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--verify", "HEAD"],
+            cwd=directory,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.decode("ascii").strip()
+
+
+# Dates per directory of the latest build, so "mkdocs serve" only runs "git log" again after a new commit
+_loaded: Dict[str, GitDates] = {}
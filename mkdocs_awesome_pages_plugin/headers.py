@@ -0,0 +1,69 @@
+import io
+import re
+from typing import IO, List
+
+from mkdocs.utils.meta import META_MORE_RE, META_RE
+
+# Line based equivalents of the delimiters in mkdocs.utils.meta.YAML_RE
+_YAML_START_RE = re.compile(r"-{3}[ \t]*\n")
+_YAML_END_RE = re.compile(r"(?:\.{3}|-{3})[ \t]*\n")
+
+
+def read_header(path: str) -> str:
+    """Reads the beginning of a page, up to and including the first content line after its meta-data
+
+    Passing the result to mkdocs.utils.meta.get_data and mkdocs.utils.get_markdown_title yields the same meta-data
+    and title as passing the whole page source, but only the header has to be read from disk.
+    """
+    with open(path, encoding="utf-8-sig", errors="strict") as file:
+        return _read_header(file)
+
+
+def get_header(source: str) -> str:
+    """Same as read_header, for a page source that has already been read"""
+    return _read_header(io.StringIO(source))
+
+
+def _read_header(file: IO[str]) -> str:
+    lines = [file.readline()]
+    if _YAML_START_RE.match(lines[0]):
+        complete = _read_yaml_meta(file, lines)
+    elif lines[0].strip() != "":
+        complete = _read_multimarkdown_meta(file, lines)
+    else:
+        complete = False
+
+    if not complete:
+        _read_first_content_line(file, lines)
+
+    return "".join(lines)
+
+
+def _read_yaml_meta(file: IO[str], lines: List[str]) -> bool:
+    # The line after the opening delimiter always belongs to the YAML block, even if it looks like a delimiter
+    lines.append(file.readline())
+    for line in file:
+        lines.append(line)
+        if _YAML_END_RE.match(line):
+            return False
+    return True
+
+
+def _read_multimarkdown_meta(file: IO[str], lines: List[str]) -> bool:
+    if META_RE.match(lines[0]) is None:
+        return True  # no meta-data, the first line is the content line
+
+    for line in file:
+        lines.append(line)
+        if line.strip() == "":
+            return False
+        if META_RE.match(line) is None and META_MORE_RE.match(line) is None:
+            return True
+    return True
+
+
+def _read_first_content_line(file: IO[str], lines: List[str]):
+    for line in file:
+        lines.append(line)
+        if line.strip() != "":
+            return
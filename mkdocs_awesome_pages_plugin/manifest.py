@@ -0,0 +1,83 @@
+import os
+from pathlib import PurePath
+from typing import Dict, Optional, Tuple
+
+from .meta import Meta, load_contents
+from .timing import count
+from .utils import join_paths
+
+
+class Manifest:
+    """Meta of many directories in a single YAML or JSON file, keyed by the directory path relative to docs_dir
+
+    An entry replaces the meta file of its directory, which is then never read. The root directory is "" or ".".
+    """
+
+    def __init__(self, path: str, entries: Dict[str, Meta]):
+        self.path = path
+        self.entries = entries
+
+    def get(self, rel_dir: Optional[str]) -> Optional[Meta]:
+        if rel_dir is None or not self.entries:
+            return None
+        return self.entries.get(Manifest._normalize(rel_dir))
+
+    def __contains__(self, rel_dir: Optional[str]) -> bool:
+        return self.get(rel_dir) is not None
+
+    def __len__(self):
+        return len(self.entries)
+
+    def fingerprint(self) -> tuple:
+        return tuple((rel_dir, meta.fingerprint()) for rel_dir, meta in sorted(self.entries.items()))
+
+    @staticmethod
+    def load(path: str, filename: str) -> "Manifest":
+        """Loads the manifest, reusing the result of a previous build while the file is unchanged"""
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        key = (os.path.abspath(path), filename)
+
+        loaded = _loaded.get(key)
+        if loaded is not None and loaded[0] == stamp:
+            return loaded[1]
+
+        manifest = Manifest.load_from(path, filename)
+        _loaded[key] = (stamp, manifest)
+        return manifest
+
+    @staticmethod
+    def load_from(path: str, filename: str) -> "Manifest":
+        count("manifest_files_loaded")
+        with open(path, encoding="utf-8") as file:
+            contents = load_contents(file, path)
+        return Manifest.parse(contents or {}, path, filename)
+
+    @staticmethod
+    def parse(contents: dict, path: str, filename: str) -> "Manifest":
+        if not isinstance(contents, dict) or not all(
+            isinstance(rel_dir, str) and isinstance(entry, dict) for rel_dir, entry in contents.items()
+        ):
+            raise TypeError(
+                "Expected the manifest to map directory paths to meta attributes - got {type} [{context}]".format(
+                    type=type(contents), context=path
+                )
+            )
+
+        entries = {}
+        for rel_dir, entry in contents.items():
+            normalized = Manifest._normalize(rel_dir)
+            meta = Meta.from_contents(entry, "{path}: {rel_dir}".format(path=path, rel_dir=rel_dir or "."))
+            # Entries stand in for the meta file of their directory
+            meta.path = join_paths(str(PurePath(normalized)) if normalized else "", filename)
+            entries[normalized] = meta
+        return Manifest(path, entries)
+
+    @staticmethod
+    def _normalize(rel_dir: str) -> str:
+        normalized = PurePath(rel_dir.strip("/")).as_posix()
+        return "" if normalized == "." else normalized
+
+
+# Manifests of the latest build, so "mkdocs serve" only parses them again after they changed
+_loaded: Dict[Tuple[str, str], Tuple[Tuple[int, int], Manifest]] = {}
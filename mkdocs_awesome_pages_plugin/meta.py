@@ -1,12 +1,53 @@
 import collections.abc
+import json
+import os
 import re
 from enum import Enum
 from pathlib import PurePath
-from typing import Any, Iterator, List, Optional, Union
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
 
 import yaml
-from mkdocs.structure.files import Files
-from wcmatch import glob
+from mkdocs.structure.files import File
+
+from .process_cache import ProcessCache, process_cache
+from .timing import count
+
+if TYPE_CHECKING:
+    from .cache import MetaCache
+    from .compiled import CompiledMeta
+
+# libyaml's loader is a lot faster, but only available if PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_contents(stream: Union[str, IO[str]], path: str) -> Any:
+    """Parses JSON if the path ends in .json or the contents are a JSON object, YAML otherwise
+
+    JSON is a subset of YAML, but the json module parses it a lot faster. YAML flow mappings like {title: Title} are
+    not valid JSON and still parsed as YAML.
+    """
+    if not isinstance(stream, str):
+        stream = stream.read()
+    if path.endswith(".json"):
+        return json.loads(stream)
+    if stream.lstrip().startswith("{"):
+        try:
+            return json.loads(stream)
+        except ValueError:
+            pass
+    return yaml.load(stream, Loader=_YamlLoader)
 
 
 class DuplicateRestItemError(Exception):
@@ -25,6 +66,11 @@ class MetaNavItem:
     def __hash__(self):
         return hash((self.value, self.title))
 
+    def fingerprint(self) -> tuple:
+        if isinstance(self.value, list):
+            return tuple(item.fingerprint() for item in self.value), self.title
+        return self.value, self.title
+
     @staticmethod
     def from_yaml(item: Union[str, dict], context: str):
         if MetaNavRestItem.is_rest(item):
@@ -69,6 +115,8 @@ class MetaNavRestItem(MetaNavItem):
 
     def matches(self, path: Optional[str]) -> bool:
         if self.type == RestType.GLOB:
+            from wcmatch import glob  # deferred, most sites don't use glob patterns
+
             return path is not None and glob.globmatch(path, self.pattern, flags=glob.GLOBSTAR)
         elif self.type == RestType.REGEX:
             return path is not None and re.search(self.pattern, PurePath(path).as_posix()) is not None
@@ -84,12 +132,20 @@ class RestItemList(collections.abc.Iterable):
     def __init__(self):
         self.patterns = []
         self.all = None
+        self._matcher = None
 
     def append(self, item: MetaNavRestItem):
         if item.type == RestType.ALL:
             self.all = item
         else:
             self.patterns.append(item)
+        self._matcher = None
+
+    @property
+    def matcher(self) -> "RestMatcher":
+        if self._matcher is None:
+            self._matcher = RestMatcher(self)
+        return self._matcher
 
     def __iter__(self) -> Iterator[MetaNavRestItem]:
         yield from self.patterns
@@ -100,6 +156,86 @@ class RestItemList(collections.abc.Iterable):
         return len(self.patterns) + (1 if self.all is not None else 0)
 
 
+class RestMatcher:
+    """Finds the first rest item matching a path, like iterating a RestItemList and calling matches on each item
+
+    Consecutive patterns are translated to regular expressions and combined into a single alternation, so a path is
+    classified with one scan. Patterns that can't be combined without changing their meaning are matched on their own.
+    """
+
+    _GLOBAL_FLAGS_REGEX = re.compile(r"\(\?[aiLmsux]+\)")
+
+    def __init__(self, items: RestItemList):
+        self.all = items.all
+        self.segments: List[Union[MetaNavRestItem, Tuple[Pattern, Dict[str, MetaNavRestItem]]]] = []
+
+        pending = []
+        for item in items.patterns:
+            alternative = self._alternative(item)
+            if alternative is None:
+                self._add_combined(pending)
+                pending = []
+                self.segments.append(item)
+            else:
+                pending.append((item, alternative))
+        self._add_combined(pending)
+
+    def match(self, path: Optional[str]) -> Optional[MetaNavRestItem]:
+        if path is not None:
+            # Combined segments only contain globs where the separator is "/", so they all match the POSIX path
+            posix_path = PurePath(path).as_posix()
+            for segment in self.segments:
+                if isinstance(segment, MetaNavRestItem):
+                    if segment.matches(path):
+                        return segment
+                else:
+                    regex, groups = segment
+                    match = regex.match(posix_path)
+                    if match is not None:
+                        return groups[match.lastgroup]
+        return self.all
+
+    def _add_combined(self, pending: List[Tuple[MetaNavRestItem, str]]):
+        if not pending:
+            return
+
+        groups = {}
+        alternatives = []
+        for item, alternative in pending:
+            name = "_rest{}".format(len(groups))
+            groups[name] = item
+            alternatives.append("(?P<{name}>{alternative})".format(name=name, alternative=alternative))
+
+        try:
+            self.segments.append((re.compile("|".join(alternatives)), groups))
+        except re.error:
+            self.segments.extend(item for item, _ in pending)
+
+    @staticmethod
+    def _alternative(item: MetaNavRestItem) -> Optional[str]:
+        if item.type == RestType.REGEX:
+            # Inline flags would apply to all alternatives and capturing groups would shift backreferences
+            if RestMatcher._GLOBAL_FLAGS_REGEX.search(item.pattern) is not None:
+                return None
+            try:
+                if re.compile(item.pattern).groups > 0:
+                    return None
+            except re.error:
+                return None
+            # Anchored equivalent of re.search, so the first matching alternative wins regardless of position
+            return "(?s:.*?)(?:{pattern})".format(pattern=item.pattern)
+
+        # Glob patterns are matched against the platform specific path, regexes against the POSIX path
+        if os.sep != "/":
+            return None
+        from wcmatch import glob  # deferred, most sites don't use glob patterns
+
+        include, exclude = glob.translate(item.pattern, flags=glob.GLOBSTAR)
+        if len(include) != 1 or exclude or re.compile(include[0]).groups > 0:
+            return None
+        return include[0]
+
+
 class Meta:
     TITLE_ATTRIBUTE = "title"
     NAV_ATTRIBUTE = "nav"
@@ -112,12 +248,29 @@ class Meta:
     ORDER_ATTRIBUTE = "order"
     SORT_TYPE_ATTRIBUTE = "sort_type"
     ORDER_BY_ATTRIBUTE = "order_by"
+    RULES_ATTRIBUTE = "rules"
+    RULE_MATCH_KEY = "match"
+    # Attributes a rule can set, directories without a meta file get all of them from the matching rules
+    RULE_ATTRIBUTES = (
+        "title",
+        "nav",
+        "collapse",
+        "collapse_single_pages",
+        "hide",
+        "ignore_case",
+        "order",
+        "sort_type",
+        "order_by",
+    )
 
     ORDER_ASC = "asc"
     ORDER_DESC = "desc"
     SORT_NATURAL = "natural"
     ORDER_BY_FILENAME = "filename"
     ORDER_BY_TITLE = "title"
+    ORDER_BY_META_PREFIX = "meta."
+    ORDER_BY_GIT_DATE = "git_date"
+    ORDER_BY_GIT_CREATED_DATE = "git_created_date"
 
     def __init__(
         self,
@@ -132,7 +285,8 @@ class Meta:
         ignore_case: bool = None,
         order: Optional[str] = None,
         sort_type: Optional[str] = None,
-        order_by: Optional[str] = None,
+        order_by: Union[str, Tuple[str, ...], None] = None,
+        rules: Optional[List["MetaRule"]] = None,
     ):
         if nav is None and arrange is not None:
             nav = [MetaNavItem.from_yaml(value, path) for value in arrange]
@@ -149,150 +303,355 @@ class Meta:
         self.order = order
         self.sort_type = sort_type
         self.order_by = order_by
+        self.rules = rules
+
+    def fingerprint(self) -> tuple:
+        """Returns a hashable representation of all attributes, used to detect changes between builds"""
+        return (
+            self.path,
+            self.title,
+            tuple(item.fingerprint() for item in self.nav) if self.nav is not None else None,
+            self.collapse,
+            self.collapse_single_pages,
+            self.hide,
+            self.ignore_case,
+            self.order,
+            self.sort_type,
+            self.order_by,
+            tuple(rule.fingerprint() for rule in self.rules) if self.rules is not None else None,
+        )
+
+    def with_rules(self, rules: List["Meta"]) -> "Meta":
+        """Returns a copy in which every attribute that is not set is taken from the last rule that sets it"""
+        if not rules:
+            return self
+
+        values = {}
+        for attribute in Meta.RULE_ATTRIBUTES:
+            value = getattr(self, attribute)
+            for rule in reversed(rules):
+                if value is not None:
+                    break
+                value = getattr(rule, attribute)
+            values[attribute] = value
+        return Meta(path=self.path, **values)
+
+    @staticmethod
+    def validate_order_by(order_by: Any, context: Optional[str]) -> Union[str, Tuple[str, ...]]:
+        """Checks a single sort key or a list of them, lists are returned as tuples"""
+        keys = [order_by] if isinstance(order_by, str) else order_by
+        if not isinstance(keys, list) or not keys or not all(Meta._is_order_by_key(key) for key in keys):
+            raise TypeError(
+                'Expected "{attribute}" attribute to be one of {those} or a list of them - got "{order_by}" [{context}]'.format(
+                    attribute=Meta.ORDER_BY_ATTRIBUTE,
+                    those=[
+                        Meta.ORDER_BY_FILENAME,
+                        Meta.ORDER_BY_TITLE,
+                        Meta.ORDER_BY_GIT_DATE,
+                        Meta.ORDER_BY_GIT_CREATED_DATE,
+                        Meta.ORDER_BY_META_PREFIX + "<field>",
+                    ],
+                    order_by=order_by,
+                    context=context,
+                )
+            )
+        return order_by if isinstance(order_by, str) else tuple(order_by)
 
     @staticmethod
-    def try_load_from_files(rel_path: Optional[str], files: "Files") -> "Meta":
-        if rel_path is None:
-            return Meta()
+    def _is_order_by_key(key: Any) -> bool:
+        if not isinstance(key, str):
+            return False
+        if key.startswith(Meta.ORDER_BY_META_PREFIX):
+            return len(key) > len(Meta.ORDER_BY_META_PREFIX)
+        return key in (Meta.ORDER_BY_FILENAME, Meta.ORDER_BY_TITLE) or Meta._is_git_key(key)
 
-        file = files.src_paths.get(rel_path)
-        if file is None:
-            return Meta(path=rel_path)
+    @staticmethod
+    def _is_git_key(key: str) -> bool:
+        return key in (Meta.ORDER_BY_GIT_DATE, Meta.ORDER_BY_GIT_CREATED_DATE)
+
+    @staticmethod
+    def order_by_keys(order_by: Union[str, Tuple[str, ...], None]) -> Tuple[str, ...]:
+        if order_by is None:
+            return ()
+        if isinstance(order_by, str):
+            return (order_by,)
+        return tuple(order_by)
 
+    @staticmethod
+    def reads_page_source(order_by: Union[str, Tuple[str, ...], None]) -> bool:
+        """Whether sorting by these keys needs the title or front matter of pages"""
+        return any(
+            key == Meta.ORDER_BY_TITLE or key.startswith(Meta.ORDER_BY_META_PREFIX)
+            for key in Meta.order_by_keys(order_by)
+        )
+
+    @staticmethod
+    def reads_git_dates(order_by: Union[str, Tuple[str, ...], None]) -> bool:
+        """Whether sorting by these keys needs the commit dates of pages and sections"""
+        return any(Meta._is_git_key(key) for key in Meta.order_by_keys(order_by))
+
+    @staticmethod
+    def try_load_file(file: File, loader: Optional[Union["MetaCache", "MetaBatch"]] = None) -> "Meta":
         try:
-            meta = Meta.load_from(file.abs_src_path)
-            meta.path = file.src_path  # Use the relative path
-            return meta
+            if loader is not None:
+                return loader.load(file)
+            return Meta.load_file(file)
         except FileNotFoundError:
             return Meta(path=file.src_path)
 
+    @staticmethod
+    def load_file(file: File) -> "Meta":
+        meta = Meta.load_from(file.abs_src_path)
+        meta.path = file.src_path  # Use the relative path
+        return meta
+
     @staticmethod
     def load_from(path: str) -> "Meta":
         with open(path, encoding="utf-8") as file:
-            contents = yaml.safe_load(file) or {}
-            title = contents.get(Meta.TITLE_ATTRIBUTE)
-            arrange = contents.get(Meta.ARRANGE_ATTRIBUTE)
-            nav = contents.get(Meta.NAV_ATTRIBUTE)
-            collapse = contents.get(Meta.COLLAPSE_ATTRIBUTE)
-            collapse_single_pages = contents.get(Meta.COLLAPSE_SINGLE_PAGES_ATTRIBUTE)
-            hide = contents.get(Meta.HIDE_ATTRIBUTE)
-            ignore_case = contents.get(Meta.IGNORE_CASE_ATTRIBUTE)
-            order = contents.get(Meta.ORDER_ATTRIBUTE)
-            sort_type = contents.get(Meta.SORT_TYPE_ATTRIBUTE)
-            order_by = contents.get(Meta.ORDER_BY_ATTRIBUTE)
-
-            if title is not None:
-                if not isinstance(title, str):
-                    raise TypeError(
-                        'Expected "{attribute}" attribute to be a string - got {type} [{context}]'.format(
-                            attribute=Meta.TITLE_ATTRIBUTE,
-                            type=type(title),
-                            context=path,
-                        )
+            return Meta.parse(file, path)
+
+    @staticmethod
+    def parse(stream: Union[str, IO[str]], path: str) -> "Meta":
+        return Meta.parse_contents(stream, path)[0]
+
+    @staticmethod
+    def parse_contents(stream: Union[str, IO[str]], path: str) -> Tuple["Meta", dict]:
+        """Parses a meta file and also returns its attributes, which can be stored as JSON and passed to from_contents"""
+        count("meta_files_loaded")  # not counted for hits of the process cache, the meta cache or compiled meta
+        contents = load_contents(stream, path) or {}
+        return Meta.from_contents(contents, path), Meta.attributes(contents)
+
+    @staticmethod
+    def attributes(contents: dict) -> dict:
+        """Returns the attributes read by from_contents, anything else in the contents is left out"""
+        keys = Meta.RULE_ATTRIBUTES + (Meta.ARRANGE_ATTRIBUTE,)
+        attributes = {key: contents[key] for key in keys if key in contents}
+        rules = contents.get(Meta.RULES_ATTRIBUTE)
+        if rules is not None:
+            attributes[Meta.RULES_ATTRIBUTE] = [
+                {key: rule[key] for key in (Meta.RULE_MATCH_KEY,) + keys if key in rule} for rule in rules
+            ]
+        return attributes
+
+    @staticmethod
+    def from_contents(contents: dict, path: Optional[str]) -> "Meta":
+        meta = Meta._from_contents(contents, path)
+
+        rules = contents.get(Meta.RULES_ATTRIBUTE)
+        if rules is not None:
+            meta.rules = Meta.parse_rules(rules, path)
+        return meta
+
+    @staticmethod
+    def parse_rules(rules: Any, context: Optional[str]) -> List["MetaRule"]:
+        if not isinstance(rules, list) or not all(
+            isinstance(rule, dict) and isinstance(rule.get(Meta.RULE_MATCH_KEY), str) for rule in rules
+        ):
+            raise TypeError(
+                'Expected "{attribute}" attribute to be a list of mappings with a "{match}" glob pattern - got {rules} [{context}]'.format(
+                    attribute=Meta.RULES_ATTRIBUTE, match=Meta.RULE_MATCH_KEY, rules=rules, context=context
+                )
+            )
+        return [MetaRule(rule[Meta.RULE_MATCH_KEY], Meta._from_contents(rule, context)) for rule in rules]
+
+    @staticmethod
+    def _from_contents(contents: dict, path: Optional[str]) -> "Meta":
+        title = contents.get(Meta.TITLE_ATTRIBUTE)
+        arrange = contents.get(Meta.ARRANGE_ATTRIBUTE)
+        nav = contents.get(Meta.NAV_ATTRIBUTE)
+        collapse = contents.get(Meta.COLLAPSE_ATTRIBUTE)
+        collapse_single_pages = contents.get(Meta.COLLAPSE_SINGLE_PAGES_ATTRIBUTE)
+        hide = contents.get(Meta.HIDE_ATTRIBUTE)
+        ignore_case = contents.get(Meta.IGNORE_CASE_ATTRIBUTE)
+        order = contents.get(Meta.ORDER_ATTRIBUTE)
+        sort_type = contents.get(Meta.SORT_TYPE_ATTRIBUTE)
+        order_by = contents.get(Meta.ORDER_BY_ATTRIBUTE)
+
+        if title is not None:
+            if not isinstance(title, str):
+                raise TypeError(
+                    'Expected "{attribute}" attribute to be a string - got {type} [{context}]'.format(
+                        attribute=Meta.TITLE_ATTRIBUTE,
+                        type=type(title),
+                        context=path,
                     )
-            if arrange is not None:
-                if not isinstance(arrange, list) or not all(isinstance(s, str) for s in arrange):
-                    raise TypeError(
-                        'Expected "{attribute}" attribute to be a list of strings - got {type} [{context}]'.format(
-                            attribute=Meta.ARRANGE_ATTRIBUTE,
-                            type=type(arrange),
-                            context=path,
-                        )
+                )
+        if arrange is not None:
+            if not isinstance(arrange, list) or not all(isinstance(s, str) for s in arrange):
+                raise TypeError(
+                    'Expected "{attribute}" attribute to be a list of strings - got {type} [{context}]'.format(
+                        attribute=Meta.ARRANGE_ATTRIBUTE,
+                        type=type(arrange),
+                        context=path,
                     )
-                if arrange.count(Meta.ARRANGE_REST_TOKEN) > 1:
-                    raise DuplicateRestItemError("...", path)
-
-            if nav is not None:
-                if not isinstance(nav, list):
-                    raise TypeError(
-                        'Expected "{attribute}" attribute to be a list - got {type} [{context}]'.format(
-                            attribute=Meta.NAV_ATTRIBUTE, type=type(nav), context=path
-                        )
+                )
+            if arrange.count(Meta.ARRANGE_REST_TOKEN) > 1:
+                raise DuplicateRestItemError("...", path)
+
+        if nav is not None:
+            if not isinstance(nav, list):
+                raise TypeError(
+                    'Expected "{attribute}" attribute to be a list - got {type} [{context}]'.format(
+                        attribute=Meta.NAV_ATTRIBUTE, type=type(nav), context=path
                     )
-
-                nav = [MetaNavItem.from_yaml(item, path) for item in nav]
-                checked = set()
-                for item in nav:
-                    if isinstance(item, MetaNavRestItem):
-                        if item in checked:
-                            raise DuplicateRestItemError(item.value, path)
-                        checked.add(item)
-
-            if collapse is not None:
-                if not isinstance(collapse, bool):
-                    raise TypeError(
-                        'Expected "{attribute}" attribute to be a boolean - got {type} [{context}]'.format(
-                            attribute=Meta.COLLAPSE_ATTRIBUTE,
-                            type=type(collapse),
-                            context=path,
-                        )
+                )
+
+            nav = [MetaNavItem.from_yaml(item, path) for item in nav]
+            checked = set()
+            for item in nav:
+                if isinstance(item, MetaNavRestItem):
+                    if item in checked:
+                        raise DuplicateRestItemError(item.value, path)
+                    checked.add(item)
+
+        if collapse is not None:
+            if not isinstance(collapse, bool):
+                raise TypeError(
+                    'Expected "{attribute}" attribute to be a boolean - got {type} [{context}]'.format(
+                        attribute=Meta.COLLAPSE_ATTRIBUTE,
+                        type=type(collapse),
+                        context=path,
                     )
-            if collapse_single_pages is not None:
-                if not isinstance(collapse_single_pages, bool):
-                    raise TypeError(
-                        'Expected "{attribute}" attribute to be a boolean - got {type} [{context}]'.format(
-                            attribute=Meta.COLLAPSE_SINGLE_PAGES_ATTRIBUTE,
-                            type=type(collapse_single_pages),
-                            context=path,
-                        )
+                )
+        if collapse_single_pages is not None:
+            if not isinstance(collapse_single_pages, bool):
+                raise TypeError(
+                    'Expected "{attribute}" attribute to be a boolean - got {type} [{context}]'.format(
+                        attribute=Meta.COLLAPSE_SINGLE_PAGES_ATTRIBUTE,
+                        type=type(collapse_single_pages),
+                        context=path,
                     )
-            if hide is not None:
-                if not isinstance(hide, bool):
-                    raise TypeError(
-                        'Expected "{attribute}" attribute to be a boolean - got {type} [{context}]'.format(
-                            attribute=Meta.COLLAPSE_ATTRIBUTE,
-                            type=type(hide),
-                            context=path,
-                        )
+                )
+        if hide is not None:
+            if not isinstance(hide, bool):
+                raise TypeError(
+                    'Expected "{attribute}" attribute to be a boolean - got {type} [{context}]'.format(
+                        attribute=Meta.COLLAPSE_ATTRIBUTE,
+                        type=type(hide),
+                        context=path,
                     )
-            if ignore_case is not None:
-                if not isinstance(ignore_case, bool):
-                    raise TypeError(
-                        'Expected "{attribute}" attribute to be a boolean - got {type} [{context}]'.format(
-                            attribute=Meta.IGNORE_CASE_ATTRIBUTE,
-                            type=type(ignore_case),
-                            context=path,
-                        )
+                )
+        if ignore_case is not None:
+            if not isinstance(ignore_case, bool):
+                raise TypeError(
+                    'Expected "{attribute}" attribute to be a boolean - got {type} [{context}]'.format(
+                        attribute=Meta.IGNORE_CASE_ATTRIBUTE,
+                        type=type(ignore_case),
+                        context=path,
                     )
-            if order is not None:
-                if order != Meta.ORDER_ASC and order != Meta.ORDER_DESC:
-                    raise TypeError(
-                        'Expected "{attribute}" attribute to be either "desc" or "asc" - got "{order}" [{context}]'.format(
-                            attribute=Meta.ORDER_ATTRIBUTE, order=order, context=path
-                        )
+                )
+        if order is not None:
+            if order != Meta.ORDER_ASC and order != Meta.ORDER_DESC:
+                raise TypeError(
+                    'Expected "{attribute}" attribute to be either "desc" or "asc" - got "{order}" [{context}]'.format(
+                        attribute=Meta.ORDER_ATTRIBUTE, order=order, context=path
                     )
-            if sort_type is not None:
-                if sort_type != Meta.SORT_NATURAL:
-                    raise TypeError(
-                        'Expected "{attribute}" to be "natural" - got "{sort_type}" [{context}]'.format(
-                            attribute=Meta.SORT_TYPE_ATTRIBUTE, sort_type=sort_type, context=path
-                        )
+                )
+        if sort_type is not None:
+            if sort_type != Meta.SORT_NATURAL:
+                raise TypeError(
+                    'Expected "{attribute}" to be "natural" - got "{sort_type}" [{context}]'.format(
+                        attribute=Meta.SORT_TYPE_ATTRIBUTE, sort_type=sort_type, context=path
                     )
+                )
 
-            if order_by is not None:
-                if order_by != Meta.ORDER_BY_TITLE and order_by != Meta.ORDER_BY_FILENAME:
-                    raise TypeError(
-                        'Expected "{attribute}" attribute to be one of {those} - got "{order_by}" [{context}]'.format(
-                            attribute=Meta.ORDER_BY_ATTRIBUTE,
-                            those=[
-                                Meta.ORDER_BY_FILENAME,
-                                Meta.ORDER_BY_TITLE,
-                            ],
-                            order_by=order_by,
-                            context=path,
-                        )
-                    )
+        if order_by is not None:
+            order_by = Meta.validate_order_by(order_by, path)
 
-            return Meta(
-                title=title,
-                arrange=arrange,
-                nav=nav,
-                path=path,
-                collapse=collapse,
-                collapse_single_pages=collapse_single_pages,
-                hide=hide,
-                ignore_case=ignore_case,
-                order=order,
-                sort_type=sort_type,
-                order_by=order_by,
-            )
+        return Meta(
+            title=title,
+            arrange=arrange,
+            nav=nav,
+            path=path,
+            collapse=collapse,
+            collapse_single_pages=collapse_single_pages,
+            hide=hide,
+            ignore_case=ignore_case,
+            order=order,
+            sort_type=sort_type,
+            order_by=order_by,
+        )
+
+
+class MetaRule:
+    """Attributes of a rule, applied to all directories whose path relative to docs_dir matches the glob pattern"""
+
+    def __init__(self, pattern: str, meta: Meta):
+        self.pattern = pattern
+        self.meta = meta
+
+    def fingerprint(self) -> tuple:
+        return self.pattern, self.meta.fingerprint()
+
+
+class RuleMatcher:
+    """Glob patterns of rules compiled once and matched against the directories while gathering their meta"""
+
+    def __init__(self, rules: List[MetaRule]):
+        self.rules: List[Tuple[List[Pattern], List[Pattern], Meta]] = []
+        if not rules:
+            return
+
+        from wcmatch import glob  # deferred, most sites don't use rules
+
+        for rule in rules:
+            include, exclude = glob.translate(rule.pattern, flags=glob.GLOBSTAR)
+            self.rules.append(([re.compile(p) for p in include], [re.compile(p) for p in exclude], rule.meta))
+
+    def __len__(self):
+        return len(self.rules)
+
+    def match(self, rel_dir: str) -> List[Meta]:
+        """Returns the attributes of all rules matching the directory, in the order they were defined"""
+        if not self.rules:
+            return []
+        path = PurePath(rel_dir).as_posix()
+        return [
+            meta
+            for include, exclude, meta in self.rules
+            if any(p.match(path) for p in include) and not any(p.match(path) for p in exclude)
+        ]
+
+
+class MetaBatch:
+    """Meta files parsed ahead of time, a file that failed to parse raises once its meta is requested"""
+
+    def __init__(self, cache: Optional[Union["MetaCache", "CompiledMeta"]] = None):
+        self.cache = cache
+        self.results: Dict[str, Union[Meta, Exception]] = {}
+
+    def parse_all(self, files: Iterable[File]):
+        hidden_dirs = set()
+        # Parents first, so meta files below a hidden directory can be skipped
+        for file in sorted(files, key=lambda f: len(PurePath(f.src_path).parts)):
+            rel_dir = os.path.dirname(file.src_path)
+            if MetaBatch._is_below(rel_dir, hidden_dirs):
+                continue
+            try:
+                meta = self.results[file.src_path] = self._load(file)
+            except Exception as e:
+                self.results[file.src_path] = e
+                continue
+            if meta.hide is True:
+                hidden_dirs.add(rel_dir)
+
+    @staticmethod
+    def _is_below(rel_dir: str, dirs: set) -> bool:
+        while dirs and rel_dir:
+            rel_dir = os.path.dirname(rel_dir)
+            if rel_dir in dirs:
+                return True
+        return False
+
+    def load(self, file: File) -> Meta:
+        result = self.results.get(file.src_path)
+        if result is None:
+            return self._load(file)  # not known when the batch was parsed
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def _load(self, file: File) -> Meta:
+        if self.cache is not None:
+            return process_cache.get_or_load(ProcessCache.META, file, lambda: self.cache.load(file))
+        return process_cache.get_or_load(ProcessCache.META, file, lambda: Meta.load_file(file))
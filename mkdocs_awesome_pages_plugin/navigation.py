@@ -1,9 +1,13 @@
+import datetime
+import logging
+import os
 import warnings
-from typing import Dict, List, Optional, Set, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, TypeVar, Union
 
 import mkdocs.utils
 import mkdocs.utils.meta
-from mkdocs.structure.files import Files
+from mkdocs.structure.files import File, Files
 from mkdocs.structure.nav import Link
 from mkdocs.structure.nav import Navigation as MkDocsNavigation
 from mkdocs.structure.nav import (
@@ -12,13 +16,30 @@ from mkdocs.structure.nav import (
     _add_previous_and_next_links,
 )
 from mkdocs.structure.pages import Page
-from natsort import natsort_keygen, ns
 
-from .meta import Meta, MetaNavItem, MetaNavRestItem, RestItemList
+from .cache import MetaCache
+from .discovery import index_meta_files
+from .git_dates import GitDates
+from .headers import get_header, read_header
+from .manifest import Manifest
+from .meta import (
+    Meta,
+    MetaBatch,
+    MetaNavItem,
+    MetaNavRestItem,
+    RestItemList,
+    RuleMatcher,
+)
 from .options import Options
+from .page_sources import PageSources
+from .process_cache import ProcessCache, process_cache
+from .timing import count, timed
 from .utils import basename, dirname, join_paths
 
 NavigationItem = Union[Page, Section, Link]
+T = TypeVar("T")
+
+log = logging.getLogger("mkdocs.plugins.awesome-pages")
 
 
 class NavEntryNotFound(Warning):
@@ -40,10 +61,55 @@ class HideInRootHasNoEffect(Warning):
         )
 
 
+class RulesOutsideRootHaveNoEffect(Warning):
+    def __init__(self, filename: str, context: str):
+        super().__init__(
+            'The "rules" attribute only has an effect in the {filename} file of the doc root [{context}]'.format(
+                filename=filename, context=context
+            )
+        )
+
+
+class PageHeader(NamedTuple):
+    """Front matter and title of a page, both parsed from a single read of its beginning"""
+
+    front_matter: dict
+    title: Optional[str]
+
+
 class VirtualSection(Section):
     pass
 
 
+class SectionMemo:
+    """Arrangement of every section's children from the previous build, used to skip unchanged sections"""
+
+    ITEM = 0
+    SECTION = 1
+    LINK = 2
+
+    def __init__(self):
+        self.previous: Dict[tuple, list] = {}
+        self.current: Dict[tuple, list] = {}
+
+    def begin(self):
+        self.current = {}
+
+    def get(self, key: tuple) -> Optional[list]:
+        plan = self.previous.get(key)
+        if plan is not None:
+            self.current[key] = plan
+        return plan
+
+    def put(self, key: tuple, plan: list):
+        self.current[key] = plan
+
+    def finish(self):
+        # Only entries used by the latest build are kept, everything else is stale
+        self.previous = self.current
+        self.current = {}
+
+
 class AwesomeNavigation:
     def __init__(
         self,
@@ -51,25 +117,142 @@ class AwesomeNavigation:
         options: Options,
         files: Files,
         explicit_sections: Set[Section],
+        meta_loader: Optional[Union[MetaCache, MetaBatch]] = None,
+        memo: Optional[SectionMemo] = None,
+        docs_dir: Optional[str] = None,
+        page_sources: Optional[PageSources] = None,
+        manifest: Optional[Manifest] = None,
     ):
         self.options = options
         self.explicit_sections = explicit_sections
-
-        self.meta = NavigationMeta(items, options, files, explicit_sections)
+        self.memo = memo
+        self.docs_dir = docs_dir
+        self.page_sources = page_sources
+        self.git_dates: Optional[GitDates] = None
+        self.git_dates_loaded = False
+        self.nav_warnings = 0
+        self.page_titles: Dict[str, Future] = {}
+        self.page_headers: Dict[str, PageHeader] = {}
+        self.title_executor: Optional[ThreadPoolExecutor] = None
+
+        self.meta = NavigationMeta(items, options, files, explicit_sections, meta_loader, manifest)
 
         if self.meta.root.title is not None:
             warnings.warn(TitleInRootHasNoEffect(self.options.filename))
+            self.nav_warnings += 1
 
         if self.meta.root.hide is not None:
             warnings.warn(HideInRootHasNoEffect(self.options.filename))
+            self.nav_warnings += 1
+
+        for path in self.meta.ignored_rules:
+            warnings.warn(RulesOutsideRootHaveNoEffect(self.options.filename, path))
+            self.nav_warnings += 1
+
+        if self.memo is not None:
+            self.memo.begin()
+
+        if self.options.title_workers:
+            self.title_executor = ThreadPoolExecutor(self.options.title_workers)
+            if self.memo is None:
+                # Without a memo every title will be needed, so all of them can be read at once
+                self._prefetch_titles(self._collect_title_pages(items, self.meta.root, []))
+
+        try:
+            self.items = self._process_children(items, self.options.collapse_single_pages, self.meta.root)
+        finally:
+            if self.title_executor is not None:
+                self.title_executor.shutdown()
 
-        self.items = self._process_children(items, self.options.collapse_single_pages, self.meta.root)
+        if self.memo is not None:
+            self.memo.finish()
 
     def _process_children(self, children: List[NavigationItem], collapse: bool, meta: Meta) -> List[NavigationItem]:
-        self._order(children, meta)
-        children = self._nav(children, meta)
+        if self.memo is None:
+            self._order(children, meta)
+            children = self._nav(children, meta)
+        else:
+            children = self._arrange_memoized(children, meta)
         return self._process_child_sections(children, collapse)
 
+    def _arrange_memoized(self, children: List[NavigationItem], meta: Meta) -> List[NavigationItem]:
+        key = self._memo_key(children, meta)
+        plan = self.memo.get(key)
+        if plan is not None:
+            return self._replay(plan, children)
+
+        indices = {id(item): index for index, item in enumerate(children)}
+        titles = [item.title for item in children]
+        nav_warnings = self.nav_warnings
+
+        arranged = list(children)
+        self._order(arranged, meta)
+        arranged = self._nav(arranged, meta)
+
+        # Warnings need to be reported on every build, so the result is only stored if there were none
+        if self.nav_warnings == nav_warnings:
+            self.memo.put(key, self._record(arranged, indices, titles))
+        return arranged
+
+    def _memo_key(self, children: List[NavigationItem], meta: Meta) -> tuple:
+        keys = Meta.order_by_keys(meta.order_by or self.options.order_by)
+        by_title = Meta.ORDER_BY_TITLE in keys
+        by_front_matter = any(key.startswith(Meta.ORDER_BY_META_PREFIX) for key in keys)
+        # Commit dates only change with the checked out commit
+        git_dates = self._get_git_dates() if Meta.reads_git_dates(keys) else None
+        return (
+            (self.options.order, self.options.sort_type, self.options.order_by, self.options.ignore_case),
+            git_dates.head if git_dates is not None else None,
+            meta.fingerprint(),
+            tuple(self._memo_item_key(item, by_title, by_front_matter) for item in children),
+        )
+
+    def _memo_item_key(self, item: NavigationItem, by_title: bool, by_front_matter: bool) -> tuple:
+        if isinstance(item, Section):
+            meta = self.meta.sections[item]
+            return SectionMemo.SECTION, item.title, meta.title, meta.path
+        if isinstance(item, Page):
+            # Titles and front matter read from the page source only change when the file does
+            from_source = by_title and item.title is None or by_front_matter
+            stamp = self._file_stamp(item) if from_source else None
+            return SectionMemo.ITEM, item.file.src_path, item.title, stamp
+        return SectionMemo.LINK, item.title, item.url
+
+    @staticmethod
+    def _file_stamp(page: Page) -> Optional[tuple]:
+        try:
+            stat = os.stat(page.file.abs_src_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _record(self, arranged: List[NavigationItem], indices: Dict[int, int], titles: List[Optional[str]]) -> list:
+        plan = []
+        for item in arranged:
+            if isinstance(item, VirtualSection):
+                plan.append((SectionMemo.SECTION, item.title, self._record(item.children, indices, titles)))
+            elif id(item) in indices:
+                index = indices[id(item)]
+                title = item.title if item.title != titles[index] else None
+                plan.append((SectionMemo.ITEM, index, title))
+            else:
+                plan.append((SectionMemo.LINK, item.title, item.url))
+        return plan
+
+    def _replay(self, plan: list, children: List[NavigationItem]) -> List[NavigationItem]:
+        result = []
+        for kind, first, second in plan:
+            if kind == SectionMemo.ITEM:
+                item = children[first]
+                if second is not None:
+                    item.title = second
+                result.append(item)
+            elif kind == SectionMemo.SECTION:
+                result.append(VirtualSection(first, children=self._replay(second, children)))
+            else:
+                result.append(Link(first, second))
+        return result
+
     def _process_child_sections(self, children: List[NavigationItem], collapse: bool):
         result = []
 
@@ -84,6 +267,7 @@ class AwesomeNavigation:
 
         return result
 
+    @timed("order")
     def _order(self, items: List[NavigationItem], meta: Meta):
         if len(items) < 2:
             return
@@ -96,28 +280,54 @@ class AwesomeNavigation:
             return
 
         ignore_case = meta.ignore_case or self.options.ignore_case
+        keys = Meta.order_by_keys(order_by) or (Meta.ORDER_BY_FILENAME,)
 
-        if order_by == Meta.ORDER_BY_TITLE:
-            item_key = lambda i: self._get_item_title(i)
-        else:
-            item_key = lambda i: basename(self._get_item_path(i))
+        if Meta.reads_git_dates(keys) and self._get_git_dates() is None:
+            keys = tuple(Meta.ORDER_BY_FILENAME if Meta.reads_git_dates(key) else key for key in keys)
 
-        if sort_type == Meta.SORT_NATURAL:
-            key = natsort_keygen(item_key, alg=ns.IGNORECASE if ignore_case else ns.DEFAULT)
-        elif ignore_case:
-            key = lambda i: item_key(i).casefold()
+        if Meta.ORDER_BY_TITLE in keys and self.title_executor is not None:
+            pages = [item for item in items if self._needs_page_title(item)]
+            if pages:
+                self._prefetch_titles(pages)
+
+        if len(keys) > 1 or keys[0] not in (Meta.ORDER_BY_FILENAME, Meta.ORDER_BY_TITLE):
+            if sort_type == Meta.SORT_NATURAL:
+                text_key = self._natural_key(None, ignore_case)
+            elif ignore_case:
+                text_key = str.casefold
+            else:
+                text_key = None
+            key = lambda i: tuple(self._sort_value(i, item_key, text_key) for item_key in keys)
         else:
-            key = item_key
+            if keys[0] == Meta.ORDER_BY_TITLE:
+                item_key = lambda i: self._get_item_title(i)
+            else:
+                item_key = lambda i: basename(self._get_item_path(i))
+
+            if sort_type == Meta.SORT_NATURAL:
+                key = self._natural_key(item_key, ignore_case)
+            elif ignore_case:
+                key = lambda i: item_key(i).casefold()
+            else:
+                key = item_key
 
         items.sort(key=key, reverse=order == Meta.ORDER_DESC)
 
+    @staticmethod
+    def _natural_key(key: Optional[Callable[[Any], str]], ignore_case: bool) -> Callable:
+        # natsort takes a while to import and is only needed by sections with a natural sort type
+        from natsort import natsort_keygen, ns
+
+        return natsort_keygen(key, alg=ns.IGNORECASE if ignore_case else ns.DEFAULT)
+
+    @timed("nav")
     def _nav(self, items: List[NavigationItem], meta: Meta) -> List[NavigationItem]:
         if meta.nav is None:
             return items
 
         items_by_basename = {basename(self._get_item_path(item)): item for item in items}
 
-        used_items = []
+        used_items = set()
         rest_items = RestItemList()
 
         def _make_nav_rec(meta_nav: List[MetaNavItem]) -> List[Union[NavigationItem, MetaNavRestItem]]:
@@ -135,7 +345,7 @@ class AwesomeNavigation:
                     if meta_item.title is not None:
                         item.title = meta_item.title
                     result.append(item)
-                    used_items.append(item)
+                    used_items.add(self._identity(item))
 
                 elif meta_item.title is not None:
                     result.append(Link(meta_item.title, meta_item.value))
@@ -146,6 +356,7 @@ class AwesomeNavigation:
                         raise warning
                     else:
                         warnings.warn(warning)
+                        self.nav_warnings += 1
             return result
 
         result = _make_nav_rec(meta.nav)
@@ -153,26 +364,38 @@ class AwesomeNavigation:
         if rest_items:
             rest = {rest_item: [] for rest_item in rest_items}
 
+            matcher = rest_items.matcher
             for item in items:
-                if item not in used_items:
-                    path = basename(self._get_item_path(item))
-                    for rest_item in rest_items:
-                        if rest_item.matches(path):
-                            rest[rest_item].append(item)
-                            break
-
-            def _expand_rest_rec(result: List[Union[NavigationItem, MetaNavRestItem]]):
-                for index, item in enumerate(result):
+                if self._identity(item) not in used_items:
+                    rest_item = matcher.match(basename(self._get_item_path(item)))
+                    if rest_item is not None:
+                        rest[rest_item].append(item)
+
+            def _expand_rest_rec(
+                result: List[Union[NavigationItem, MetaNavRestItem]]
+            ) -> List[Union[NavigationItem, MetaNavRestItem]]:
+                expanded = []
+                for item in result:
                     if isinstance(item, MetaNavRestItem):
-                        result[index : index + 1] = rest[item]
-                    elif isinstance(item, Section):
-                        if item.children:
-                            _expand_rest_rec(item.children)
+                        expanded.extend(rest[item])
+                    else:
+                        if isinstance(item, VirtualSection):
+                            item.children = _expand_rest_rec(item.children)
+                        expanded.append(item)
+                return expanded
 
-            _expand_rest_rec(result)
+            result = _expand_rest_rec(result)
 
         return result
 
+    @staticmethod
+    def _identity(item: NavigationItem) -> Any:
+        # Pages listed more than once are the same entry for MkDocs < 1.6, which compares them by title and file
+        if isinstance(item, Page):
+            return item.title, item.file.src_path
+        return id(item)
+
+    @timed("process_section")
     def _process_section(self, section: Section, collapse_recursive: bool) -> Optional[NavigationItem]:
         meta = self.meta.sections[section]
 
@@ -194,12 +417,85 @@ class AwesomeNavigation:
 
         return self._collapse(section, meta.collapse, collapse_recursive)
 
+    def _sort_value(self, item: NavigationItem, key: str, text_key: Optional[Callable[[str], Any]]) -> tuple:
+        if key == Meta.ORDER_BY_TITLE:
+            value = self._get_item_title(item)
+        elif key == Meta.ORDER_BY_FILENAME:
+            value = basename(self._get_item_path(item))
+        elif key == Meta.ORDER_BY_GIT_DATE:
+            value = self.git_dates.last_commit(self._get_item_path(item))
+        elif key == Meta.ORDER_BY_GIT_CREATED_DATE:
+            value = self.git_dates.first_commit(self._get_item_path(item))
+        elif isinstance(item, Page):
+            value = self._get_front_matter(item).get(key[len(Meta.ORDER_BY_META_PREFIX) :])
+        else:
+            value = None  # only pages have front matter
+
+        # Missing values sort after all others, values of different types are grouped so they can be compared
+        if value is None:
+            return (1,)
+        if isinstance(value, (int, float)):
+            return 0, 0, value
+        if isinstance(value, datetime.date):
+            return 0, 1, value.isoformat()
+        if isinstance(value, str):
+            return 0, 2, text_key(value) if text_key is not None else value
+        return 0, 3, str(value)
+
+    def _get_git_dates(self) -> Optional[GitDates]:
+        if not self.git_dates_loaded:
+            self.git_dates_loaded = True
+            if self.docs_dir is not None:
+                self.git_dates = GitDates.load(self.docs_dir)
+            if self.git_dates is None:
+                log.info(
+                    "awesome-pages: docs_dir is not in a git checkout, ordering by filename instead of commit date"
+                )
+        return self.git_dates
+
+    def _get_front_matter(self, item: Page) -> dict:
+        return self._get_page_header(item).front_matter
+
+    def _get_page_header(self, item: Page) -> PageHeader:
+        # Shared by titles and front matter, so ordering by both reads every page at most once
+        header = self.page_headers.get(item.file.src_path)
+        if header is None:
+            header = self.page_headers[item.file.src_path] = process_cache.get_or_load(
+                ProcessCache.HEADER, item.file, lambda: self._read_page_header(item)
+            )
+        return header
+
+    def _read_page_header(self, item: Page) -> PageHeader:
+        # Only the header is parsed, neither the meta-data nor the title can appear any later in the source
+        source = self._read_page(item, read_header, get_header)
+
+        page_markdown, page_meta = mkdocs.utils.meta.get_data(source)
+
+        if "title" in page_meta:
+            return PageHeader(page_meta, page_meta["title"])
+
+        return PageHeader(page_meta, mkdocs.utils.get_markdown_title(page_markdown))
+
+    def _read_page(self, item: Page, read: Callable[[str], T], get: Callable[[str], T]) -> T:
+        # Only the beginning of the page is read, unless the whole source is kept for MkDocs to build the page from
+        count("page_files_read")
+        try:
+            source = self.page_sources.read(item.file) if self.page_sources is not None else None
+            if source is not None:
+                return get(source)
+            return read(item.file.abs_src_path)
+        except OSError:
+            raise OSError(f"File not found: {item.file.src_path}")
+        except ValueError:
+            raise ValueError(f"Encoding error reading file: {item.file.src_path}")
+
     def _get_item_path(self, item: NavigationItem) -> Optional[str]:
         if isinstance(item, Section):
             return dirname(self.meta.sections[item].path)
         elif isinstance(item, Page):
             return item.file.src_path
 
+    @timed("get_item_title")
     def _get_item_title(self, item: NavigationItem) -> str:
         # Handle custom section titles in the ".pages" file
         if isinstance(item, Section):
@@ -213,21 +509,14 @@ class AwesomeNavigation:
         if not isinstance(item, Page):
             return str(item.title)
 
-        # Copy of mkdocs.structure.pages.Page._set_title and Page.read_source
-        try:
-            with open(item.file.abs_src_path, encoding="utf-8-sig", errors="strict") as f:
-                source = f.read()
-        except OSError:
-            raise OSError(f"File not found: {item.file.src_path}")
-        except ValueError:
-            raise ValueError(f"Encoding error reading file: {item.file.src_path}")
+        future = self.page_titles.get(item.file.src_path)
+        if future is not None:
+            return future.result()  # also raises errors of the prefetch in the same way
+        return self._read_page_title(item)
 
-        page_markdown, page_meta = mkdocs.utils.meta.get_data(source)
-
-        if "title" in page_meta:
-            return page_meta["title"]
-
-        title = mkdocs.utils.get_markdown_title(page_markdown)
+    def _read_page_title(self, item: Page) -> str:
+        # Copy of mkdocs.structure.pages.Page._set_title and Page.read_source
+        title = self._get_page_header(item).title
 
         if title is None:
             if item.is_homepage:
@@ -240,6 +529,24 @@ class AwesomeNavigation:
 
         return title
 
+    def _needs_page_title(self, item: NavigationItem) -> bool:
+        return isinstance(item, Page) and item.title is None and item.file.src_path not in self.page_titles
+
+    def _collect_title_pages(self, items: List[NavigationItem], meta: Meta, pages: List[Page]) -> List[Page]:
+        if Meta.ORDER_BY_TITLE in Meta.order_by_keys(meta.order_by or self.options.order_by) and len(items) >= 2:
+            pages.extend(item for item in items if self._needs_page_title(item))
+
+        for item in items:
+            if isinstance(item, Section):
+                section_meta = self.meta.sections[item]
+                if section_meta.hide is not True:
+                    self._collect_title_pages(item.children, section_meta, pages)
+        return pages
+
+    def _prefetch_titles(self, pages: List[Page]):
+        for page in pages:
+            self.page_titles[page.file.src_path] = self.title_executor.submit(self._read_page_title, page)
+
     @staticmethod
     def _set_title(section: Section, meta: Meta):
         if meta.title is not None:
@@ -254,11 +561,18 @@ class AwesomeNavigation:
             return section.children[0]
         return section
 
+    @timed("to_mkdocs")
     def to_mkdocs(self) -> MkDocsNavigation:
-        pages = get_by_type(self.items, Page)
+        return self.create_mkdocs_navigation(self.items)
+
+    @staticmethod
+    def create_mkdocs_navigation(items: List[NavigationItem]) -> MkDocsNavigation:
+        for item in items:
+            item.parent = None  # items may have been moved out of a section
+        pages = get_by_type(items, Page)
         _add_previous_and_next_links(pages)
-        _add_parent_links(self.items)
-        return MkDocsNavigation(self.items, pages)
+        _add_parent_links(items)
+        return MkDocsNavigation(items, pages)
 
 
 class NavigationMeta:
@@ -268,33 +582,82 @@ class NavigationMeta:
         options: Options,
         files: Files,
         explicit_sections: Set[Section],
+        meta_loader: Optional[Union[MetaCache, MetaBatch]] = None,
+        manifest: Optional[Manifest] = None,
     ):
         self.options = options
         self.sections: Dict[Section, Meta] = {}
+        self.manifest = manifest
         self.files = files
         self.explicit_sections = explicit_sections
+        self.meta_loader = meta_loader
+        # Files.src_paths creates a new dict on every access in recent MkDocs versions, so look up meta files here
+        self.meta_files: Dict[str, File] = index_meta_files(files, options.filenames)
+        self.rules = RuleMatcher([])
+        self.ignored_rules: List[str] = []
 
         self.root: Meta = self._gather_metadata(items)
 
+    @timed("gather_metadata")
     def _gather_metadata(self, items: List[NavigationItem]) -> Meta:
+        section_dirs: Dict[Section, Optional[str]] = {}
+        root = self._load_meta(self._gather_dirs(items, section_dirs))
+
+        # Rules of mkdocs.yml come first, so the ones in the root meta file take precedence
+        rules = Meta.parse_rules(self.options.rules, "mkdocs.yml") if self.options.rules else []
+        self.rules = RuleMatcher(rules + (root.rules or []))
+
+        self._gather_section_metadata(items, section_dirs)
+        return root
+
+    def _gather_dirs(self, items: List[NavigationItem], section_dirs: Dict[Section, Optional[str]]) -> Optional[str]:
+        # The directory of a section only depends on the paths below it, so no meta file has to be loaded yet
         paths: List[str] = []
         for item in items:
             if isinstance(item, Page):
                 paths.append(item.file.src_path)
             elif isinstance(item, Section):
-                section_meta = self._gather_metadata(item.children)
+                section_dir = self._gather_dirs(item.children, section_dirs)
+                section_dirs[item] = section_dir
 
-                if item in self.explicit_sections:
-                    self.sections[item] = Meta()
-                    continue
+                if section_dir is not None and item not in self.explicit_sections:
+                    paths.append(section_dir)
 
-                if section_meta.path is not None:
-                    paths.append(dirname(section_meta.path))
+        return self._common_dirname(paths)
 
-                self.sections[item] = section_meta
+    def _gather_section_metadata(self, items: List[NavigationItem], section_dirs: Dict[Section, Optional[str]]):
+        for item in items:
+            if not isinstance(item, Section):
+                continue
 
-        rel_config_path = join_paths(self._common_dirname(paths), self.options.filename)
-        return Meta.try_load_from_files(rel_config_path, self.files)
+            if item in self.explicit_sections:
+                self.sections[item] = Meta()
+            else:
+                meta = self.sections[item] = self._load_section_meta(section_dirs[item])
+                if meta.hide is True:
+                    continue  # the subtree is dropped, so the meta files inside it are never needed
+
+            self._gather_section_metadata(item.children, section_dirs)
+
+    def _load_section_meta(self, rel_dir: Optional[str]) -> Meta:
+        meta = self._load_meta(rel_dir)
+        if meta.rules is not None:
+            self.ignored_rules.append(meta.path)
+        if rel_dir is None:
+            return meta
+        return meta.with_rules(self.rules.match(rel_dir))
+
+    def _load_meta(self, rel_dir: Optional[str]) -> Meta:
+        if rel_dir is None:
+            return Meta()
+        if self.manifest is not None:
+            meta = self.manifest.get(rel_dir)
+            if meta is not None:
+                return meta  # the manifest takes precedence over the meta file of the directory
+        file = self.meta_files.get(rel_dir)
+        if file is None:
+            return Meta(path=join_paths(rel_dir, self.options.filename))
+        return Meta.try_load_file(file, self.meta_loader)
 
     @staticmethod
     def _common_dirname(paths: List[str]) -> Optional[str]:
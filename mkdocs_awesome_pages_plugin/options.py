@@ -1,19 +1,50 @@
+from typing import List, Union
+
+from .discovery import meta_filenames
+
+
 class Options:
     def __init__(
         self,
         *,
-        filename: str,
+        filename: Union[str, List[str]],
         collapse_single_pages: bool,
         strict: bool,
         order: str = None,
         sort_type: str = None,
         order_by: str = None,
         ignore_case: bool = None,
+        cache_dir: str = None,
+        incremental: bool = False,
+        title_workers: int = 0,
+        timings: bool = False,
+        timings_file: str = None,
+        profile: str = None,
+        profile_top: int = 0,
+        nav_snapshot: str = None,
+        rules: list = None,
+        manifest: str = None,
+        compiled_meta: str = None,
+        page_sources: bool = False,
     ):
-        self.filename = filename
+        # Candidate names of meta files, the first one that exists in a directory is used
+        self.filenames = meta_filenames(filename)
+        self.filename = self.filenames[0]
         self.collapse_single_pages = collapse_single_pages
         self.strict = strict
         self.order = order
         self.sort_type = sort_type
         self.order_by = order_by
         self.ignore_case = ignore_case
+        self.cache_dir = cache_dir
+        self.incremental = incremental
+        self.title_workers = title_workers
+        self.timings = timings
+        self.timings_file = timings_file
+        self.profile = profile
+        self.profile_top = profile_top
+        self.nav_snapshot = nav_snapshot
+        self.rules = rules
+        self.manifest = manifest
+        self.compiled_meta = compiled_meta
+        self.page_sources = page_sources
@@ -0,0 +1,66 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from mkdocs.structure.files import File
+
+
+class PageSources:
+    """Page sources read while building the navigation, handed over to MkDocs so every page is only read once per build
+
+    The buffer is bounded to max_size characters. Sources that are kept are never dropped for new ones, pages that
+    don't fit into what is left only have their header read for sorting and are read by MkDocs itself.
+    """
+
+    DEFAULT_MAX_SIZE = 32 * 1024 * 1024
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+        self.size = 0
+        self.sources: "OrderedDict[str, str]" = OrderedDict()
+        self.lock = threading.Lock()  # pages are read from multiple threads with title_workers
+
+    def read(self, file: File) -> Optional[str]:
+        """Returns the whole source of a page, None if it doesn't fit into the buffer and only its header should be read"""
+        with self.lock:
+            source = self.sources.get(file.abs_src_path)
+        if source is not None:
+            return source
+
+        # The size in bytes is an upper bound of the number of characters
+        size = os.path.getsize(file.abs_src_path)
+        with self.lock:
+            if self.size + size > self.max_size:
+                return None
+            self.size += size  # reserved while the file is read, so other threads can't overfill the buffer
+
+        try:
+            # Same as File.content_string, so MkDocs gets exactly what it would have read itself
+            with open(file.abs_src_path, encoding="utf-8-sig", errors="strict") as f:
+                source = f.read()
+        finally:
+            with self.lock:
+                self.size -= size
+        self.put(file.abs_src_path, source)
+        return source
+
+    def put(self, path: str, source: str) -> bool:
+        """Keeps the source of a page if it fits into the buffer, returns whether it was kept"""
+        with self.lock:
+            previous = self.sources.pop(path, None)
+            if previous is not None:
+                self.size -= len(previous)
+            if self.size + len(source) > self.max_size:
+                return False
+            self.sources[path] = source
+            self.size += len(source)
+            return True
+
+    def take(self, path: Optional[str]) -> Optional[str]:
+        """Removes and returns the source of a page, None if it was never read or has been dropped"""
+        with self.lock:
+            source = self.sources.pop(path, None)
+            if source is not None:
+                self.size -= len(source)
+        return source
@@ -1,19 +1,51 @@
-import glob
+import logging
 import os.path
 import warnings
-from typing import Dict, List
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Set, Union
+from urllib.parse import urlsplit
 
+from mkdocs import __version__ as mkdocs_version
 from mkdocs.config import Config, config_options
 from mkdocs.plugins import BasePlugin
 from mkdocs.structure.files import File, Files
 from mkdocs.structure.nav import Link
 from mkdocs.structure.nav import Navigation as MkDocsNavigation
-from mkdocs.structure.nav import Section, get_navigation
+from mkdocs.structure.nav import Section
 from mkdocs.structure.pages import Page
 
-from .meta import DuplicateRestItemError, MetaNavRestItem, RestItemList
-from .navigation import AwesomeNavigation, NavigationItem, get_by_type
+from . import git_dates, timing
+from .cache import MetaCache
+from .compiled import CompiledMeta
+from .discovery import find_meta_files, index_meta_files, meta_filenames
+from .manifest import Manifest
+from .meta import DuplicateRestItemError, Meta, MetaBatch, MetaNavRestItem, RestItemList
+from .navigation import AwesomeNavigation, NavigationItem, SectionMemo, get_by_type
 from .options import Options
+from .page_sources import PageSources
+from .process_cache import process_cache
+from .profiling import HookProfiler
+from .snapshot import NavSnapshot
+
+try:
+    from mkdocs.config.defaults import _AbsoluteLinksValidationValue
+
+    _RELATIVE_TO_DOCS = _AbsoluteLinksValidationValue.RELATIVE_TO_DOCS
+except ImportError:  # MkDocs < 1.6
+    _RELATIVE_TO_DOCS = None
+
+_REUSES_PAGES = tuple(int(part) for part in mkdocs_version.split(".")[:2]) >= (1, 6)
+
+log = logging.getLogger("mkdocs.structure.nav")
+plugin_log = logging.getLogger("mkdocs.plugins.awesome-pages")
+
+# Kept on module level, because "mkdocs serve" creates a new plugin instance for every rebuild
+_section_memos: Dict[str, SectionMemo] = {}
+
+
+def _absolute_links(config: Config):
+    validation = config.get("validation")
+    return validation.nav.absolute_links if validation else logging.DEBUG
 
 
 class NavPluginOrder(Warning):
@@ -26,80 +58,282 @@ class NavPluginOrder(Warning):
         )
 
 
+class OrderByOption(config_options.BaseConfigOption):
+    """Sort key or list of sort keys, validated the same way as the "order_by" attribute of .pages files"""
+
+    def run_validation(self, value):
+        if value is None:
+            return None
+        try:
+            return Meta.validate_order_by(value, "mkdocs.yml")
+        except TypeError as e:
+            raise config_options.ValidationError(str(e))
+
+
+class FilenameOption(config_options.OptionallyRequired):
+    """Name of the meta files or a list of candidate names, the first one that exists in a directory is used"""
+
+    def run_validation(self, value):
+        if isinstance(value, str) or (
+            isinstance(value, list) and value and all(isinstance(name, str) and name for name in value)
+        ):
+            return value
+        raise config_options.ValidationError(
+            "Expected a filename or a non-empty list of filenames - got {value}".format(value=value)
+        )
+
+
+class RulesOption(config_options.BaseConfigOption):
+    """Directory rules, validated the same way as the "rules" attribute of the root .pages file"""
+
+    def run_validation(self, value):
+        if value is None:
+            return None
+        try:
+            Meta.parse_rules(value, "mkdocs.yml")
+        except TypeError as e:
+            raise config_options.ValidationError(str(e))
+        return value
+
+
 class AwesomePagesPlugin(BasePlugin):
     DEFAULT_META_FILENAME = ".pages"
     REST_PLACEHOLDER = "AWESOME_PAGES_REST"
 
     config_scheme = (
-        ("filename", config_options.Type(str, default=DEFAULT_META_FILENAME)),
+        ("filename", FilenameOption(default=DEFAULT_META_FILENAME)),
         ("collapse_single_pages", config_options.Type(bool, default=False)),
         ("strict", config_options.Type(bool, default=True)),
         ("order", config_options.Choice(["asc", "desc"], default=None)),
         ("sort_type", config_options.Choice(["natural"], default=None)),
-        ("order_by", config_options.Choice(["filename", "title"], default=None)),
+        ("order_by", OrderByOption()),
         ("ignore_case", config_options.Type(bool, default=False)),
+        ("cache_dir", config_options.Type(str, default=None)),
+        ("incremental", config_options.Type(bool, default=False)),
+        ("title_workers", config_options.Type(int, default=0)),
+        ("timings", config_options.Type(bool, default=False)),
+        ("timings_file", config_options.Type(str, default=None)),
+        ("profile", config_options.Type(str, default=None)),
+        ("profile_top", config_options.Type(int, default=0)),
+        ("nav_snapshot", config_options.Type(str, default=None)),
+        ("rules", RulesOption()),
+        ("manifest", config_options.Type(str, default=None)),
+        ("compiled_meta", config_options.Type(str, default=None)),
+        ("page_sources", config_options.Type(bool, default=False)),
     )
 
     def __init__(self):
         self.nav_config_with_rest = None
         self.rest_items = RestItemList()
         self.rest_blocks = {}
+        self.profiler: Optional[HookProfiler] = None
+        self.meta_batch: Optional[MetaBatch] = None
+        self.page_sources: Optional[PageSources] = None
+        self.manifest: Optional[Manifest] = None
 
     def on_files(self, files: Files, config: Config):
-        # Add config files to Files, so we can unconditionally load files/configs from Files
-        config_files = glob.glob(os.path.join(config["docs_dir"], f"**/{self.config['filename']}"), recursive=True)
-        initial_src_paths = files.src_paths
-        for filename in config_files:
-            config_path = os.path.relpath(filename, config["docs_dir"])
-            if config_path not in initial_src_paths:
-                file = File(
-                    os.path.relpath(filename, config["docs_dir"]),
-                    src_dir=config["docs_dir"],
-                    dest_dir=config["site_dir"],
-                    use_directory_urls=config["use_directory_urls"],
+        with self._hook("on_files"):
+            # Add config files to Files, so we can unconditionally load files/configs from Files
+            config_paths = find_meta_files(files, config["docs_dir"], self.config["filename"])
+            for config_path in config_paths:
+                files.append(
+                    File(
+                        config_path,
+                        src_dir=config["docs_dir"],
+                        dest_dir=config["site_dir"],
+                        use_directory_urls=config["use_directory_urls"],
+                    )
                 )
-                files.append(file)
+
+            process_cache.prune(config["docs_dir"], (file.src_path for file in files))
+
+            if self.config["manifest"]:
+                self.manifest = Manifest.load(
+                    self._resolve_path(config, self.config["manifest"]), meta_filenames(self.config["filename"])[0]
+                )
+
+            if self.config["nav_snapshot"]:
+                self.meta_batch = None  # parsed in on_nav, unless the snapshot can be replayed
+            else:
+                self.meta_batch = self._parse_meta_files(config, files)
         return files
 
     def on_nav(self, nav: MkDocsNavigation, config: Config, files: Files):
-        explicit_nav = nav if config["nav"] else None
+        with self._hook("on_nav"):
+            items = nav.items
+            explicit_sections = set(get_by_type(nav, Section)) if config["nav"] else set()
 
-        if self.nav_config_with_rest:
-            # restore explicit config with rest placeholder and build nav
-            for file in files.documentation_pages():
-                file.page = None  # clear all pages, so mkdocs actually generates the pages based on the nav config
-            config["nav"] = self.nav_config_with_rest
-            explicit_nav = get_navigation(files, config)
+            if self.nav_config_with_rest:
+                # restore explicit config with rest placeholder and build nav from the pages MkDocs already created
+                config["nav"] = self.nav_config_with_rest
+                explicit_items = self._explicit_nav(self.nav_config_with_rest, files, config, set())
+                if not isinstance(explicit_items, list):
+                    explicit_items = [explicit_items]
+                self._log_explicit_links(explicit_items, config)
 
-        explicit_sections = set(get_by_type(explicit_nav, Section)) if explicit_nav else set()
+                explicit_sections = set(get_by_type(explicit_items, Section))
+                explicit_files = {page.file.src_path for page in get_by_type(explicit_items, Page)}
+                self.rest_blocks = self._generate_rest_blocks(items, explicit_files)
+                items = self._insert_rest(explicit_items)
 
-        if self.nav_config_with_rest:
-            self.rest_blocks = self._generate_rest_blocks(nav.items, [page.file for page in explicit_nav.pages])
-            self._insert_rest(explicit_nav.items)
-            nav = explicit_nav
+            snapshot = fingerprint = None
+            if self.config["nav_snapshot"]:
+                snapshot = NavSnapshot(self._resolve_path(config, self.config["nav_snapshot"]))
+                fingerprint = self._fingerprint(config, files, items)
 
-        return AwesomeNavigation(
-            nav.items,
-            Options(**self.config),
-            files,
-            explicit_sections,
-        ).to_mkdocs()
+            replayed = snapshot.load(fingerprint, items) if fingerprint is not None else None
+            if replayed is not None:
+                navigation = AwesomeNavigation.create_mkdocs_navigation(replayed)
+            else:
+                meta_batch = self.meta_batch or self._parse_meta_files(config, files)
+                self.page_sources = PageSources() if self.config["page_sources"] else None
+                awesome_navigation = AwesomeNavigation(
+                    items,
+                    Options(**self.config),
+                    files,
+                    explicit_sections,
+                    meta_batch,
+                    self._get_section_memo(config),
+                    config["docs_dir"],
+                    self.page_sources,
+                    self.manifest,
+                )
+                navigation = awesome_navigation.to_mkdocs()
+
+                # Warnings need to be reported on every build, so the result is only stored if there were none
+                if fingerprint is not None and awesome_navigation.nav_warnings == 0:
+                    snapshot.save(fingerprint, awesome_navigation.items)
+
+                if meta_batch.cache is not None:
+                    meta_batch.cache.save()
+
+        self._report_timings(config)
+        return navigation
 
     def on_config(self, config: Config):
-        for name, plugin in config["plugins"].items():
-            if name == "awesome-pages":
-                break
-            if hasattr(plugin, "on_nav"):
-                warnings.warn(NavPluginOrder(name))
-
-        if config["nav"]:
-            self._find_rest(config["nav"])
-            if self.rest_items:
-                self.nav_config_with_rest = config["nav"]
-                config["nav"] = None  # clear nav to prevent MkDocs from reporting files that are not included
+        if self.config["timings"] or self.config["timings_file"]:
+            timing.start()
+        else:
+            timing.stop()  # discard timings of a previous build that failed
+
+        if self.config["profile"]:
+            self.profiler = HookProfiler(self._resolve_path(config, self.config["profile"]), self.config["profile_top"])
+
+        with self._hook("on_config"):
+            for name, plugin in config["plugins"].items():
+                if name == "awesome-pages":
+                    break
+                if hasattr(plugin, "on_nav"):
+                    warnings.warn(NavPluginOrder(name))
+
+            if config["nav"]:
+                self._find_rest(config["nav"])
+                if self.rest_items:
+                    self.nav_config_with_rest = config["nav"]
+                    config["nav"] = None  # clear nav to prevent MkDocs from reporting files that are not included
 
         return config
 
+    def load_config(self, options, config_file_path=None):
+        errors, warnings = super().load_config(options, config_file_path)
+        if self.config["page_sources"]:
+            # MkDocs registers the events of a plugin after loading its config. The event is only registered when
+            # enabled, because MkDocs >= 1.6 deprecated it and warns if more than one plugin handles it.
+            self.on_page_read_source = self._page_read_source
+        return errors, warnings
+
+    def _page_read_source(self, page: Page, config: Config) -> Optional[str]:
+        # Pages read for sorting are handed over, so MkDocs doesn't have to read them again
+        if self.page_sources is None or page.file.abs_src_path is None:
+            return None  # no source on disk, e.g. another plugin set the content of the file
+        return self.page_sources.take(page.file.abs_src_path)
+
+    @contextmanager
+    def _hook(self, name: str):
+        with timing.phase(name):
+            if self.profiler is None:
+                yield
+            else:
+                with self.profiler.profile(name):
+                    yield
+
+    @staticmethod
+    def _resolve_path(config: Config, path: str) -> str:
+        # Relative paths are resolved against the directory containing mkdocs.yml
+        return os.path.join(os.path.dirname(config["config_file_path"] or ""), path)
+
+    def _create_meta_cache(self, config: Config) -> Optional[Union[MetaCache, CompiledMeta]]:
+        cache = None
+        if self.config["cache_dir"] is not None:
+            cache = MetaCache(self._resolve_path(config, self.config["cache_dir"]))
+        if self.config["compiled_meta"] is not None:
+            # Files changed since they were compiled are parsed as usual, with the cache if there is one
+            return CompiledMeta.read(self._resolve_path(config, self.config["compiled_meta"]), cache)
+        return cache
+
+    def _report_timings(self, config: Config):
+        timings = timing.stop()
+        if timings is None:
+            return
+        plugin_log.debug("awesome-pages timings:\n%s", timings.summary())
+        if self.config["timings_file"]:
+            timings.write(self._resolve_path(config, self.config["timings_file"]))
+
+    def _parse_meta_files(self, config: Config, files: Files) -> MetaBatch:
+        # Parse all meta files at once, errors are only reported for meta files that are actually used
+        meta_batch = MetaBatch(self._create_meta_cache(config))
+        meta_batch.parse_all(self._meta_files(files))
+        return meta_batch
+
+    def _meta_files(self, files: Files) -> List[File]:
+        """Returns the meta files that are used, the ones of directories in the manifest are never read"""
+        return [
+            file
+            for rel_dir, file in index_meta_files(files, self.config["filename"]).items()
+            if self.manifest is None or rel_dir not in self.manifest
+        ]
+
+    def _fingerprint(self, config: Config, files: Files, items: List[NavigationItem]) -> Optional[str]:
+        # Hashed from the raw meta files, so a build that replays the snapshot doesn't parse them
+        meta_sources = NavSnapshot.read_meta_files(self._meta_files(files))
+        if meta_sources is None:
+            return None
+
+        # Page headers only matter if titles or front matter are used for sorting. Only meta files that mention
+        # order_by can set a sort key, so only those are parsed to find out.
+        metas = list(self.manifest.entries.values()) if self.manifest is not None else []
+        invalid = False
+        for src_path, data in meta_sources.items():
+            if b"order_by" in data:
+                try:
+                    metas.append(Meta.parse(data.decode("utf-8"), src_path))
+                except Exception:
+                    invalid = True  # reported if the file is used, meanwhile assume it sorts by everything
+        # Rules apply their attributes to directories as well, both the ones in .pages files and in mkdocs.yml
+        rules = [rule for meta in metas for rule in meta.rules or []]
+        if self.config["rules"]:
+            rules.extend(Meta.parse_rules(self.config["rules"], "mkdocs.yml"))
+        metas.extend(rule.meta for rule in rules)
+        order_by = [self.config["order_by"]]
+        order_by.extend(meta.order_by for meta in metas)
+        by_source = invalid or any(Meta.reads_page_source(value) for value in order_by)
+        settings = {
+            "plugin": dict(self.config),
+            "nav": config["nav"],
+            "use_directory_urls": config["use_directory_urls"],
+            "mkdocs": mkdocs_version,
+        }
+        if self.manifest is not None:
+            settings["manifest"] = self.manifest.fingerprint()
+        if invalid or any(Meta.reads_git_dates(value) for value in order_by):
+            settings["git"] = git_dates.revision(config["docs_dir"])
+        return NavSnapshot.fingerprint(settings, meta_sources, items, by_source)
+
+    def _get_section_memo(self, config: Config) -> Optional[SectionMemo]:
+        if not self.config["incremental"]:
+            return None
+        return _section_memos.setdefault(os.path.abspath(config["docs_dir"]), SectionMemo())
+
     def _find_rest(self, config):
         if isinstance(config, list):
             for index, element in enumerate(config):
@@ -117,20 +351,96 @@ class AwesomePagesPlugin(BasePlugin):
             for value in config.values():
                 self._find_rest(value)
 
+    def _explicit_nav(self, data, files: Files, config: Config, seen: Set[int]):
+        # Equivalent of mkdocs.structure.nav._data_to_navigation that reuses existing pages
+        if isinstance(data, dict):
+            return [
+                (
+                    self._explicit_nav_entry(key, value, files, config, seen)
+                    if isinstance(value, str)
+                    else Section(title=key, children=self._explicit_nav(value, files, config, seen))
+                )
+                for key, value in data.items()
+            ]
+        elif isinstance(data, list):
+            return [
+                (
+                    self._explicit_nav(item, files, config, seen)[0]
+                    if isinstance(item, dict) and len(item) == 1
+                    else self._explicit_nav(item, files, config, seen)
+                )
+                for item in data
+            ]
+        return self._explicit_nav_entry(None, data, files, config, seen)
+
+    @staticmethod
+    def _explicit_nav_entry(
+        title: Optional[str], path: str, files: Files, config: Config, seen: Set[int]
+    ) -> NavigationItem:
+        lookup_path = path
+        if path.startswith("/") and _absolute_links(config) is _RELATIVE_TO_DOCS:
+            lookup_path = path.lstrip("/")
+
+        file = files.get_file_from_path(lookup_path)
+        if file is None:
+            return Link(title, path)
+
+        inclusion = getattr(file, "inclusion", None)
+        if inclusion is not None and inclusion.is_excluded():
+            log.info(
+                "A reference to '{}' is included in the 'nav' "
+                "configuration, but this file is excluded from the built site.".format(file.src_path)
+            )
+
+        if id(file) in seen:
+            # MkDocs >= 1.6 reuses the page of a file that is listed multiple times, older versions create new ones
+            return file.page if _REUSES_PAGES else Page(title, file, config)
+        seen.add(id(file))
+
+        if file.page is None:
+            return Page(title, file, config)
+        if title is not None:
+            file.page.title = title
+        return file.page
+
+    @staticmethod
+    def _log_explicit_links(items: List[NavigationItem], config: Config):
+        # Same messages MkDocs logs for the links of an explicit nav
+        absolute_links = _absolute_links(config)
+        validation = config.get("validation")
+        not_found = validation.nav.not_found if validation else logging.WARNING
+
+        for link in get_by_type(items, Link):
+            if link.title == AwesomePagesPlugin.REST_PLACEHOLDER:
+                continue
+            scheme, netloc, *_ = urlsplit(link.url)
+            if scheme or netloc:
+                log.debug("An external link to '{}' is included in the 'nav' configuration.".format(link.url))
+            elif link.url.startswith("/") and absolute_links is not _RELATIVE_TO_DOCS:
+                log.log(
+                    absolute_links,
+                    "An absolute path to '{}' is included in the 'nav' "
+                    "configuration, which presumably points to an external resource.".format(link.url),
+                )
+            else:
+                log.log(
+                    not_found,
+                    "A reference to '{}' is included in the 'nav' "
+                    "configuration, which is not found in the documentation files.".format(link.url),
+                )
+
     def _generate_rest_blocks(
-        self, items: List[NavigationItem], exclude_files: List[File]
+        self, items: List[NavigationItem], exclude_files: Set[str]
     ) -> Dict[str, List[NavigationItem]]:
         result = {rest_item: [] for rest_item in self.rest_items}
-        for item in items[:]:  # loop over a shallow copy of items so removing items doesn't break iteration
-            if isinstance(item, Page):
-                if item.file not in exclude_files:
-                    item.file.page = item  # restore previously cleared page on the file (line 69)
-                    for rest_item in self.rest_items:
-                        if rest_item.matches(item.file.src_path):
-                            items.remove(item)
-                            result[rest_item].append(item)
-                            break
-            if isinstance(item, Section):
+        remaining = []
+        for item in items:
+            if isinstance(item, Page) and item.file.src_path not in exclude_files:
+                rest_item = self.rest_items.matcher.match(item.file.src_path)
+                if rest_item is not None:
+                    result[rest_item].append(item)
+                    continue
+            elif isinstance(item, Section):
                 child_result = self._generate_rest_blocks(item.children, exclude_files)
                 for rest_item, children in child_result.items():
                     if children:
@@ -138,11 +448,17 @@ class AwesomePagesPlugin(BasePlugin):
                             result[rest_item].extend(children)
                         else:
                             result[rest_item].append(Section(item.title, children))
+            remaining.append(item)
+        items[:] = remaining
         return result
 
-    def _insert_rest(self, items):
-        for index, item in enumerate(items):
+    def _insert_rest(self, items: List[NavigationItem]) -> List[NavigationItem]:
+        result = []
+        for item in items:
             if isinstance(item, Link) and item.title == AwesomePagesPlugin.REST_PLACEHOLDER:
-                items[index : index + 1] = self.rest_blocks[MetaNavRestItem(item.url[1:])]
-            if isinstance(item, Section):
-                self._insert_rest(item.children)
+                result.extend(self.rest_blocks[MetaNavRestItem(item.url[1:])])
+            else:
+                if isinstance(item, Section):
+                    item.children = self._insert_rest(item.children)
+                result.append(item)
+        return result
@@ -0,0 +1,73 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Iterable, Tuple, TypeVar
+
+from mkdocs.structure.files import File
+
+T = TypeVar("T")
+
+
+class ProcessCache:
+    """Parsed meta files and page headers kept in memory for the lifetime of the process
+
+    "mkdocs serve" creates a new plugin instance for every rebuild, so unchanged files are only parsed once per
+    session. Entries are keyed by docs dir and relative path and are only valid for the stored mtime and size.
+    """
+
+    META = "meta"
+    HEADER = "header"
+    DEFAULT_MAX_ENTRIES = 100000
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[Tuple[str, str, str], Tuple[Tuple[int, int], object]]" = OrderedDict()
+        self.lock = threading.Lock()  # titles are read from multiple threads with title_workers
+
+    def get_or_load(self, kind: str, file: File, load: Callable[[], T]) -> T:
+        if file.abs_src_path is None:
+            return load()  # generated file without a source on disk
+        try:
+            stat = os.stat(file.abs_src_path)
+        except OSError:
+            return load()
+
+        key = (kind, ProcessCache._src_dir(file), file.src_path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self.entries.move_to_end(key)
+                return entry[1]
+
+        value = load()  # errors are not cached, so they are reported again on the next build
+
+        with self.lock:
+            self.entries[key] = (stamp, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return value
+
+    @staticmethod
+    def _src_dir(file: File) -> str:
+        src_dir = getattr(file, "src_dir", None)  # MkDocs >= 1.5
+        if src_dir is None:
+            # abs_src_path is src_dir joined with src_path, which are both normalized
+            src_dir = os.path.normpath(file.abs_src_path[: -len(file.src_path)])
+        return src_dir
+
+    def prune(self, docs_dir: str, src_paths: Iterable[str]):
+        """Evicts the entries of files that were removed from docs_dir"""
+        src_paths = set(src_paths)
+        with self.lock:
+            stale = [key for key in self.entries if key[1] == docs_dir and key[2] not in src_paths]
+            for key in stale:
+                del self.entries[key]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+process_cache = ProcessCache()
@@ -0,0 +1,47 @@
+import io
+import logging
+import os
+from contextlib import contextmanager
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import cProfile
+
+log = logging.getLogger("mkdocs.plugins.awesome-pages")
+
+
+class HookProfiler:
+    """Profiles plugin hooks with cProfile and dumps one .pstats file per hook and build"""
+
+    SORT_KEY = "cumulative"
+
+    def __init__(self, directory: str, top: int = 0):
+        self.directory = directory
+        self.top = top
+        self.build = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+
+    def path(self, hook: str) -> str:
+        return os.path.join(self.directory, "{}-{}.pstats".format(self.build, hook))
+
+    @contextmanager
+    def profile(self, hook: str):
+        import cProfile  # deferred, only builds with the profile option enabled need it
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            os.makedirs(self.directory, exist_ok=True)
+            profiler.dump_stats(self.path(hook))
+            if self.top:
+                log.info("awesome-pages profile of %s:\n%s", hook, self.summary(profiler))
+
+    def summary(self, profiler: "cProfile.Profile") -> str:
+        import pstats
+
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats(HookProfiler.SORT_KEY).print_stats(self.top)
+        return stream.getvalue()
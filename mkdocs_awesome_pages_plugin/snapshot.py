@@ -0,0 +1,142 @@
+import hashlib
+import json
+from typing import Dict, Iterable, List, Optional
+
+from mkdocs.structure.files import File
+from mkdocs.structure.nav import Link, Section
+from mkdocs.structure.pages import Page
+
+from .cache import plugin_version
+from .headers import read_header
+from .navigation import NavigationItem, get_by_type
+from .utils import atomic_write
+
+
+class NavSnapshot:
+    """Processed navigation of a previous build, stored as compact JSON together with the fingerprint of its inputs
+
+    If the fingerprint of a build matches, the stored arrangement is replayed onto the current pages instead of
+    processing the navigation again.
+    """
+
+    FORMAT = 1
+    PAGE = "p"
+    SECTION = "s"
+    LINK = "l"
+
+    def __init__(self, path: str):
+        self.path = path
+
+    @staticmethod
+    def read_meta_files(meta_files: Iterable[File]) -> Optional[Dict[str, bytes]]:
+        """Returns the raw contents of the meta files by their relative path, or None if a file can't be read"""
+        sources = {}
+        try:
+            for file in meta_files:
+                with open(file.abs_src_path, "rb") as f:
+                    sources[file.src_path] = f.read()
+        except (OSError, TypeError):
+            return None  # e.g. a generated file without a source on disk
+        return sources
+
+    @staticmethod
+    def fingerprint(
+        settings: dict, meta_sources: Dict[str, bytes], items: List[NavigationItem], headers: bool
+    ) -> Optional[str]:
+        """Hashes everything the processed navigation depends on, returns None if a page can't be read
+
+        The items are hashed as MkDocs passes them to on_nav, so pages that are left out of the navigation (e.g. by
+        not_in_nav) change the fingerprint.
+        """
+        digest = hashlib.sha256()
+        NavSnapshot._update(
+            digest, json.dumps([NavSnapshot.FORMAT, plugin_version(), settings], sort_keys=True, default=str)
+        )
+
+        for src_path in sorted(meta_sources):
+            NavSnapshot._update(digest, src_path)
+            NavSnapshot._update(digest, meta_sources[src_path])
+
+        NavSnapshot._update(digest, json.dumps(NavSnapshot.structure(items), separators=(",", ":")))
+        if headers:
+            try:
+                for page in sorted(get_by_type(items, Page), key=lambda p: p.file.src_path):
+                    NavSnapshot._update(digest, page.file.src_path)
+                    NavSnapshot._update(digest, read_header(page.file.abs_src_path))
+            except (OSError, TypeError, ValueError):
+                return None  # e.g. a generated page without a source on disk
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def structure(items: List[NavigationItem]) -> list:
+        """Pages, sections and links of the items, without the titles MkDocs gives pages"""
+        result = []
+        for item in items:
+            if isinstance(item, Page):
+                result.append([NavSnapshot.PAGE, item.file.src_path])
+            elif isinstance(item, Section):
+                result.append([NavSnapshot.SECTION, item.title, NavSnapshot.structure(item.children)])
+            else:
+                result.append([NavSnapshot.LINK, item.title, item.url])
+        return result
+
+    @staticmethod
+    def _update(digest, data):
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        # Length prefix, so the boundaries between the parts are part of the hash
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+
+    def load(self, fingerprint: str, items: List[NavigationItem]) -> Optional[List[NavigationItem]]:
+        """Returns the stored navigation built from the pages in items, or None if it can't be reused"""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get("format") != NavSnapshot.FORMAT:
+            return None
+        if data.get("fingerprint") != fingerprint:
+            return None
+
+        pages = {page.file.src_path: page for page in get_by_type(items, Page)}
+        try:
+            return NavSnapshot.replay(data["nav"], pages)
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def save(self, fingerprint: str, items: List[NavigationItem]):
+        data = {"format": NavSnapshot.FORMAT, "fingerprint": fingerprint, "nav": NavSnapshot.serialize(items)}
+        atomic_write(self.path, json.dumps(data, separators=(",", ":")).encode("utf-8"))
+
+    @staticmethod
+    def serialize(items: List[NavigationItem]) -> list:
+        result = []
+        for item in items:
+            if isinstance(item, Page):
+                result.append([NavSnapshot.PAGE, item.file.src_path, item.title])
+            elif isinstance(item, Section):
+                result.append([NavSnapshot.SECTION, item.title, NavSnapshot.serialize(item.children)])
+            else:
+                result.append([NavSnapshot.LINK, item.title, item.url])
+        return result
+
+    @staticmethod
+    def replay(data: list, pages: Dict[str, Page]) -> List[NavigationItem]:
+        result = []
+        for kind, first, second in data:
+            if kind == NavSnapshot.PAGE:
+                page = pages[first]
+                if second is not None:
+                    page.title = second
+                result.append(page)
+            elif kind == NavSnapshot.SECTION:
+                result.append(Section(first, NavSnapshot.replay(second, pages)))
+            elif kind == NavSnapshot.LINK:
+                result.append(Link(first, second))
+            else:
+                raise ValueError("Unknown snapshot entry {}".format(kind))
+        return result
@@ -60,13 +60,21 @@ class E2ETestCase(TestCase):
 
     def createConfig(
         self,
-        filename: Optional[str] = None,
+        filename: Optional[Union[str, List[str]]] = None,
         collapse_single_pages: Optional[bool] = None,
         mkdocs_nav: Optional[List[Union[str, Dict[str, Union[str, list]]]]] = None,
         strict: Optional[bool] = None,
         order: Optional[str] = None,
         sort_type: Optional[str] = None,
         order_by: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        timings_file: Optional[str] = None,
+        profile: Optional[str] = None,
+        nav_snapshot: Optional[str] = None,
+        rules: Optional[List[dict]] = None,
+        manifest: Optional[str] = None,
+        compiled_meta: Optional[str] = None,
+        page_sources: Optional[bool] = None,
     ) -> dict:
         plugin_options = self._removeDictNoneValues(
             {
@@ -76,6 +84,14 @@ class E2ETestCase(TestCase):
                 "order": order,
                 "sort_type": sort_type,
                 "order_by": order_by,
+                "cache_dir": cache_dir,
+                "timings_file": timings_file,
+                "profile": profile,
+                "nav_snapshot": nav_snapshot,
+                "rules": rules,
+                "manifest": manifest,
+                "compiled_meta": compiled_meta,
+                "page_sources": page_sources,
             }
         )
         plugins_entry = "awesome-pages"
@@ -0,0 +1,19 @@
+from .base import E2ETestCase
+
+
+class TestCache(E2ETestCase):
+    def test_cache_dir(self):
+        navigation = self.mkdocs(
+            self.createConfig(cache_dir=".cache"),
+            [
+                "1.md",
+                "2.md",
+                self.pagesFile(nav=["2.md", "..."]),
+                ("section", ["a.md", self.pagesFile(title="Section Title")]),
+            ],
+        )
+
+        self.assertEqual(
+            navigation,
+            [("2", "/2"), ("1", "/1"), ("Section Title", [("A", "/section/a")])],
+        )
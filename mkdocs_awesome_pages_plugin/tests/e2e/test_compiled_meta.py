@@ -0,0 +1,51 @@
+import os
+import tempfile
+from unittest import mock
+
+from ...compiled import CompiledMeta
+from ...meta import Meta
+from .base import E2ETestCase
+
+
+class TestCompiledMeta(E2ETestCase):
+    def setUp(self):
+        super().setUp()
+        temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_directory.cleanup)
+        self.docs_dir = os.path.join(temp_directory.name, "docs")
+        self.path = os.path.join(temp_directory.name, "meta.json")
+
+    def compile(self, files: list):
+        self._createFiles(self.docs_dir, files)
+        compiled, errors = CompiledMeta.compile(self.docs_dir, ".pages")
+        self.assertEqual(errors, [])
+        compiled.write(self.path)
+
+    def build(self, files: list):
+        with mock.patch.object(Meta, "parse", wraps=Meta.parse) as parse:
+            navigation = self.mkdocs(self.createConfig(compiled_meta=self.path), files)
+        return navigation, parse.call_count
+
+    def createFiles(self, title: str = "Section"):
+        return [
+            "1.md",
+            "2.md",
+            self.pagesFile(nav=["2.md", "..."]),
+            ("section", ["a.md", "b.md", self.pagesFile(title=title, order="desc")]),
+        ]
+
+    def test_compiled(self):
+        self.compile(self.createFiles())
+        navigation, parsed = self.build(self.createFiles())
+
+        self.assertEqual(parsed, 0)
+        self.assertEqual(
+            navigation, [("2", "/2"), ("1", "/1"), ("Section", [("B", "/section/b"), ("A", "/section/a")])]
+        )
+
+    def test_changed_file(self):
+        self.compile(self.createFiles())
+        navigation, parsed = self.build(self.createFiles(title="Changed"))
+
+        self.assertEqual(parsed, 1)
+        self.assertEqual(navigation[2][0], "Changed")
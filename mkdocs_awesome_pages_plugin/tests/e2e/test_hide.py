@@ -1,3 +1,7 @@
+import os
+from unittest import mock
+
+from mkdocs_awesome_pages_plugin.meta import Meta
 from mkdocs_awesome_pages_plugin.navigation import HideInRootHasNoEffect
 
 from .base import E2ETestCase
@@ -40,3 +44,18 @@ class TestHide(E2ETestCase):
             navigation = self.mkdocs(self.config, ["page.md", self.pagesFile(hide=True)])
 
         self.assertEqual(navigation, [("Page", "/page")])
+
+    def test_subtree_not_loaded(self):
+        with mock.patch("mkdocs_awesome_pages_plugin.meta.Meta.parse", wraps=Meta.parse) as parse:
+            navigation = self.mkdocs(
+                self.config,
+                [
+                    ("a", ["1.md", ("b", ["2.md", self.pagesFile(title="B")]), self.pagesFile(hide=True)]),
+                    ("c", ["3.md", self.pagesFile(title="C")]),
+                ],
+            )
+
+        self.assertEqual(navigation, [("C", [("3", "/c/3")])])
+        parsed = [call.args[1] for call in parse.call_args_list]
+        self.assertTrue(any(path.endswith(os.path.join("a", ".pages")) for path in parsed))
+        self.assertFalse(any(path.endswith(os.path.join("b", ".pages")) for path in parsed))
@@ -0,0 +1,47 @@
+import json
+
+from mkdocs.exceptions import MkDocsException
+
+from .base import E2ETestCase
+
+
+class TestJson(E2ETestCase):
+    @staticmethod
+    def jsonFile(name: str = ".pages.json", **attributes) -> tuple:
+        return name, json.dumps(attributes)
+
+    def test_json_filename(self):
+        navigation = self.mkdocs(
+            self.createConfig(filename=".pages.json"),
+            [("section", ["a.md", "b.md", self.jsonFile(title="Section Title", order="desc")])],
+        )
+
+        self.assertEqual(navigation, [("Section Title", [("B", "/section/b"), ("A", "/section/a")])])
+
+    def test_json_contents(self):
+        navigation = self.mkdocs(
+            self.config,
+            [("section", ["a.md", "b.md", self.jsonFile(".pages", title="Section Title", order="desc")])],
+        )
+
+        self.assertEqual(navigation, [("Section Title", [("B", "/section/b"), ("A", "/section/a")])])
+
+    def test_candidates(self):
+        navigation = self.mkdocs(
+            self.createConfig(filename=[".pages.json", ".pages"]),
+            [
+                ("a", ["1.md", "2.md", self.jsonFile(title="JSON"), self.pagesFile(title="YAML", order="desc")]),
+                ("b", ["1.md", "2.md", self.pagesFile(title="YAML", order="desc")]),
+            ],
+        )
+
+        self.assertEqual(
+            navigation,
+            [("JSON", [("1", "/a/1"), ("2", "/a/2")]), ("YAML", [("2", "/b/2"), ("1", "/b/1")])],
+        )
+
+    def test_invalid_filename_option(self):
+        for filename in ([], [".pages", 1]):
+            with self.subTest(filename=filename):
+                with self.assertRaises(MkDocsException):
+                    self.mkdocs(self.createConfig(filename=filename), ["a.md"])
@@ -0,0 +1,103 @@
+import json
+from unittest import mock
+
+import yaml
+from mkdocs.exceptions import MkDocsException
+
+from ... import manifest
+from ...meta import Meta
+from .base import E2ETestCase
+
+
+class TestManifest(E2ETestCase):
+    def setUp(self):
+        super().setUp()
+        manifest._loaded.clear()
+        self.addCleanup(manifest._loaded.clear)
+
+    @staticmethod
+    def manifestFile(entries: dict, name: str = "pages.yml") -> tuple:
+        if name.endswith(".json"):
+            return name, json.dumps(entries)
+        return name, yaml.dump(entries)
+
+    def test_entries(self):
+        navigation = self.mkdocs(
+            self.createConfig(manifest="docs/pages.yml"),
+            [
+                ("a", ["1.md", "2.md"]),
+                ("b", [("c", ["1.md", "2.md"])]),
+                self.manifestFile({"a": {"title": "A Title", "order": "desc"}, "b/c": {"order": "desc"}}),
+            ],
+        )
+
+        self.assertEqual(
+            navigation,
+            [
+                ("A Title", [("2", "/a/2"), ("1", "/a/1")]),
+                ("B", [("C", [("2", "/b/c/2"), ("1", "/b/c/1")])]),
+            ],
+        )
+
+    def test_root(self):
+        for root in ("", "."):
+            with self.subTest(root=root):
+                manifest._loaded.clear()
+                navigation = self.mkdocs(
+                    self.createConfig(manifest="docs/pages.yml"),
+                    ["1.md", "2.md", self.manifestFile({root: {"nav": ["2.md", "1.md"]}})],
+                    dummy_pages=False,
+                )
+
+                self.assertEqual(navigation, [("2", "/2"), ("1", "/1")])
+
+    def test_json(self):
+        navigation = self.mkdocs(
+            self.createConfig(manifest="docs/pages.json"),
+            [("a", ["1.md", "2.md"]), self.manifestFile({"a": {"order": "desc"}}, "pages.json")],
+        )
+
+        self.assertEqual(navigation, [("A", [("2", "/a/2"), ("1", "/a/1")])])
+
+    def test_takes_precedence_over_meta_file(self):
+        with mock.patch.object(Meta, "try_load_file", wraps=Meta.try_load_file) as try_load_file:
+            navigation = self.mkdocs(
+                self.createConfig(manifest="docs/pages.yml"),
+                [
+                    ("a", ["1.md", "2.md", self.pagesFile(title="Own Title", order="asc")]),
+                    self.manifestFile({"a": {"order": "desc"}}),
+                ],
+            )
+
+        self.assertEqual(navigation, [("A", [("2", "/a/2"), ("1", "/a/1")])])
+        self.assertNotIn("a/.pages", [call.args[0].src_path for call in try_load_file.call_args_list])
+
+    def test_meta_files_of_other_directories(self):
+        navigation = self.mkdocs(
+            self.createConfig(manifest="docs/pages.yml"),
+            [
+                ("a", ["1.md", "2.md", self.pagesFile(title="Own Title")]),
+                ("b", ["1.md", "2.md"]),
+                self.manifestFile({"b": {"order": "desc"}}),
+            ],
+        )
+
+        self.assertEqual(
+            navigation,
+            [("Own Title", [("1", "/a/1"), ("2", "/a/2")]), ("B", [("2", "/b/2"), ("1", "/b/1")])],
+        )
+
+    def test_rules_fill_unset_attributes(self):
+        navigation = self.mkdocs(
+            self.createConfig(manifest="docs/pages.yml", rules=[{"match": "*", "title": "Rule Title"}]),
+            [("a", ["1.md", "2.md"]), self.manifestFile({"a": {"order": "desc"}})],
+        )
+
+        self.assertEqual(navigation, [("Rule Title", [("2", "/a/2"), ("1", "/a/1")])])
+
+    def test_invalid(self):
+        with self.assertRaises((TypeError, MkDocsException)):
+            self.mkdocs(
+                self.createConfig(manifest="docs/pages.yml"),
+                [("a", ["1.md"]), self.manifestFile({"a": {"title": 1}})],
+            )
@@ -0,0 +1,131 @@
+import json
+import os
+import tempfile
+from unittest import mock, skipIf
+
+import yaml
+
+from mkdocs_awesome_pages_plugin.meta import Meta
+from mkdocs_awesome_pages_plugin.navigation import NavigationMeta
+
+from .base import E2ETestCase
+
+try:
+    from mkdocs.structure.files import InclusionLevel
+except ImportError:  # MkDocs < 1.5
+    InclusionLevel = None
+
+
+class TestNavSnapshot(E2ETestCase):
+    def setUp(self):
+        super().setUp()
+        temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_directory.cleanup)
+        self.snapshot_path = os.path.join(temp_directory.name, "nav.json")
+
+    def createFiles(self, title: str = "Section Title"):
+        return [
+            "1.md",
+            ("2.md", "# Zero\n"),
+            self.pagesFile(nav=[{"Renamed": "2.md"}, "...", {"Link": "https://example.com"}]),
+            ("section", ["a.md", "b.md", self.pagesFile(title=title, order="desc")]),
+        ]
+
+    def build(self, files: list, mkdocs_config: dict = None, **kwargs):
+        config = self.createConfig(nav_snapshot=self.snapshot_path, **kwargs)
+        config.update(mkdocs_config or {})
+        with mock.patch("mkdocs_awesome_pages_plugin.navigation.NavigationMeta", wraps=NavigationMeta) as meta:
+            navigation = self.mkdocs(config, files)
+        return navigation, meta.called
+
+    def test_replay(self):
+        navigation, processed = self.build(self.createFiles())
+        self.assertTrue(processed)
+        self.assertTrue(os.path.isfile(self.snapshot_path))
+
+        replayed, processed = self.build(self.createFiles())
+        self.assertFalse(processed)
+        self.assertEqual(replayed, navigation)
+        self.assertEqual(
+            replayed,
+            [
+                ("Renamed", "/2"),
+                ("1", "/1"),
+                ("Section Title", [("B", "/section/b"), ("A", "/section/a")]),
+                ("Link", "https://example.com"),
+            ],
+        )
+
+    def test_replay_does_not_parse_meta_files(self):
+        self.build(self.createFiles())
+
+        with mock.patch.object(Meta, "parse", wraps=Meta.parse) as parse:
+            _, processed = self.build(self.createFiles())
+        self.assertFalse(processed)
+        self.assertEqual(parse.call_count, 0)
+
+    @skipIf(InclusionLevel is None, "not_in_nav requires MkDocs >= 1.5")
+    def test_page_no_longer_left_out(self):
+        def createFiles():
+            return ["a.md", "b.md", ("sub", ["c.md"])]
+
+        navigation, _ = self.build(createFiles(), {"not_in_nav": "b.md"})
+        self.assertEqual(navigation, [("A", "/a"), ("Sub", [("C", "/sub/c")])])
+
+        navigation, processed = self.build(createFiles())
+        self.assertTrue(processed)
+        self.assertEqual(navigation, [("A", "/a"), ("B", "/b"), ("Sub", [("C", "/sub/c")])])
+
+    def test_meta_file_changed(self):
+        self.build(self.createFiles())
+
+        navigation, processed = self.build(self.createFiles(title="Other Title"))
+        self.assertTrue(processed)
+        self.assertEqual(navigation[2][0], "Other Title")
+
+    def test_page_added(self):
+        self.build(self.createFiles())
+
+        navigation, processed = self.build(self.createFiles() + ["3.md"])
+        self.assertTrue(processed)
+        self.assertEqual(len(navigation), 5)
+
+    def test_page_headers_with_title_order(self):
+        files = self.createFiles()
+        self.build(files, order_by="title")
+        _, processed = self.build(files, order_by="title")
+        self.assertFalse(processed)
+
+        files[1] = ("2.md", "# Changed\n")
+        _, processed = self.build(files, order_by="title")
+        self.assertTrue(processed)
+
+    def test_page_headers_with_title_order_from_rules(self):
+        def createFiles():
+            return [
+                ("section", [("a.md", "# B\n"), ("b.md", "# C\n")]),
+                (".pages", yaml.dump({"rules": [{"match": "section", "order_by": "title"}]})),
+            ]
+
+        for kwargs in ({}, {"rules": [{"match": "section", "order_by": "title"}]}):
+            with self.subTest(**kwargs):
+                files = createFiles()
+                if kwargs:
+                    files.pop()
+                self.build(files, **kwargs)
+                _, processed = self.build(files, **kwargs)
+                self.assertFalse(processed)
+
+                files[0] = ("section", [("a.md", "# D\n"), ("b.md", "# C\n")])
+                navigation, processed = self.build(files, **kwargs)
+                self.assertTrue(processed)
+                self.assertEqual(navigation, [("Section", [("C", "/section/b"), ("D", "/section/a")])])
+
+    def test_corrupt_snapshot(self):
+        with open(self.snapshot_path, "w") as f:
+            f.write("{")
+
+        navigation, processed = self.build(self.createFiles())
+        self.assertTrue(processed)
+        with open(self.snapshot_path) as f:
+            self.assertEqual(json.load(f)["nav"][0], ["p", "2.md", "Renamed"])
@@ -1,3 +1,9 @@
+import builtins
+import os
+from unittest import mock
+
+from mkdocs_awesome_pages_plugin.git_dates import GitDates
+
 from .base import E2ETestCase
 
 
@@ -440,3 +446,132 @@ class TestOrderAndSort(E2ETestCase):
             navigation,
             [("A", "/3"), ("C", "/1"), ("D", [("C", "/B/1"), ("B", "/B/2")])],
         )
+
+    def test_order_by_front_matter(self):
+        navigation = self.mkdocs(
+            self.createConfig(),
+            [
+                ("a.md", "---\nweight: 3\n---\n# A"),
+                ("b.md", "---\nweight: 1\n---\n# B"),
+                ("c.md", "---\nweight: 2\n---\n# C"),
+                self.pagesFile(order_by="meta.weight"),
+            ],
+        )
+
+        self.assertEqual(navigation, [("B", "/b"), ("C", "/c"), ("A", "/a")])
+
+    def test_order_by_front_matter_desc(self):
+        navigation = self.mkdocs(
+            self.createConfig(order="desc", order_by="meta.date"),
+            [
+                ("a.md", "---\ndate: 2023-05-01\n---\n"),
+                ("b.md", "---\ndate: 2024-01-15\n---\n"),
+                ("c.md", "---\ndate: 2023-11-30\n---\n"),
+            ],
+        )
+
+        self.assertEqual(navigation, [("B", "/b"), ("C", "/c"), ("A", "/a")])
+
+    def test_order_by_front_matter_missing_values_last(self):
+        navigation = self.mkdocs(
+            self.createConfig(),
+            [
+                ("a.md", "# A"),
+                ("b.md", "---\nweight: 2\n---\n"),
+                ("section", ["1.md"]),
+                ("d.md", "---\nweight: 1\n---\n"),
+                self.pagesFile(order_by="meta.weight"),
+            ],
+        )
+
+        self.assertEqual(navigation, [("D", "/d"), ("B", "/b"), ("A", "/a"), ("Section", [("1", "/section/1")])])
+
+    def test_order_by_multiple_keys(self):
+        navigation = self.mkdocs(
+            self.createConfig(),
+            [
+                ("a.md", "---\nnav_order: 2\n---\n# Z"),
+                ("b.md", "---\nnav_order: 1\n---\n# Y"),
+                ("c.md", "---\nnav_order: 2\n---\n# X"),
+                ("d.md", "# W"),
+                ("e.md", "# V"),
+                self.pagesFile(order_by=["meta.nav_order", "title"]),
+            ],
+        )
+
+        self.assertEqual(navigation, [("Y", "/b"), ("X", "/c"), ("Z", "/a"), ("V", "/e"), ("W", "/d")])
+
+    def test_order_by_front_matter_natural(self):
+        navigation = self.mkdocs(
+            self.createConfig(),
+            [
+                ("a.md", "---\nversion: v10\n---\n"),
+                ("b.md", "---\nversion: v9\n---\n"),
+                ("c.md", "---\nversion: v1\n---\n"),
+                self.pagesFile(order_by="meta.version", sort_type="natural"),
+            ],
+        )
+
+        self.assertEqual(navigation, [("C", "/c"), ("B", "/b"), ("A", "/a")])
+
+    def assertPagesReadOnce(self, order_by: list, files: list, expected: list):
+        with mock.patch("mkdocs_awesome_pages_plugin.headers.open", wraps=builtins.open, create=True) as open_mock:
+            navigation = self.mkdocs(self.createConfig(order_by=order_by), files)
+
+        self.assertEqual(navigation, expected)
+        read_paths = [call.args[0] for call in open_mock.call_args_list]
+        self.assertEqual(len(read_paths), len(set(read_paths)))
+        self.assertEqual(len([path for path in read_paths if os.path.basename(path) != "index.md"]), len(files))
+
+    def test_order_by_front_matter_reads_pages_once(self):
+        self.assertPagesReadOnce(
+            ["meta.weight", "meta.group", "filename"],
+            [("a.md", "---\nweight: 1\n---\n"), ("b.md", "---\nweight: 1\n---\n"), "c.md"],
+            [("A", "/a"), ("B", "/b"), ("C", "/c")],
+        )
+
+    def test_order_by_front_matter_and_title_reads_pages_once(self):
+        self.assertPagesReadOnce(
+            ["meta.weight", "title"],
+            [("a.md", "---\nweight: 1\n---\n# Z\n"), ("b.md", "---\nweight: 1\n---\n# Y\n"), ("c.md", "# X\n")],
+            [("Y", "/b"), ("Z", "/a"), ("X", "/c")],
+        )
+
+    def test_order_by_git_date(self):
+        dates = GitDates("0" * 40)
+        for path, timestamp in [("a.md", 300), ("b.md", 100), ("c.md", 200), ("d/1.md", 250)]:
+            dates.add(path, timestamp)
+        dates.add_directories()
+
+        with mock.patch("mkdocs_awesome_pages_plugin.navigation.GitDates.load", return_value=dates):
+            navigation = self.mkdocs(
+                self.createConfig(),
+                ["a.md", "b.md", "c.md", ("d", ["1.md"]), "e.md", self.pagesFile(order_by="git_date", order="desc")],
+            )
+
+        self.assertEqual(navigation, [("E", "/e"), ("A", "/a"), ("D", [("1", "/d/1")]), ("C", "/c"), ("B", "/b")])
+
+    def test_order_by_git_created_date(self):
+        dates = GitDates("0" * 40)
+        for path, timestamp in [("a.md", 300), ("b.md", 100), ("b.md", 400), ("c.md", 200)]:
+            dates.add(path, timestamp)
+        dates.add_directories()
+
+        with mock.patch("mkdocs_awesome_pages_plugin.navigation.GitDates.load", return_value=dates):
+            navigation = self.mkdocs(
+                self.createConfig(order_by=["git_created_date", "filename"]), ["a.md", "b.md", "c.md", "d.md"]
+            )
+
+        self.assertEqual(navigation, [("B", "/b"), ("C", "/c"), ("A", "/a"), ("D", "/d")])
+
+    def test_order_by_git_date_outside_git_checkout(self):
+        with mock.patch("mkdocs_awesome_pages_plugin.navigation.GitDates.load", return_value=None):
+            navigation = self.mkdocs(
+                self.createConfig(order="desc", order_by="git_date"), ["a.md", "b.md", ("c", ["1.md"])]
+            )
+
+        self.assertEqual(navigation, [("C", [("1", "/c/1")]), ("B", "/b"), ("A", "/a")])
+
+    def test_order_by_invalid(self):
+        with self.assertRaises(TypeError):
+            self.mkdocs(self.createConfig(), ["a.md", "b.md", self.pagesFile(order_by=["meta.weight", "weight"])])
@@ -0,0 +1,58 @@
+import builtins
+import os
+from functools import partial
+from unittest import mock
+
+from ...page_sources import PageSources
+from .base import E2ETestCase
+
+
+class TestPageSources(E2ETestCase):
+    def build(self, config: dict, files: list) -> list:
+        with mock.patch("builtins.open", wraps=builtins.open) as open_mock:
+            navigation = self.mkdocs(config, files)
+        # Relative paths are the files written by the test itself
+        return navigation, [
+            str(call.args[0])
+            for call in open_mock.call_args_list
+            if str(call.args[0]).endswith(".md") and os.path.isabs(str(call.args[0]))
+        ]
+
+    def test_pages_read_once(self):
+        navigation, opened = self.build(
+            self.createConfig(order_by="title", page_sources=True),
+            [("1.md", "# C\n\nText"), ("2.md", "---\ntitle: A\n---\nText"), ("section", [("1.md", "# B")])],
+        )
+
+        self.assertEqual(navigation, [("A", "/2"), ("C", "/1"), ("Section", [("B", "/section/1")])])
+        self.assertEqual(len(opened), 5)
+        self.assertEqual(len(opened), len(set(opened)))
+
+    def test_pages_not_read_for_sorting(self):
+        navigation, opened = self.build(self.createConfig(page_sources=True), ["b.md", "a.md"])
+
+        self.assertEqual(navigation, [("A", "/a"), ("B", "/b")])
+        self.assertEqual(len(opened), 4)
+        self.assertEqual(len(opened), len(set(opened)))
+
+    def test_disabled(self):
+        navigation, opened = self.build(
+            self.createConfig(order_by="title"), [("1.md", "# B\n\nText"), ("2.md", "# A\n\nText")]
+        )
+
+        self.assertEqual(navigation, [("A", "/2"), ("B", "/1")])
+        # The header for sorting and the whole page for building it
+        for name in ("1.md", "2.md"):
+            self.assertEqual(len([path for path in opened if os.path.basename(path) == name]), 2)
+
+    def test_buffer_full(self):
+        names = ["{}.md".format(i) for i in range(6)]
+        files = [(name, "# {}\n\n{}".format(name[0], "x" * 1000)) for name in names]
+        with mock.patch("mkdocs_awesome_pages_plugin.plugin.PageSources", partial(PageSources, max_size=2100)):
+            with mock.patch("mkdocs_awesome_pages_plugin.headers.open", wraps=builtins.open, create=True) as header:
+                navigation, opened = self.build(self.createConfig(order_by="title", page_sources=True), files)
+
+        self.assertEqual(navigation, [(str(i), "/{}".format(i)) for i in range(6)])
+        # Two pages fit into the buffer, the others only have their header read for sorting and are read by MkDocs
+        self.assertEqual(header.call_count, 4)
+        self.assertEqual(sorted(os.path.basename(path) for path in opened if self.DUMMY_NAME not in path), names)
@@ -0,0 +1,22 @@
+import os
+import pstats
+import tempfile
+
+from .base import E2ETestCase
+
+
+class TestProfile(E2ETestCase):
+    def test_profile(self):
+        with tempfile.TemporaryDirectory() as profile_directory:
+            navigation = self.mkdocs(self.createConfig(profile=profile_directory), ["1.md", "2.md"])
+
+            filenames = sorted(os.listdir(profile_directory))
+            self.assertEqual(len(filenames), 3)
+            self.assertEqual(
+                sorted(filename.rsplit("-", 1)[1] for filename in filenames),
+                ["on_config.pstats", "on_files.pstats", "on_nav.pstats"],
+            )
+            self.assertEqual(len({filename.rsplit("-", 1)[0] for filename in filenames}), 1)  # same build
+            pstats.Stats(os.path.join(profile_directory, filenames[0]))
+
+        self.assertEqual(navigation, [("1", "/1"), ("2", "/2")])
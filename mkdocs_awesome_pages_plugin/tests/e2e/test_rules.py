@@ -0,0 +1,129 @@
+import yaml
+from mkdocs.exceptions import MkDocsException
+
+from ...navigation import RulesOutsideRootHaveNoEffect
+from .base import E2ETestCase
+
+
+class TestRules(E2ETestCase):
+    @staticmethod
+    def rulesFile(rules: list, **attributes) -> tuple:
+        return ".pages", yaml.dump(dict(attributes, rules=rules))
+
+    def test_rules(self):
+        navigation = self.mkdocs(
+            self.config,
+            [
+                ("api", [("v1", ["a.md", "b.md"]), ("v2", ["a.md", "b.md"])]),
+                ("guide", ["a.md", "b.md"]),
+                self.rulesFile([{"match": "api/*", "order": "desc"}, {"match": "api", "title": "Reference"}]),
+            ],
+        )
+
+        self.assertEqual(
+            navigation,
+            [
+                (
+                    "Reference",
+                    [
+                        ("V1", [("B", "/api/v1/b"), ("A", "/api/v1/a")]),
+                        ("V2", [("B", "/api/v2/b"), ("A", "/api/v2/a")]),
+                    ],
+                ),
+                ("Guide", [("A", "/guide/a"), ("B", "/guide/b")]),
+            ],
+        )
+
+    def test_globstar(self):
+        navigation = self.mkdocs(
+            self.config,
+            [
+                ("api", [("v1", [("x", ["a.md"]), "b.md"]), "c.md"]),
+                self.rulesFile([{"match": "api/**", "collapse_single_pages": True}]),
+            ],
+        )
+
+        self.assertEqual(navigation, [("Api", [("C", "/api/c"), ("V1", [("B", "/api/v1/b"), ("A", "/api/v1/x/a")])])])
+
+    def test_meta_file_takes_precedence(self):
+        navigation = self.mkdocs(
+            self.config,
+            [
+                ("a", ["1.md", "2.md", self.pagesFile(title="Own Title")]),
+                ("b", ["1.md", "2.md", self.pagesFile(order="asc")]),
+                self.rulesFile([{"match": "*", "title": "Rule Title", "order": "desc"}]),
+            ],
+        )
+
+        self.assertEqual(
+            navigation,
+            [
+                ("Own Title", [("2", "/a/2"), ("1", "/a/1")]),
+                ("Rule Title", [("1", "/b/1"), ("2", "/b/2")]),
+            ],
+        )
+
+    def test_later_rules_win(self):
+        navigation = self.mkdocs(
+            self.config,
+            [
+                ("a", ["1.md", "2.md"]),
+                self.rulesFile([{"match": "*", "order": "desc", "title": "A"}, {"match": "a", "order": "asc"}]),
+            ],
+        )
+
+        self.assertEqual(navigation, [("A", [("1", "/a/1"), ("2", "/a/2")])])
+
+    def test_hide(self):
+        navigation = self.mkdocs(
+            self.config,
+            ["1.md", ("drafts", ["a.md"]), self.rulesFile([{"match": "drafts", "hide": True}])],
+        )
+
+        self.assertEqual(navigation, [("1", "/1")])
+
+    def test_nav(self):
+        navigation = self.mkdocs(
+            self.config,
+            [
+                ("a", ["index.md", "1.md", "latest.md"]),
+                ("b", ["index.md", "2.md", "latest.md"]),
+                self.rulesFile([{"match": "*", "nav": ["latest.md", "..."]}]),
+            ],
+        )
+
+        self.assertEqual(
+            navigation,
+            [
+                ("A", [("Latest", "/a/latest"), ("Index", "/a"), ("1", "/a/1")]),
+                ("B", [("Latest", "/b/latest"), ("Index", "/b"), ("2", "/b/2")]),
+            ],
+        )
+
+    def test_config_rules(self):
+        navigation = self.mkdocs(
+            self.createConfig(rules=[{"match": "*", "order": "desc"}, {"match": "b", "title": "Config"}]),
+            [
+                ("a", ["1.md", "2.md"]),
+                ("b", ["1.md", "2.md"]),
+                self.rulesFile([{"match": "b", "title": "Root"}]),
+            ],
+        )
+
+        self.assertEqual(
+            navigation,
+            [("A", [("2", "/a/2"), ("1", "/a/1")]), ("Root", [("2", "/b/2"), ("1", "/b/1")])],
+        )
+
+    def test_outside_root(self):
+        with self.assertWarns(RulesOutsideRootHaveNoEffect):
+            navigation = self.mkdocs(
+                self.config,
+                [("a", [("b", ["1.md", "2.md"]), self.rulesFile([{"match": "**", "order": "desc"}])])],
+            )
+
+        self.assertEqual(navigation, [("A", [("B", [("1", "/a/b/1"), ("2", "/a/b/2")])])])
+
+    def test_invalid_config_rules(self):
+        with self.assertRaises(MkDocsException):
+            self.mkdocs(self.createConfig(rules=[{"order": "desc"}]), ["1.md"])
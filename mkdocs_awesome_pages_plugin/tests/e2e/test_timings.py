@@ -0,0 +1,24 @@
+import json
+import os
+import tempfile
+
+from .base import E2ETestCase
+
+
+class TestTimings(E2ETestCase):
+    def test_timings_file(self):
+        with tempfile.TemporaryDirectory() as report_directory:
+            path = os.path.join(report_directory, "timings.json")
+            navigation = self.mkdocs(
+                self.createConfig(timings_file=path),
+                ["1.md", "2.md", ("section", ["a.md", self.pagesFile(title="Section Title")])],
+            )
+
+            with open(path) as f:
+                report = json.load(f)
+
+        self.assertEqual(navigation, [("1", "/1"), ("2", "/2"), ("Section Title", [("A", "/section/a")])])
+        for name in ["on_config", "on_files", "on_nav", "gather_metadata", "nav", "to_mkdocs"]:
+            self.assertGreater(report["phases"][name]["calls"], 0, name)
+        self.assertEqual(report["phases"]["on_nav"]["calls"], 1)
+        self.assertEqual(report["counters"]["meta_files_loaded"], 1)
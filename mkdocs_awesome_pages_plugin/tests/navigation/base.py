@@ -9,7 +9,7 @@ from mkdocs.structure.nav import Section
 from mkdocs.structure.pages import Page
 
 from ...meta import Meta
-from ...navigation import AwesomeNavigation, NavigationItem, get_by_type
+from ...navigation import AwesomeNavigation, NavigationItem, SectionMemo, get_by_type
 from ...options import Options
 
 
@@ -17,6 +17,7 @@ class NavigationMetaMock:
     def __init__(self):
         self.sections = {}
         self.root = Meta()
+        self.ignored_rules = []
 
 
 class NavigationTestCase(TestCase):
@@ -51,7 +52,13 @@ class NavigationTestCase(TestCase):
         return section
 
     def createAwesomeNavigation(
-        self, items: List[NavigationItem], *, collapse_single_pages: bool = False, strict: bool = True
+        self,
+        items: List[NavigationItem],
+        *,
+        collapse_single_pages: bool = False,
+        strict: bool = True,
+        memo: Optional[SectionMemo] = None,
+        title_workers: int = 0,
     ) -> AwesomeNavigation:
         children = []
         meta = None
@@ -70,9 +77,11 @@ class NavigationTestCase(TestCase):
                 filename=".pages",
                 collapse_single_pages=collapse_single_pages,
                 strict=strict,
+                title_workers=title_workers,
             ),
             files=Files([]),
             explicit_sections=set(),
+            memo=memo,
         )
 
     def assertNavigationEqual(self, actual: List[NavigationItem], expected: List[NavigationItem]):
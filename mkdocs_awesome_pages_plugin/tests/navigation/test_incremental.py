@@ -0,0 +1,137 @@
+import warnings
+from typing import Callable, List
+from unittest import mock
+
+from ...meta import Meta, MetaNavItem, MetaNavRestItem
+from ...navigation import AwesomeNavigation, NavigationItem, SectionMemo
+from .base import NavigationTestCase
+
+
+class TestIncremental(NavigationTestCase):
+    def setUp(self):
+        super().setUp()
+        self.memo = SectionMemo()
+
+    def build(self, create_items: Callable[[], List[NavigationItem]], **kwargs) -> AwesomeNavigation:
+        self.meta_mock.sections = {}
+        return self.createAwesomeNavigation(create_items(), memo=self.memo, **kwargs)
+
+    def assertRebuildEqual(self, create_items: Callable[[], List[NavigationItem]], expected: List[NavigationItem]):
+        navigation = self.build(create_items)
+        self.assertNavigationEqual(navigation.items, expected)
+
+        with mock.patch.object(AwesomeNavigation, "_order") as order, mock.patch.object(
+            AwesomeNavigation, "_nav"
+        ) as nav:
+            navigation = self.build(create_items)
+            order.assert_not_called()
+            nav.assert_not_called()
+
+        self.assertNavigationEqual(navigation.items, expected)
+        self.assertValidNavigation(navigation.to_mkdocs())
+
+    def test_order(self):
+        self.assertRebuildEqual(
+            lambda: [self.page("1"), self.page("3"), self.page("2"), Meta(order=Meta.ORDER_DESC)],
+            [self.page("3"), self.page("2"), self.page("1")],
+        )
+
+    def test_nav(self):
+        self.assertRebuildEqual(
+            lambda: [
+                self.page("1"),
+                self.page("2"),
+                self.page("3"),
+                Meta(
+                    nav=[
+                        MetaNavItem("3.md", "Three"),
+                        MetaNavItem([MetaNavItem("1.md")], "Virtual"),
+                        MetaNavItem("https://example.com", "Link"),
+                        MetaNavRestItem("..."),
+                    ]
+                ),
+            ],
+            [
+                self.page("Three", "3.md"),
+                self.section("Virtual", [self.page("1")]),
+                self.link("Link", "https://example.com"),
+                self.page("2"),
+            ],
+        )
+
+    def test_sections(self):
+        self.assertRebuildEqual(
+            lambda: [
+                self.section("B", [self.page("2", "b/2.md"), self.page("1", "b/1.md")], "b"),
+                self.section("A", [self.page("3", "a/3.md"), Meta(title="Title", path="a/.pages")]),
+                Meta(order=Meta.ORDER_ASC),
+            ],
+            [
+                self.section("Title", [self.page("3", "a/3.md")]),
+                self.section("B", [self.page("2", "b/2.md"), self.page("1", "b/1.md")]),
+            ],
+        )
+
+    def test_changed_meta(self):
+        self.build(lambda: [self.page("1"), self.page("2"), Meta(order=Meta.ORDER_DESC)])
+        navigation = self.build(lambda: [self.page("1"), self.page("2"), Meta(order=Meta.ORDER_ASC)])
+        self.assertNavigationEqual(navigation.items, [self.page("1"), self.page("2")])
+
+    def test_changed_children(self):
+        self.build(lambda: [self.page("1"), self.page("2"), Meta(order=Meta.ORDER_DESC)])
+        navigation = self.build(lambda: [self.page("1"), self.page("2"), self.page("3"), Meta(order=Meta.ORDER_DESC)])
+        self.assertNavigationEqual(navigation.items, [self.page("3"), self.page("2"), self.page("1")])
+
+    def test_only_changed_section_is_processed(self):
+        def create_items(title: str):
+            return lambda: [
+                self.section("A", [self.page("1", "a/1.md"), self.page("2", "a/2.md")], "a"),
+                self.section("B", [self.page("3", "b/3.md"), self.page(title, "b/4.md")], "b"),
+                Meta(order=Meta.ORDER_DESC),
+            ]
+
+        self.build(create_items("4"))
+        with mock.patch.object(AwesomeNavigation, "_order", autospec=True) as order:
+            navigation = self.build(create_items("Four"))
+            self.assertEqual(order.call_count, 1)
+            self.assertEqual(len(order.call_args[0][1]), 2)
+            self.assertEqual(order.call_args[0][1][1].title, "Four")
+        self.assertNavigationEqual(
+            navigation.items,
+            [
+                self.section("B", [self.page("3", "b/3.md"), self.page("Four", "b/4.md")]),
+                self.section("A", [self.page("1", "a/1.md"), self.page("2", "a/2.md")]),
+            ],
+        )
+
+    def test_changed_page_source_with_title_order(self):
+        def create_items():
+            return [self.page(None, "1.md"), self.page(None, "2.md"), Meta(order_by=Meta.ORDER_BY_TITLE)]
+
+        with mock.patch.object(AwesomeNavigation, "_get_item_title", side_effect=lambda item: item.file.src_path):
+            with mock.patch.object(AwesomeNavigation, "_file_stamp", return_value=(1, 1)):
+                self.build(create_items)
+                with mock.patch.object(AwesomeNavigation, "_order") as order:
+                    self.build(create_items)
+                    order.assert_not_called()
+
+            with mock.patch.object(AwesomeNavigation, "_file_stamp", return_value=(2, 1)):
+                with mock.patch.object(AwesomeNavigation, "_order") as order:
+                    self.build(create_items)
+                    order.assert_called_once()
+
+    def test_warnings_are_repeated(self):
+        def create_items():
+            return [self.page("1"), Meta(nav=[MetaNavItem("missing.md"), MetaNavItem("1.md")])]
+
+        for _ in range(2):
+            with warnings.catch_warnings(record=True) as recorded:
+                warnings.simplefilter("always")
+                navigation = self.build(create_items, strict=False)
+            self.assertEqual(len(recorded), 1)
+            self.assertNavigationEqual(navigation.items, [self.page("1")])
+
+    def test_stale_entries_are_dropped(self):
+        self.build(lambda: [self.page("1"), self.page("2"), Meta(order=Meta.ORDER_DESC)])
+        self.build(lambda: [self.page("1"), self.page("2"), Meta(order=Meta.ORDER_ASC)])
+        self.assertEqual(len(self.memo.previous), 1)
@@ -59,6 +59,19 @@ class TestNav(NavigationTestCase):
         )
         self.assertValidNavigation(navigation.to_mkdocs())
 
+    def test_rest_duplicate_page(self):
+        # MkDocs < 1.6 creates a separate page for every time a file is listed in the nav of mkdocs.yml
+        navigation = self.createAwesomeNavigation(
+            [
+                self.page("1"),
+                self.page("2"),
+                self.page("1"),
+                Meta(nav=[MetaNavItem("2.md"), MetaNavItem("1.md"), MetaNavRestItem("...")]),
+            ]
+        )
+
+        self.assertNavigationEqual(navigation.items, [self.page("2"), self.page("1")])
+
     def test_rest_empty(self):
         navigation = self.createAwesomeNavigation(
             [
@@ -0,0 +1,68 @@
+import threading
+from unittest import mock
+
+from mkdocs.structure.pages import Page
+
+from ...meta import Meta
+from ...navigation import AwesomeNavigation, SectionMemo
+from .base import NavigationTestCase
+
+TITLES = {"1.md": "C", "2.md": "A", "3.md": "B", "a/1.md": "Z", "a/2.md": "Y", "b/1.md": "X", "b/2.md": "W"}
+
+
+class TestTitlePrefetch(NavigationTestCase):
+    def setUp(self):
+        super().setUp()
+        self.threads = set()
+
+        def read_page_title(page: Page) -> str:
+            self.threads.add(threading.current_thread())
+            return TITLES[page.file.src_path]
+
+        patcher = mock.patch.object(AwesomeNavigation, "_read_page_title", side_effect=read_page_title)
+        self.addCleanup(patcher.stop)
+        self.read_page_title = patcher.start()
+
+    def test_order(self):
+        navigation = self.createAwesomeNavigation(
+            [self.page(None, "1.md"), self.page(None, "2.md"), self.page(None, "3.md"), Meta(order_by="title")],
+            title_workers=2,
+        )
+
+        self.assertEqual([page.file.src_path for page in navigation.items], ["2.md", "3.md", "1.md"])
+        self.assertEqual(self.read_page_title.call_count, 3)
+        self.assertNotIn(threading.current_thread(), self.threads)
+
+    def test_whole_tree_up_front(self):
+        def create_items():
+            return [
+                self.section("A", [self.page(None, "a/1.md"), self.page(None, "a/2.md"), Meta(order_by="title")]),
+                self.section("B", [self.page(None, "b/1.md"), self.page(None, "b/2.md"), Meta(hide=True)]),
+                self.page("Explicit", "1.md"),
+            ]
+
+        with mock.patch.object(AwesomeNavigation, "_prefetch_titles", autospec=True) as prefetch:
+            self.createAwesomeNavigation(create_items(), title_workers=2)
+            whole_tree = prefetch.call_args_list[0][0][1]
+            self.assertEqual([page.file.src_path for page in whole_tree], ["a/1.md", "a/2.md"])
+
+        self.read_page_title.reset_mock()
+        navigation = self.createAwesomeNavigation(create_items(), title_workers=2)
+        self.assertEqual([page.file.src_path for page in navigation.items[0].children], ["a/2.md", "a/1.md"])
+        self.assertEqual(self.read_page_title.call_count, 2)
+
+    def test_per_section_with_memo(self):
+        items = [self.page(None, "1.md"), self.page(None, "2.md"), self.page(None, "3.md"), Meta(order_by="title")]
+        navigation = self.createAwesomeNavigation(items, title_workers=2, memo=SectionMemo())
+
+        self.assertEqual([page.file.src_path for page in navigation.items], ["2.md", "3.md", "1.md"])
+        self.assertEqual(self.read_page_title.call_count, 3)
+
+    def test_error(self):
+        self.read_page_title.side_effect = OSError("File not found: 2.md")
+
+        with self.assertRaisesRegex(OSError, "File not found: 2.md"):
+            self.createAwesomeNavigation(
+                [self.page(None, "1.md"), self.page(None, "2.md"), Meta(order_by="title")],
+                title_workers=2,
+            )
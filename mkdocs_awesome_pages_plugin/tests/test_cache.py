@@ -0,0 +1,169 @@
+import json
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from mkdocs.structure.files import File
+
+from .. import timing
+from ..cache import MetaCache
+from ..meta import MetaNavItem
+
+
+class TestMetaCache(TestCase):
+    def setUp(self):
+        temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_directory.cleanup)
+        self.docs_dir = os.path.join(temp_directory.name, "docs")
+        self.cache_dir = os.path.join(temp_directory.name, "cache")
+        os.makedirs(os.path.join(self.docs_dir, "section"))
+
+    def writeMetaFile(self, rel_path: str, contents: str) -> File:
+        with open(os.path.join(self.docs_dir, rel_path), "w") as f:
+            f.write(contents)
+        return File(rel_path, self.docs_dir, "", False)
+
+    def setMtime(self, file: File, mtime_ns: int):
+        os.utime(file.abs_src_path, ns=(mtime_ns, mtime_ns))
+
+    def test_miss(self):
+        file = self.writeMetaFile(".pages", "title: Title\nnav:\n  - a.md\n")
+
+        meta = MetaCache(self.cache_dir).load(file)
+        self.assertEqual(meta.path, ".pages")
+        self.assertEqual(meta.title, "Title")
+        self.assertEqual(meta.nav, [MetaNavItem("a.md")])
+
+    def test_only_parsed_files_are_counted(self):
+        file = self.writeMetaFile(".pages", "title: Title\n")
+        self.addCleanup(timing.stop)
+        timings = timing.start()
+
+        cache = MetaCache(self.cache_dir)
+        cache.load(file)
+        cache.load(file)
+        cache.save()
+        MetaCache(self.cache_dir).load(file)
+
+        self.assertEqual(timings.counters, {"meta_files_loaded": 1})
+
+    def test_hit_after_save(self):
+        file = self.writeMetaFile(os.path.join("section", ".pages"), "title: Title\n")
+        cache = MetaCache(self.cache_dir)
+        cache.load(file)
+        cache.save()
+
+        with mock.patch("mkdocs_awesome_pages_plugin.meta.yaml.load") as load:
+            meta = MetaCache(self.cache_dir).load(file)
+            load.assert_not_called()
+
+        self.assertEqual(meta.path, os.path.join("section", ".pages"))
+        self.assertEqual(meta.title, "Title")
+
+    def test_hit_with_changed_mtime(self):
+        file = self.writeMetaFile(".pages", "title: Title\n")
+        self.setMtime(file, 1_000_000_000)
+        cache = MetaCache(self.cache_dir)
+        cache.load(file)
+        cache.save()
+
+        self.setMtime(file, 2_000_000_000)
+        with mock.patch("mkdocs_awesome_pages_plugin.meta.yaml.load") as load:
+            cache = MetaCache(self.cache_dir)
+            self.assertEqual(cache.load(file).title, "Title")
+            load.assert_not_called()
+        self.assertEqual(cache.entries[".pages"].mtime_ns, 2_000_000_000)
+
+    def test_changed_contents(self):
+        file = self.writeMetaFile(".pages", "title: Title\n")
+        self.setMtime(file, 1_000_000_000)
+        cache = MetaCache(self.cache_dir)
+        cache.load(file)
+        cache.save()
+
+        self.writeMetaFile(".pages", "title: Other\n")
+        self.setMtime(file, 2_000_000_000)
+        self.assertEqual(MetaCache(self.cache_dir).load(file).title, "Other")
+
+    def test_invalid_file_is_not_cached(self):
+        file = self.writeMetaFile(".pages", "title: [1]\n")
+        cache = MetaCache(self.cache_dir)
+
+        with self.assertRaises(TypeError):
+            cache.load(file)
+        self.assertNotIn(".pages", cache.entries)
+
+    def test_missing_file(self):
+        with self.assertRaises(FileNotFoundError):
+            MetaCache(self.cache_dir).load(File(".pages", self.docs_dir, "", False))
+
+    def test_version_mismatch(self):
+        file = self.writeMetaFile(".pages", "title: Title\n")
+        cache = MetaCache(self.cache_dir)
+        cache.load(file)
+        cache.save()
+
+        with mock.patch("mkdocs_awesome_pages_plugin.cache.plugin_version", return_value="0.0.0"):
+            self.assertEqual(len(MetaCache(self.cache_dir).entries), 0)
+
+    def test_corrupt_cache_file(self):
+        os.makedirs(self.cache_dir)
+        with open(os.path.join(self.cache_dir, MetaCache.FILENAME), "wb") as f:
+            f.write(b"not json")
+
+        self.assertEqual(len(MetaCache(self.cache_dir).entries), 0)
+
+    def test_stored_as_json(self):
+        file = self.writeMetaFile(".pages", "title: Title\nunknown: 2024-01-01\nnav:\n  - a.md\n")
+        cache = MetaCache(self.cache_dir)
+        cache.load(file)
+        cache.save()
+
+        with open(os.path.join(self.cache_dir, MetaCache.FILENAME), encoding="utf-8") as f:
+            data = json.load(f)
+        self.assertEqual(data["entries"][".pages"][3], {"title": "Title", "nav": ["a.md"]})
+
+        with mock.patch("mkdocs_awesome_pages_plugin.meta.yaml.load") as load:
+            meta = MetaCache(self.cache_dir).load(file)
+            load.assert_not_called()
+        self.assertEqual((meta.title, meta.path, meta.nav), ("Title", ".pages", [MetaNavItem("a.md")]))
+
+    def test_invalid_entry_is_validated(self):
+        file = self.writeMetaFile(".pages", "title: Title\n")
+        other = self.writeMetaFile(os.path.join("section", ".pages"), "title: Section\n")
+        cache = MetaCache(self.cache_dir)
+        cache.load(file)
+        cache.load(other)
+        cache.save()
+
+        path = os.path.join(self.cache_dir, MetaCache.FILENAME)
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        data["entries"][".pages"][3] = {"title": 1}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+        cache = MetaCache(self.cache_dir)
+        self.assertEqual(list(cache.entries), [os.path.join("section", ".pages")])
+        self.assertEqual(cache.load(file).title, "Title")
+
+    def test_lru_eviction(self):
+        files = [self.writeMetaFile(name, "title: {}\n".format(name)) for name in ["a", "b", "c"]]
+        cache = MetaCache(self.cache_dir, max_entries=2)
+        for file in files:
+            cache.load(file)
+        cache.load(files[0])  # mark "a" as recently used
+        cache.save()
+
+        self.assertEqual(list(MetaCache(self.cache_dir).entries), ["c", "a"])
+
+    def test_save_is_atomic(self):
+        file = self.writeMetaFile(".pages", "title: Title\n")
+        cache = MetaCache(self.cache_dir)
+        cache.load(file)
+
+        with mock.patch("os.replace", side_effect=OSError("failed")):
+            with self.assertRaises(OSError):
+                cache.save()
+
+        self.assertEqual(os.listdir(self.cache_dir), [])
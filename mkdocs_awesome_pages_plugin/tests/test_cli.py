@@ -0,0 +1,118 @@
+import io
+import os
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import TestCase
+
+from ..cli import main
+from ..compiled import CompiledMeta
+
+
+class CliTestCase(TestCase):
+    def setUp(self):
+        temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_directory.cleanup)
+        self.directory = temp_directory.name
+        self.docs_dir = os.path.join(self.directory, "docs")
+        self.output = os.path.join(self.directory, "meta.json")
+        os.makedirs(os.path.join(self.docs_dir, "section"))
+
+    def write(self, rel_path: str, contents: str):
+        path = os.path.join(self.directory, rel_path)
+        with open(path, "w") as f:
+            f.write(contents)
+
+    def run_main(self, *argv: str):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            code = main(list(argv))
+        return code, stdout.getvalue(), stderr.getvalue()
+
+
+class TestCompile(CliTestCase):
+    def test_compile(self):
+        self.write("docs/.pages", "title: Root\n")
+        self.write("docs/section/.pages", "title: Section\n")
+
+        code, stdout, _ = self.run_main("compile", "-d", self.docs_dir, "--filename", ".pages", "-o", self.output)
+
+        self.assertEqual(code, 0)
+        self.assertIn("Compiled 2 meta files", stdout)
+        self.assertEqual(sorted(CompiledMeta.read(self.output).entries), [".pages", os.path.join("section", ".pages")])
+
+    def test_errors(self):
+        self.write("docs/.pages", "title: 1\n")
+        self.write("docs/section/.pages", "order: up\n")
+
+        code, stdout, stderr = self.run_main("compile", "-d", self.docs_dir, "--filename", ".pages", "-o", self.output)
+
+        self.assertEqual(code, 1)
+        self.assertIn('"title"', stderr)
+        self.assertIn('"order"', stderr)
+        self.assertIn("2 of the 2 files are invalid", stdout)
+        self.assertFalse(os.path.exists(self.output))
+
+    def test_settings_from_config_file(self):
+        self.write(
+            "mkdocs.yml", "site_name: Test\ndocs_dir: content\nplugins:\n  - awesome-pages:\n      filename: _pages\n"
+        )
+        os.makedirs(os.path.join(self.directory, "content"))
+        self.write("content/_pages", "title: Root\n")
+        self.write("content/.pages", "title: 1\n")
+
+        code, _, _ = self.run_main("compile", "-f", os.path.join(self.directory, "mkdocs.yml"), "-o", self.output)
+
+        self.assertEqual(code, 0)
+        self.assertEqual(list(CompiledMeta.read(self.output).entries), ["_pages"])
+
+
+class TestValidate(CliTestCase):
+    def test_valid(self):
+        self.write("docs/a.md", "")
+        self.write("docs/.pages", "nav:\n  - a.md\n")
+
+        code, stdout, _ = self.run_main("validate", "-d", self.docs_dir, "--filename", ".pages", "-j", "1")
+
+        self.assertEqual(code, 0)
+        self.assertIn("Checked 1 meta files: 0 errors, 0 warnings", stdout)
+
+    def test_errors(self):
+        self.write("docs/.pages", "nav:\n  - a.md\n")
+        self.write("docs/section/.pages", "order: up\n")
+
+        code, stdout, stderr = self.run_main("validate", "-d", self.docs_dir, "--filename", ".pages", "-j", "2")
+
+        self.assertEqual(code, 1)
+        self.assertIn('Nav entry "a.md" not found', stderr)
+        self.assertIn('"order"', stderr)
+        self.assertIn("Checked 2 meta files: 2 errors, 0 warnings", stdout)
+
+    def test_without_strict(self):
+        self.write("docs/.pages", "nav:\n  - a.md\n")
+
+        code, stdout, _ = self.run_main("validate", "-d", self.docs_dir, "--filename", ".pages", "--no-strict")
+
+        self.assertEqual(code, 0)
+        self.assertIn("0 errors, 1 warnings", stdout)
+
+    def test_strict_from_config_file(self):
+        self.write("mkdocs.yml", "site_name: Test\nplugins:\n  - awesome-pages:\n      strict: false\n")
+        self.write("docs/.pages", "nav:\n  - a.md\n")
+
+        code, _, _ = self.run_main("validate", "-f", os.path.join(self.directory, "mkdocs.yml"))
+
+        self.assertEqual(code, 0)
+
+    def test_strict_from_config_file_with_docs_dir_and_filename(self):
+        self.write("mkdocs.yml", "site_name: Test\nplugins:\n  - awesome-pages:\n      strict: false\n")
+        self.write("docs/.pages", "nav:\n  - a.md\n")
+        config_file = os.path.join(self.directory, "mkdocs.yml")
+
+        code, stdout, _ = self.run_main("validate", "-f", config_file, "-d", self.docs_dir, "--filename", ".pages")
+        self.assertEqual(code, 0)
+        self.assertIn("0 errors, 1 warnings", stdout)
+
+        code, _, _ = self.run_main(
+            "validate", "-f", config_file, "-d", self.docs_dir, "--filename", ".pages", "--strict"
+        )
+        self.assertEqual(code, 1)
@@ -0,0 +1,127 @@
+import json
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from mkdocs.structure.files import File
+
+from ..cache import MetaCache
+from ..compiled import CompiledMeta
+from ..meta import DuplicateRestItemError, MetaNavItem
+
+
+class TestCompiledMeta(TestCase):
+    def setUp(self):
+        temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_directory.cleanup)
+        self.docs_dir = os.path.join(temp_directory.name, "docs")
+        self.path = os.path.join(temp_directory.name, "compiled", "meta.json")
+        os.makedirs(os.path.join(self.docs_dir, "section"))
+        os.makedirs(os.path.join(self.docs_dir, ".hidden"))
+
+    def writeMetaFile(self, rel_path: str, contents: str) -> File:
+        with open(os.path.join(self.docs_dir, rel_path), "w") as f:
+            f.write(contents)
+        return File(rel_path, self.docs_dir, "", False)
+
+    def test_compile(self):
+        self.writeMetaFile(".pages", "nav:\n  - a.md\n")
+        self.writeMetaFile(os.path.join("section", ".pages"), "title: Section\n")
+        self.writeMetaFile(os.path.join(".hidden", ".pages"), "title: Hidden\n")
+
+        compiled, errors = CompiledMeta.compile(self.docs_dir, ".pages")
+
+        self.assertEqual(errors, [])
+        self.assertEqual(sorted(compiled.entries), [".pages", os.path.join("section", ".pages")])
+        self.assertEqual(compiled.entries[".pages"].meta.nav, [MetaNavItem("a.md")])
+        self.assertEqual(compiled.entries[".pages"].meta.path, ".pages")
+
+    def test_compile_collects_all_errors(self):
+        self.writeMetaFile(".pages", "title: 1\n")
+        self.writeMetaFile(os.path.join("section", ".pages"), "nav:\n  - ...\n  - ...\n")
+
+        compiled, errors = CompiledMeta.compile(self.docs_dir, ".pages")
+
+        self.assertEqual(compiled.entries, {})
+        self.assertEqual([type(error) for error in errors], [TypeError, DuplicateRestItemError])
+
+    def test_hit_after_write(self):
+        file = self.writeMetaFile(os.path.join("section", ".pages"), "title: Section\n")
+        compiled, _ = CompiledMeta.compile(self.docs_dir, ".pages")
+        compiled.write(self.path)
+
+        with mock.patch("mkdocs_awesome_pages_plugin.meta.yaml.load") as load:
+            meta = CompiledMeta.read(self.path).load(file)
+            load.assert_not_called()
+
+        self.assertEqual(meta.title, "Section")
+        self.assertEqual(meta.path, os.path.join("section", ".pages"))
+
+    def test_changed_file_is_parsed(self):
+        file = self.writeMetaFile(".pages", "title: Old\n")
+        compiled, _ = CompiledMeta.compile(self.docs_dir, ".pages")
+        compiled.write(self.path)
+
+        self.writeMetaFile(".pages", "title: New\n")
+        self.assertEqual(CompiledMeta.read(self.path).load(file).title, "New")
+
+    def test_new_file_is_parsed(self):
+        CompiledMeta.compile(self.docs_dir, ".pages")[0].write(self.path)
+        file = self.writeMetaFile(".pages", "title: New\n")
+
+        self.assertEqual(CompiledMeta.read(self.path).load(file).title, "New")
+
+    def test_fallback(self):
+        file = self.writeMetaFile(".pages", "title: New\n")
+        fallback = MetaCache(os.path.join(os.path.dirname(self.path), "cache"))
+        compiled = CompiledMeta.read(self.path, fallback)
+
+        self.assertEqual(compiled.load(file).title, "New")
+        self.assertIn(".pages", fallback.entries)
+
+        compiled.save()
+        self.assertTrue(os.path.isfile(os.path.join(os.path.dirname(self.path), "cache", MetaCache.FILENAME)))
+
+    def test_missing_file(self):
+        self.assertEqual(CompiledMeta.read(self.path).entries, {})
+
+    def test_other_version(self):
+        self.writeMetaFile(".pages", "title: Title\n")
+        CompiledMeta.compile(self.docs_dir, ".pages")[0].write(self.path)
+
+        with mock.patch.object(CompiledMeta, "FORMAT", CompiledMeta.FORMAT + 1):
+            self.assertEqual(CompiledMeta.read(self.path).entries, {})
+
+    def test_corrupt_file(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "wb") as f:
+            f.write(b'{"format": 2, "entries": {')
+
+        self.assertEqual(CompiledMeta.read(self.path).entries, {})
+
+    def test_written_as_json(self):
+        self.writeMetaFile(".pages", "title: Title\nunknown: 2024-01-01\nrules:\n  - match: a/**\n    hide: true\n")
+        CompiledMeta.compile(self.docs_dir, ".pages")[0].write(self.path)
+
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+        self.assertEqual(data["entries"][".pages"][1], {"title": "Title", "rules": [{"match": "a/**", "hide": True}]})
+
+        meta = CompiledMeta.read(self.path).entries[".pages"].meta
+        self.assertEqual((meta.title, meta.path), ("Title", ".pages"))
+        self.assertEqual([(rule.pattern, rule.meta.hide) for rule in meta.rules], [("a/**", True)])
+
+    def test_invalid_entry_is_validated(self):
+        file = self.writeMetaFile(".pages", "title: Title\n")
+        self.writeMetaFile(os.path.join("section", ".pages"), "title: Section\n")
+        CompiledMeta.compile(self.docs_dir, ".pages")[0].write(self.path)
+
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+        data["entries"][".pages"][1] = {"title": 1}
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+        compiled = CompiledMeta.read(self.path)
+        self.assertEqual(list(compiled.entries), [os.path.join("section", ".pages")])
+        self.assertEqual(compiled.load(file).title, "Title")
@@ -0,0 +1,97 @@
+import os
+import tempfile
+from typing import List
+from unittest import TestCase, skipIf
+
+from mkdocs.structure.files import File, Files
+
+from ..discovery import find_meta_files, index_meta_files
+
+try:
+    from mkdocs.structure.files import InclusionLevel
+except ImportError:  # MkDocs < 1.5
+    InclusionLevel = None
+
+
+class TestFindMetaFiles(TestCase):
+    def setUp(self):
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_directory.cleanup)
+        self.docs_dir = self.temp_directory.name
+
+    def createFiles(self, paths: List[str]) -> Files:
+        files = Files([])
+        for path in paths:
+            path = os.path.normpath(path)
+            abs_path = os.path.join(self.docs_dir, path)
+            os.makedirs(os.path.dirname(abs_path), exist_ok=True)
+            with open(abs_path, "w"):
+                pass
+            if not os.path.basename(path).startswith("."):
+                files.append(File(path, self.docs_dir, "", False))
+        return files
+
+    def test_root(self):
+        files = self.createFiles(["index.md", ".pages"])
+        self.assertEqual(find_meta_files(files, self.docs_dir, ".pages"), [".pages"])
+
+    def test_nested(self):
+        files = self.createFiles(["a/.pages", "a/b/c/page.md", "a/b/c/.pages", "d/page.md"])
+        self.assertEqual(
+            find_meta_files(files, self.docs_dir, ".pages"),
+            [os.path.join("a", ".pages"), os.path.join("a", "b", "c", ".pages")],
+        )
+
+    def test_filename(self):
+        files = self.createFiles(["a/page.md", "a/.pages", "a/.index"])
+        self.assertEqual(find_meta_files(files, self.docs_dir, ".index"), [os.path.join("a", ".index")])
+
+    def test_filename_candidates(self):
+        files = self.createFiles(["a/page.md", "a/.pages", "a/.pages.json", "b/page.md", "b/.pages"])
+        self.assertEqual(
+            find_meta_files(files, self.docs_dir, [".pages.json", ".pages"]),
+            [os.path.join("a", ".pages.json"), os.path.join("a", ".pages"), os.path.join("b", ".pages")],
+        )
+
+    def test_known_files(self):
+        files = self.createFiles(["a/page.md", "a/.pages"])
+        files.append(File(os.path.join("a", ".pages"), self.docs_dir, "", False))
+        self.assertEqual(find_meta_files(files, self.docs_dir, ".pages"), [])
+
+    def test_directory_without_pages(self):
+        files = self.createFiles(["a/image.png", "a/.pages"])
+        self.assertEqual(find_meta_files(files, self.docs_dir, ".pages"), [])
+
+    def test_hidden_directory(self):
+        files = self.createFiles([".hidden/page.md", ".hidden/.pages", ".hidden/a/.pages"])
+        self.assertEqual(find_meta_files(files, self.docs_dir, ".pages"), [])
+
+    @skipIf(InclusionLevel is None, "exclude_docs requires MkDocs >= 1.5")
+    def test_excluded_pages(self):
+        files = self.createFiles(["a/page.md", "a/.pages", "b/page.md", "b/.pages"])
+        files.get_file_from_path("a/page.md").inclusion = InclusionLevel.EXCLUDED
+        files.get_file_from_path("b/page.md").inclusion = InclusionLevel.NOT_IN_NAV
+        self.assertEqual(find_meta_files(files, self.docs_dir, ".pages"), [])
+
+
+class TestIndexMetaFiles(TestCase):
+    @staticmethod
+    def file(path: str) -> File:
+        return File(os.path.normpath(path), "docs", "", False)
+
+    def test_index(self):
+        files = [self.file("page.md"), self.file(".pages"), self.file("a/.pages"), self.file("a/.index")]
+        index = index_meta_files(files, ".pages")
+
+        self.assertEqual(sorted(index), ["", "a"])
+        self.assertEqual(index["a"].src_path, os.path.join("a", ".pages"))
+
+    def test_earliest_candidate_wins(self):
+        for files in (
+            [self.file("a/.pages"), self.file("a/.pages.json"), self.file("b/.pages")],
+            [self.file("a/.pages.json"), self.file("a/.pages"), self.file("b/.pages")],
+        ):
+            with self.subTest(files=[file.src_path for file in files]):
+                index = index_meta_files(files, [".pages.json", ".pages"])
+                self.assertEqual(index["a"].src_path, os.path.join("a", ".pages.json"))
+                self.assertEqual(index["b"].src_path, os.path.join("b", ".pages"))
@@ -0,0 +1,129 @@
+import io
+import os
+import shutil
+import subprocess
+import tempfile
+from unittest import TestCase, mock, skipUnless
+
+from .. import git_dates
+from ..git_dates import GitDates
+
+
+class TestParse(TestCase):
+    def test_parse(self):
+        dates = GitDates("head")
+        dates.parse(io.BytesIO(b"\x1e300\0\na.md\0b/c.md\0\x1e100\0\na.md\0"))
+
+        self.assertEqual(dates.last, {"a.md": 300, "b/c.md": 300})
+        self.assertEqual(dates.first, {"a.md": 100, "b/c.md": 300})
+
+    def test_parse_across_chunks(self):
+        dates = GitDates("head")
+        with mock.patch.object(GitDates, "CHUNK_SIZE", 3):
+            dates.parse(io.BytesIO(b"\x1e300\0\nsome/long/path.md\0\x1e100\0\nother.md\0"))
+
+        self.assertEqual(dates.last, {"some/long/path.md": 300, "other.md": 100})
+
+    def test_commit_dates_not_monotonic(self):
+        dates = GitDates("head")
+        dates.parse(io.BytesIO(b"\x1e200\0\na.md\0\x1e300\0\na.md\0\x1e100\0\na.md\0"))
+
+        self.assertEqual(dates.last_commit("a.md"), 300)
+        self.assertEqual(dates.first_commit("a.md"), 100)
+
+    def test_directories(self):
+        dates = GitDates("head")
+        dates.add("a/b/1.md", 100)
+        dates.add("a/2.md", 300)
+        dates.add("a/2.md", 50)
+        dates.add("c.md", 200)
+        dates.add_directories()
+
+        self.assertEqual(dates.last_commit("a/b"), 100)
+        self.assertEqual(dates.last_commit("a"), 300)
+        self.assertEqual(dates.first_commit("a"), 50)
+        self.assertEqual(dates.last_commit(""), 300)
+        self.assertIsNone(dates.last_commit("d"))
+        self.assertIsNone(dates.last_commit(None))
+
+
+@skipUnless(shutil.which("git"), "git is not installed")
+class TestLoad(TestCase):
+    def setUp(self):
+        temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_directory.cleanup)
+        self.repo = temp_directory.name
+        self.docs_dir = os.path.join(self.repo, "docs")
+        os.makedirs(self.docs_dir)
+        self.addCleanup(git_dates._loaded.clear)
+
+    def git(self, *args: str, timestamp: int = 0):
+        env = dict(
+            os.environ,
+            GIT_AUTHOR_NAME="test",
+            GIT_AUTHOR_EMAIL="test@example.com",
+            GIT_COMMITTER_NAME="test",
+            GIT_COMMITTER_EMAIL="test@example.com",
+            GIT_AUTHOR_DATE="@{} +0000".format(timestamp),
+            GIT_COMMITTER_DATE="@{} +0000".format(timestamp),
+        )
+        subprocess.run(["git", *args], cwd=self.repo, env=env, check=True, stdout=subprocess.DEVNULL)
+
+    def commit(self, timestamp: int, *paths: str):
+        for path in paths:
+            abs_path = os.path.join(self.repo, path)
+            os.makedirs(os.path.dirname(abs_path), exist_ok=True)
+            with open(abs_path, "a") as f:
+                f.write("{}\n".format(timestamp))
+        self.git("add", *paths)
+        self.git("commit", "-q", "-m", str(timestamp), timestamp=timestamp)
+
+    def test_load(self):
+        self.git("init", "-q")
+        self.commit(1_000_000_000, "docs/a.md", "docs/b/1.md", "README.md")
+        self.commit(1_100_000_000, "docs/a.md")
+        self.commit(1_200_000_000, "docs/b/2 with spaces.md", "README.md")
+
+        dates = GitDates.load(self.docs_dir)
+
+        self.assertEqual(
+            dates.last,
+            {
+                "a.md": 1_100_000_000,
+                "b/1.md": 1_000_000_000,
+                "b/2 with spaces.md": 1_200_000_000,
+                "b": 1_200_000_000,
+                "": 1_200_000_000,
+            },
+        )
+        self.assertEqual(dates.first_commit("a.md"), 1_000_000_000)
+        self.assertEqual(dates.first_commit("b"), 1_000_000_000)
+
+    def test_cached_against_head(self):
+        self.git("init", "-q")
+        self.commit(1_000_000_000, "docs/a.md")
+
+        with mock.patch.object(GitDates, "read", wraps=GitDates.read) as read_mock:
+            first = GitDates.load(self.docs_dir)
+            self.assertIs(GitDates.load(self.docs_dir), first)
+            self.assertEqual(read_mock.call_count, 1)
+
+            self.commit(1_100_000_000, "docs/a.md")
+            self.assertEqual(GitDates.load(self.docs_dir).last_commit("a.md"), 1_100_000_000)
+            self.assertEqual(read_mock.call_count, 2)
+
+    def test_not_a_checkout(self):
+        with mock.patch.dict(os.environ, {"GIT_CEILING_DIRECTORIES": self.repo}):
+            self.assertIsNone(GitDates.load(self.docs_dir))
+
+    def test_no_commits(self):
+        self.git("init", "-q")
+
+        self.assertIsNone(GitDates.load(self.docs_dir))
+
+    def test_git_not_installed(self):
+        self.git("init", "-q")
+        self.commit(1_000_000_000, "docs/a.md")
+
+        with mock.patch("subprocess.run", side_effect=FileNotFoundError):
+            self.assertIsNone(GitDates.load(self.docs_dir))
@@ -0,0 +1,139 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import mkdocs.utils
+import mkdocs.utils.meta
+
+from ..headers import get_header, read_header
+
+
+class TestReadHeader(TestCase):
+    def setUp(self):
+        temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_directory.cleanup)
+        self.path = os.path.join(temp_directory.name, "page.md")
+
+    def writePage(self, contents: bytes):
+        with open(self.path, "wb") as f:
+            f.write(contents)
+
+    @staticmethod
+    def title(source: str):
+        markdown, meta = mkdocs.utils.meta.get_data(source)
+        if "title" in meta:
+            return meta["title"]
+        return mkdocs.utils.get_markdown_title(markdown)
+
+    def assertSameTitle(self, contents: str, expected):
+        self.writePage(contents.encode("utf-8"))
+        with open(self.path, encoding="utf-8-sig") as f:
+            source = f.read()
+
+        self.assertEqual(self.title(source), expected)
+        self.assertEqual(self.title(read_header(self.path)), expected)
+        self.assertEqual(get_header(source), read_header(self.path))
+
+    def test_empty(self):
+        self.assertSameTitle("", None)
+
+    def test_heading(self):
+        self.assertSameTitle("# Title\n\nText\n", "Title")
+
+    def test_heading_without_newline(self):
+        self.assertSameTitle("# Title", "Title")
+
+    def test_heading_after_blank_lines(self):
+        self.assertSameTitle("\n  \n# Title\nText\n", "Title")
+
+    def test_text_before_heading(self):
+        self.assertSameTitle("Text\n# Title\n", None)
+
+    def test_setext_heading(self):
+        self.assertSameTitle("Title\n=====\n", None)
+
+    def test_windows_newlines(self):
+        self.assertSameTitle("---\r\ntitle: Meta\r\n---\r\n# Title\r\n", "Meta")
+
+    def test_yaml_title(self):
+        self.assertSameTitle("---\ntitle: Meta\n---\n# Title\n", "Meta")
+
+    def test_yaml_dots_delimiter(self):
+        self.assertSameTitle("---\ntitle: Meta\n...\n# Title\n", "Meta")
+
+    def test_yaml_without_title(self):
+        self.assertSameTitle("---\nauthor: Someone\n---\n\n\n# Title\n", "Title")
+
+    def test_yaml_non_string_title(self):
+        self.assertSameTitle("---\ntitle: 42\n---\n", 42)
+
+    def test_yaml_empty_block(self):
+        self.assertSameTitle("---\n---\n# Title\n---\n", None)
+
+    def test_yaml_not_closed(self):
+        self.assertSameTitle("---\ntitle: Meta\n# Title\n", None)
+
+    def test_yaml_closing_without_newline(self):
+        self.assertSameTitle("---\ntitle: Meta\n---", None)
+
+    def test_yaml_invalid(self):
+        self.assertSameTitle("---\ntitle: [Meta\n---\n# Title\n", None)
+
+    def test_yaml_not_a_dict(self):
+        self.assertSameTitle("---\n- Meta\n---\n# Title\n", None)
+
+    def test_horizontal_rule(self):
+        self.assertSameTitle("----\n# Title\n", None)
+
+    def test_multimarkdown_title(self):
+        self.assertSameTitle("Title: Meta\nAuthor: Someone\n\n# Title\n", "Meta")
+
+    def test_multimarkdown_continuation(self):
+        self.assertSameTitle("Title: Meta\n    More\n\n# Title\n", "Meta More")
+
+    def test_multimarkdown_without_title(self):
+        self.assertSameTitle("Author: Someone\n\n\n# Title\n", "Title")
+
+    def test_multimarkdown_followed_by_content(self):
+        self.assertSameTitle("Author: Someone\n# Title\n", "Title")
+
+    def test_byte_order_mark(self):
+        self.assertSameTitle("\ufeff# Title\n", "Title")
+
+    def test_reads_header_only(self):
+        # The invalid byte after the title would raise if the whole file was decoded
+        self.writePage(b"---\ntitle: Meta\n---\n\n# Title\n" + b"Text\n" * 100_000 + b"\xff\n")
+        self.assertEqual(read_header(self.path), "---\ntitle: Meta\n---\n\n# Title\n")
+
+    def test_invalid_encoding_in_header(self):
+        self.writePage(b"# Title \xff\n")
+        with self.assertRaises(ValueError):
+            read_header(self.path)
+
+
+class TestReadFrontMatter(TestCase):
+    def setUp(self):
+        temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_directory.cleanup)
+        self.path = os.path.join(temp_directory.name, "page.md")
+
+    def assertFrontMatter(self, contents: str, expected: dict):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(contents)
+        self.assertEqual(mkdocs.utils.meta.get_data(read_header(self.path))[1], expected)
+        self.assertEqual(mkdocs.utils.meta.get_data(get_header(contents))[1], expected)
+        self.assertEqual(mkdocs.utils.meta.get_data(contents)[1], expected)
+
+    def test_yaml(self):
+        self.assertFrontMatter("---\nweight: 2\ntags: [a, b]\n---\n# Title\n", {"weight": 2, "tags": ["a", "b"]})
+
+    def test_multimarkdown(self):
+        self.assertFrontMatter("Weight: 2\nDate: 2024-01-01\n\n# Title\n", {"weight": "2", "date": "2024-01-01"})
+
+    def test_none(self):
+        self.assertFrontMatter("# Title\n\nweight: 2\n", {})
+
+    def test_reads_front_matter_only(self):
+        with open(self.path, "wb") as f:
+            f.write(b"---\nweight: 2\n---\n" + b"Text\n" * 100_000 + b"\xff\n")
+        self.assertEqual(mkdocs.utils.meta.get_data(read_header(self.path))[1], {"weight": 2})
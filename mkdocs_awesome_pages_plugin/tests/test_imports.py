@@ -0,0 +1,15 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+
+class TestImports(TestCase):
+    def test_deferred_imports(self):
+        # MkDocs loads the plugin for every command, so dependencies only some sites need are imported on first use
+        code = "import sys, mkdocs_awesome_pages_plugin.plugin; print(' '.join(sorted(sys.modules)))"
+        modules = subprocess.run(
+            [sys.executable, "-c", code], stdout=subprocess.PIPE, universal_newlines=True, check=True
+        ).stdout.split()
+
+        for module in ["natsort", "wcmatch", "cProfile", "pstats"]:
+            self.assertNotIn(module, modules)
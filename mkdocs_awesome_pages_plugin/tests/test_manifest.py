@@ -0,0 +1,91 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from .. import manifest as manifest_module
+from ..manifest import Manifest
+from ..meta import Meta
+
+
+class TestParse(TestCase):
+    def test_entries(self):
+        manifest = Manifest.parse(
+            {"": {"nav": ["a.md", "..."]}, "guide": {"title": "Guide", "order": "desc"}}, "manifest.yml", ".pages"
+        )
+
+        self.assertEqual(len(manifest), 2)
+        self.assertEqual(manifest.get("").nav[0].value, "a.md")
+        self.assertEqual(manifest.get("guide").title, "Guide")
+        self.assertEqual(manifest.get("guide").order, Meta.ORDER_DESC)
+        self.assertEqual(manifest.get("guide").path, os.path.join("guide", ".pages"))
+        self.assertEqual(manifest.get("").path, ".pages")
+
+    def test_normalizes_directories(self):
+        manifest = Manifest.parse({".": {"title": "Root"}, "/a/b/": {"title": "B"}}, "manifest.yml", ".pages")
+
+        self.assertEqual(manifest.get("").title, "Root")
+        self.assertEqual(manifest.get(os.path.join("a", "b")).title, "B")
+        self.assertIn("a/b", manifest)
+        self.assertNotIn("a", manifest)
+        self.assertIsNone(manifest.get(None))
+
+    def test_empty(self):
+        manifest = Manifest.parse({}, "manifest.yml", ".pages")
+        self.assertEqual(len(manifest), 0)
+        self.assertNotIn("", manifest)
+
+    def test_invalid(self):
+        for contents in (["a"], {"a": "b"}, {1: {}}):
+            with self.subTest(contents=contents):
+                with self.assertRaisesRegex(TypeError, r"\[manifest.yml\]"):
+                    Manifest.parse(contents, "manifest.yml", ".pages")
+
+    def test_invalid_entry(self):
+        with self.assertRaisesRegex(TypeError, r"\[manifest.yml: guide\]"):
+            Manifest.parse({"guide": {"title": 1}}, "manifest.yml", ".pages")
+
+    def test_fingerprint(self):
+        first = Manifest.parse({"a": {"title": "A"}, "b": {"order": "asc"}}, "manifest.yml", ".pages")
+        second = Manifest.parse({"b": {"order": "asc"}, "a": {"title": "A"}}, "manifest.yml", ".pages")
+        changed = Manifest.parse({"a": {"title": "A"}, "b": {"order": "desc"}}, "manifest.yml", ".pages")
+
+        self.assertEqual(first.fingerprint(), second.fingerprint())
+        self.assertNotEqual(first.fingerprint(), changed.fingerprint())
+
+
+class TestLoad(TestCase):
+    def setUp(self):
+        temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_directory.cleanup)
+        self.directory = temp_directory.name
+        manifest_module._loaded.clear()
+        self.addCleanup(manifest_module._loaded.clear)
+
+    def write(self, name: str, contents: str) -> str:
+        path = os.path.join(self.directory, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(contents)
+        return path
+
+    def test_yaml(self):
+        path = self.write("manifest.yml", "guide:\n  title: Guide\n")
+        self.assertEqual(Manifest.load(path, ".pages").get("guide").title, "Guide")
+
+    def test_json(self):
+        path = self.write("manifest.json", json.dumps({"guide": {"title": "Guide"}}))
+        self.assertEqual(Manifest.load(path, ".pages").get("guide").title, "Guide")
+
+    def test_empty_file(self):
+        path = self.write("manifest.yml", "")
+        self.assertEqual(len(Manifest.load(path, ".pages")), 0)
+
+    def test_reused_while_unchanged(self):
+        path = self.write("manifest.yml", "guide:\n  title: Guide\n")
+        manifest = Manifest.load(path, ".pages")
+
+        self.assertIs(Manifest.load(path, ".pages"), manifest)
+        self.assertIsNot(Manifest.load(path, "_pages"), manifest)
+
+        self.write("manifest.yml", "guide:\n  title: Changed Guide\n")
+        self.assertEqual(Manifest.load(path, ".pages").get("guide").title, "Changed Guide")
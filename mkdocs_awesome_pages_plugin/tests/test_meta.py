@@ -1,9 +1,21 @@
-from pathlib import Path
-from unittest import TestCase, mock
+import json
+import os
+from pathlib import Path, PureWindowsPath
+from unittest import TestCase, mock, skipIf
 
+import yaml
 from mkdocs.structure.files import File, Files
 
-from ..meta import DuplicateRestItemError, Meta, MetaNavItem, MetaNavRestItem
+from ..meta import (
+    DuplicateRestItemError,
+    Meta,
+    MetaBatch,
+    MetaNavItem,
+    MetaNavRestItem,
+    MetaRule,
+    RestItemList,
+    RuleMatcher,
+)
 from .file_mock import FileMock
 
 
@@ -191,21 +203,278 @@ class TestLoadFrom(TestCase):
             Meta.load_from(".pages")
 
 
+class TestValidateOrderBy(TestCase):
+    def test_valid(self):
+        self.assertEqual(Meta.validate_order_by("title", ".pages"), "title")
+        self.assertEqual(Meta.validate_order_by("meta.weight", ".pages"), "meta.weight")
+        self.assertEqual(
+            Meta.validate_order_by(["meta.weight", "title", "filename"], ".pages"), ("meta.weight", "title", "filename")
+        )
+
+    def test_invalid(self):
+        for order_by in ["weight", "meta.", [], ["title", 1], {"meta.weight": 1}]:
+            with self.assertRaises(TypeError, msg=order_by):
+                Meta.validate_order_by(order_by, ".pages")
+
+    def test_reads_page_source(self):
+        self.assertFalse(Meta.reads_page_source(None))
+        self.assertFalse(Meta.reads_page_source("filename"))
+        self.assertTrue(Meta.reads_page_source("title"))
+        self.assertTrue(Meta.reads_page_source(("filename", "meta.weight")))
+
+
+class TestRules(TestCase):
+    def test_parse(self):
+        meta = Meta.parse(
+            "order: desc\n"
+            "rules:\n"
+            "  - match: api/**\n"
+            "    order_by: title\n"
+            "    collapse_single_pages: true\n"
+            "  - match: changelog\n"
+            "    nav: [latest.md, ...]\n",
+            ".pages",
+        )
+
+        self.assertEqual(meta.order, "desc")
+        self.assertEqual([rule.pattern for rule in meta.rules], ["api/**", "changelog"])
+        self.assertEqual(meta.rules[0].meta.order_by, "title")
+        self.assertTrue(meta.rules[0].meta.collapse_single_pages)
+        self.assertEqual(meta.rules[1].meta.nav, [MetaNavItem("latest.md"), MetaNavRestItem("...")])
+
+    def test_no_rules(self):
+        self.assertIsNone(Meta.parse("order: desc\n", ".pages").rules)
+
+    def test_invalid(self):
+        for rules in ["api/**", [{"order": "desc"}], [{"match": 1}], ["api/**"]]:
+            with self.assertRaises(TypeError, msg=rules):
+                Meta.parse(yaml.dump({"rules": rules}), ".pages")
+
+    def test_invalid_attribute(self):
+        with self.assertRaises(TypeError):
+            Meta.parse_rules([{"match": "api", "order": "up"}], "mkdocs.yml")
+
+    def test_with_rules(self):
+        meta = Meta(path="api/.pages", title="API", order="asc")
+        merged = meta.with_rules([Meta(order="desc", sort_type="natural"), Meta(title="Other", sort_type=None)])
+
+        self.assertEqual(merged.path, "api/.pages")
+        self.assertEqual(merged.title, "API")
+        self.assertEqual(merged.order, "asc")
+        self.assertEqual(merged.sort_type, "natural")
+        self.assertIsNone(meta.sort_type)
+
+    def test_with_rules_later_wins(self):
+        merged = Meta(path="api/.pages").with_rules([Meta(order="desc"), Meta(order="asc")])
+        self.assertEqual(merged.order, "asc")
+
+    def test_with_no_rules(self):
+        meta = Meta(path="api/.pages")
+        self.assertIs(meta.with_rules([]), meta)
+
+    def test_matcher(self):
+        first, second, third = Meta(order="asc"), Meta(order="desc"), Meta(hide=True)
+        matcher = RuleMatcher([MetaRule("api/**", first), MetaRule("api/*/internal", second), MetaRule("api", third)])
+
+        self.assertEqual(matcher.match("api"), [third])
+        self.assertEqual(matcher.match("api/v1"), [first])
+        self.assertEqual(matcher.match(os.path.join("api", "v1", "internal")), [first, second])
+        self.assertEqual(matcher.match("guide"), [])
+        self.assertEqual(matcher.match("guide/api"), [])
+
+    def test_empty_matcher(self):
+        matcher = RuleMatcher([])
+        self.assertEqual(len(matcher), 0)
+        self.assertEqual(matcher.match("api"), [])
+
+
+class TestPureYamlLoader(TestCase):
+    def test_same_result(self):
+        source = "title: Title\nnav:\n  - a.md\n  - Link: https://example.com\n  - ...\norder: desc\n"
+
+        meta = Meta.parse(source, ".pages")
+        with mock.patch("mkdocs_awesome_pages_plugin.meta._YamlLoader", yaml.SafeLoader):
+            pure_meta = Meta.parse(source, ".pages")
+
+        self.assertEqual(pure_meta.fingerprint(), meta.fingerprint())
+
+    def test_same_error(self):
+        with mock.patch("mkdocs_awesome_pages_plugin.meta._YamlLoader", yaml.SafeLoader):
+            with self.assertRaises(TypeError):
+                Meta.parse("title: [Title]\n", ".pages")
+
+
+class TestJson(TestCase):
+    SOURCE = '{"title": "Title", "nav": ["a.md", {"Link": "https://example.com"}, "..."], "order": "desc"}'
+
+    def test_same_result_as_yaml(self):
+        with mock.patch("mkdocs_awesome_pages_plugin.meta.yaml.load") as load:
+            meta = Meta.parse(self.SOURCE, ".pages")
+            load.assert_not_called()
+
+        self.assertEqual(meta.fingerprint(), Meta.parse(yaml.dump(json.loads(self.SOURCE)), ".pages").fingerprint())
+
+    def test_json_extension(self):
+        with mock.patch("mkdocs_awesome_pages_plugin.meta.yaml.load") as load:
+            meta = Meta.parse('\n  {"title": "Title"}', ".pages.json")
+            load.assert_not_called()
+        self.assertEqual(meta.title, "Title")
+
+    def test_yaml_flow_mapping(self):
+        self.assertEqual(Meta.parse("{title: Title}", ".pages").title, "Title")
+
+    def test_invalid_json(self):
+        with self.assertRaises(ValueError):
+            Meta.parse("{title: Title}", ".pages.json")
+
+    def test_same_error(self):
+        with self.assertRaisesRegex(TypeError, r'"title".*\[\.pages\.json\]'):
+            Meta.parse('{"title": ["Title"]}', ".pages.json")
+
+    def test_empty(self):
+        self.assertIsNone(Meta.parse("{}", ".pages.json").title)
+
+
 @mock.patch("builtins.open", new_callable=FileMock)
-class TestTryLoadFrom(TestCase):
-    def test_in_docs_dir(self, file_mock: FileMock):
-        docs_path = Path("docs").resolve()
-        file_mock[str(docs_path / ".pages")].read_data = "title: Section Title\n"
-        files = Files([File(".pages", str(docs_path), "", False)])
+class TestMetaBatch(TestCase):
+    def setUp(self):
+        self.docs_path = str(Path("docs").resolve())
 
-        meta = Meta.try_load_from_files(".pages", files)
-        self.assertEqual(meta.title, "Section Title")
+    def file(self, path: str) -> File:
+        return File(path, self.docs_path, "", False)
+
+    def test_parse_all(self, file_mock: FileMock):
+        file_mock[os.path.join(self.docs_path, ".pages")].read_data = "title: Title\n"
+        batch = MetaBatch()
+        batch.parse_all([self.file(".pages")])
+        file_mock.reset_mock()
+
+        meta = batch.load(self.file(".pages"))
+        self.assertEqual(meta.title, "Title")
         self.assertEqual(meta.path, ".pages")
+        file_mock.assert_not_called()
 
-    def test_file_not_found(self, file_mock: FileMock):
-        meta = Meta.try_load_from_files(".pages", Files([]))
-        self.assertIsInstance(meta, Meta)
+    def test_error_is_deferred(self, file_mock: FileMock):
+        file_mock[os.path.join(self.docs_path, ".pages")].read_data = "title: [Title]\n"
+        batch = MetaBatch()
+        batch.parse_all([self.file(".pages"), self.file("missing.pages")])
+
+        with self.assertRaises(TypeError):
+            batch.load(self.file(".pages"))
+        with self.assertRaises(FileNotFoundError):
+            batch.load(self.file("missing.pages"))
+
+    def test_skip_below_hidden(self, file_mock: FileMock):
+        file_mock[os.path.join(self.docs_path, "a", ".pages")].read_data = "hide: true\n"
+        file_mock[os.path.join(self.docs_path, "a", "b", ".pages")].read_data = "title: B\n"
+        file_mock[os.path.join(self.docs_path, "ab", ".pages")].read_data = "title: AB\n"
+        batch = MetaBatch()
+        batch.parse_all(
+            [
+                self.file(os.path.join("a", "b", ".pages")),
+                self.file(os.path.join("ab", ".pages")),
+                self.file(os.path.join("a", ".pages")),
+            ]
+        )
+
+        self.assertEqual(sorted(batch.results), [os.path.join("a", ".pages"), os.path.join("ab", ".pages")])
+
+    def test_unknown_file(self, file_mock: FileMock):
+        file_mock[os.path.join(self.docs_path, ".pages")].read_data = "title: Title\n"
 
-    def test_none_path(self, file_mock: FileMock):
-        meta = Meta.try_load_from_files(None, Files([]))
+        self.assertEqual(MetaBatch().load(self.file(".pages")).title, "Title")
+
+    def test_try_load_file(self, file_mock: FileMock):
+        files = Files([self.file(".pages")])
+        batch = MetaBatch()
+        batch.parse_all(files)
+
+        meta = Meta.try_load_file(self.file(".pages"), batch)
         self.assertIsInstance(meta, Meta)
+        self.assertEqual(meta.path, ".pages")
+
+
+class TestRestMatcher(TestCase):
+    PATHS = [
+        "index.md",
+        "introduction.md",
+        "introduction-1.md",
+        "page-10.md",
+        "section/introduction.md",
+        "section/page-2.md",
+        "section/sub/page-a.md",
+        ".hidden.md",
+        "a/b.txt",
+    ]
+
+    @staticmethod
+    def createList(*values: str) -> RestItemList:
+        items = RestItemList()
+        for value in values:
+            items.append(MetaNavRestItem(value))
+        return items
+
+    def assertMatchesLikeItems(self, items: RestItemList):
+        for path in self.PATHS + [None]:
+            expected = next((item for item in items if item.matches(path)), None)
+            self.assertIs(items.matcher.match(path), expected, path)
+
+    def test_empty(self):
+        self.assertMatchesLikeItems(self.createList())
+
+    def test_all(self):
+        self.assertMatchesLikeItems(self.createList("..."))
+
+    def test_globs(self):
+        self.assertMatchesLikeItems(
+            self.createList("... | introduction*.md", "... | **/page-*.md", "... | *.md", "...")
+        )
+
+    def test_regexes(self):
+        self.assertMatchesLikeItems(
+            self.createList("... | regex=page-[0-9]+", "... | regex=^section/", "... | regex=md$")
+        )
+
+    def test_first_pattern_wins(self):
+        # "page" appears later in the path than "section", but is listed first
+        items = self.createList("... | regex=page", "... | regex=section", "...")
+        self.assertIs(items.matcher.match("section/page-2.md"), items.patterns[0])
+        self.assertMatchesLikeItems(items)
+
+    def test_patterns_before_all(self):
+        items = self.createList("...", "... | *.md")
+        self.assertIs(items.matcher.match("index.md"), items.patterns[0])
+        self.assertIs(items.matcher.match("a/b.txt"), items.all)
+
+    def test_mixed(self):
+        self.assertMatchesLikeItems(
+            self.createList("... | regex=-[0-9]", "... | section/**", "... | flat | regex=^intro", "... | glob=*.md")
+        )
+
+    @skipIf(os.sep != "/", "glob patterns are matched one by one on Windows")
+    def test_single_scan(self):
+        items = self.createList("... | regex=page-[0-9]+", "... | **/introduction.md", "... | *.md")
+        self.assertEqual(len(items.matcher.segments), 1)
+
+    def test_not_combinable(self):
+        items = self.createList(
+            "... | regex=(intro)duction-\\1",
+            "... | regex=(?i)INDEX",
+            "... | regex=(page)-([0-9]+)",
+            "... | *.md",
+        )
+        self.assertMatchesLikeItems(items)
+        self.assertEqual(len(items.matcher.segments), 4)
+
+    @mock.patch("mkdocs_awesome_pages_plugin.meta.PurePath", PureWindowsPath)
+    def test_backslash_path(self):
+        items = self.createList("... | regex=^section/sub/", "... | regex=^section/page", "...")
+        self.assertIs(items.matcher.match("section\\sub\\page-a.md"), items.patterns[0])
+        self.assertIs(items.matcher.match("section\\page-2.md"), items.patterns[1])
+        self.assertIs(items.matcher.match("index.md"), items.all)
+
+    def test_matcher_is_rebuilt_after_append(self):
+        items = self.createList("... | *.txt")
+        self.assertIsNone(items.matcher.match("index.md"))
+        items.append(MetaNavRestItem("... | *.md"))
+        self.assertIs(items.matcher.match("index.md"), items.patterns[1])
@@ -0,0 +1,119 @@
+import builtins
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from mkdocs.structure.files import File
+from mkdocs.structure.pages import Page
+
+from ..page_sources import PageSources
+from ..plugin import AwesomePagesPlugin
+
+
+class TestPageSources(TestCase):
+    def setUp(self):
+        temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_directory.cleanup)
+        self.docs_dir = temp_directory.name
+
+    def writeFile(self, rel_path: str, contents: str) -> File:
+        with open(os.path.join(self.docs_dir, rel_path), "w", encoding="utf-8") as f:
+            f.write(contents)
+        return File(rel_path, self.docs_dir, "", False)
+
+    def test_read_and_take(self):
+        sources = PageSources()
+        file = self.writeFile("a.md", "﻿# A\n\nText")
+
+        self.assertEqual(sources.read(file), "# A\n\nText")
+        self.assertEqual(sources.take(file.abs_src_path), "# A\n\nText")
+        self.assertIsNone(sources.take(file.abs_src_path))
+        self.assertEqual(sources.size, 0)
+
+    def test_read_from_buffer(self):
+        sources = PageSources()
+        file = self.writeFile("a.md", "# A")
+        sources.read(file)
+
+        with mock.patch("builtins.open", wraps=builtins.open) as open_mock:
+            self.assertEqual(sources.read(file), "# A")
+            open_mock.assert_not_called()
+
+    def test_read_too_large(self):
+        sources = PageSources(max_size=10)
+        file = self.writeFile("a.md", "# A\n\n" + "a" * 10)
+
+        with mock.patch("builtins.open", wraps=builtins.open) as open_mock:
+            self.assertIsNone(sources.read(file))
+            open_mock.assert_not_called()
+        self.assertEqual(sources.size, 0)
+
+    def test_take_unknown(self):
+        self.assertIsNone(PageSources().take("unknown.md"))
+        self.assertIsNone(PageSources().take(None))
+
+    def test_full_buffer_keeps_sources(self):
+        sources = PageSources(max_size=10)
+        self.assertTrue(sources.put("a.md", "aaaa"))
+        self.assertTrue(sources.put("b.md", "bbbb"))
+        self.assertFalse(sources.put("c.md", "cccc"))
+
+        self.assertEqual(list(sources.sources), ["a.md", "b.md"])
+        self.assertEqual(sources.size, 8)
+        self.assertIsNone(sources.take("c.md"))
+
+    def test_read_when_full(self):
+        sources = PageSources(max_size=10)
+        first = self.writeFile("a.md", "# A\n\naaa")
+        second = self.writeFile("b.md", "# B\n\nbbb")
+        self.assertEqual(sources.read(first), "# A\n\naaa")
+
+        with mock.patch("builtins.open", wraps=builtins.open) as open_mock:
+            self.assertIsNone(sources.read(second))
+            open_mock.assert_not_called()
+        self.assertEqual(list(sources.sources), [first.abs_src_path])
+
+        # Handing a source over to MkDocs makes room for the next one
+        sources.take(first.abs_src_path)
+        self.assertEqual(sources.read(second), "# B\n\nbbb")
+
+    def test_replace(self):
+        sources = PageSources(max_size=10)
+        sources.put("a.md", "aaaa")
+        sources.put("a.md", "aaaaaa")
+
+        self.assertEqual(sources.size, 6)
+        self.assertEqual(sources.take("a.md"), "aaaaaa")
+
+    def test_too_large(self):
+        sources = PageSources(max_size=10)
+        sources.put("a.md", "aaaa")
+        sources.put("b.md", "b" * 11)
+
+        self.assertEqual(list(sources.sources), ["a.md"])
+
+
+class TestPageReadSourceEvent(TestCase):
+    def test_not_registered_by_default(self):
+        plugin = AwesomePagesPlugin()
+        plugin.load_config({})
+        self.assertFalse(hasattr(plugin, "on_page_read_source"))
+
+    def test_registered_when_enabled(self):
+        plugin = AwesomePagesPlugin()
+        plugin.load_config({"page_sources": True})
+        plugin.page_sources = PageSources()
+        plugin.page_sources.put(os.path.abspath("a.md"), "# A")
+
+        page = Page(None, File("a.md", os.path.abspath("."), "", False), {})
+        self.assertEqual(plugin.on_page_read_source(page=page, config={}), "# A")
+
+    def test_file_without_source_on_disk(self):
+        plugin = AwesomePagesPlugin()
+        plugin.load_config({"page_sources": True})
+        plugin.page_sources = PageSources()
+        plugin.page_sources.put(os.path.abspath("a.md"), "# A")
+
+        page = Page(None, File("a.md", os.path.abspath("."), "", False), {})
+        page.file.abs_src_path = None  # e.g. content set through File.content_string by another plugin
+        self.assertIsNone(plugin.on_page_read_source(page=page, config={}))
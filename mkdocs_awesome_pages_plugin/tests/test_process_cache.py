@@ -0,0 +1,112 @@
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from mkdocs.structure.files import File
+
+from ..meta import MetaBatch
+from ..process_cache import ProcessCache
+
+
+class TestProcessCache(TestCase):
+    def setUp(self):
+        temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_directory.cleanup)
+        self.docs_dir = temp_directory.name
+        self.cache = ProcessCache()
+
+    def writeFile(self, rel_path: str, contents: str, mtime_ns: int = 1_000_000_000) -> File:
+        abs_path = os.path.join(self.docs_dir, rel_path)
+        with open(abs_path, "w") as f:
+            f.write(contents)
+        os.utime(abs_path, ns=(mtime_ns, mtime_ns))
+        return File(rel_path, self.docs_dir, "", False)
+
+    def test_hit(self):
+        file = self.writeFile("a.md", "# A")
+        load = mock.Mock(return_value="A")
+
+        self.assertEqual(self.cache.get_or_load(ProcessCache.HEADER, file, load), "A")
+        self.assertEqual(self.cache.get_or_load(ProcessCache.HEADER, file, load), "A")
+        load.assert_called_once()
+
+    def test_kinds_are_separate(self):
+        file = self.writeFile("a.md", "# A")
+
+        self.cache.get_or_load(ProcessCache.HEADER, file, lambda: "A")
+        self.assertEqual(self.cache.get_or_load(ProcessCache.META, file, lambda: "meta"), "meta")
+
+    def test_changed_mtime(self):
+        file = self.writeFile("a.md", "# A")
+        self.cache.get_or_load(ProcessCache.HEADER, file, lambda: "A")
+
+        self.writeFile("a.md", "# A", mtime_ns=2_000_000_000)
+        self.assertEqual(self.cache.get_or_load(ProcessCache.HEADER, file, lambda: "B"), "B")
+        self.assertEqual(len(self.cache.entries), 1)
+
+    def test_changed_size(self):
+        file = self.writeFile("a.md", "# A")
+        self.cache.get_or_load(ProcessCache.HEADER, file, lambda: "A")
+
+        self.writeFile("a.md", "# Changed")
+        self.assertEqual(self.cache.get_or_load(ProcessCache.HEADER, file, lambda: "Changed"), "Changed")
+
+    def test_errors_are_not_cached(self):
+        file = self.writeFile("a.md", "# A")
+
+        with self.assertRaises(ValueError):
+            self.cache.get_or_load(ProcessCache.HEADER, file, mock.Mock(side_effect=ValueError))
+        self.assertEqual(self.cache.get_or_load(ProcessCache.HEADER, file, lambda: "A"), "A")
+
+    def test_missing_file(self):
+        file = File("missing.md", self.docs_dir, "", False)
+        load = mock.Mock(return_value="A")
+
+        self.cache.get_or_load(ProcessCache.HEADER, file, load)
+        self.cache.get_or_load(ProcessCache.HEADER, file, load)
+        self.assertEqual(load.call_count, 2)
+        self.assertEqual(len(self.cache.entries), 0)
+
+    def test_max_entries(self):
+        cache = ProcessCache(max_entries=2)
+        files = [self.writeFile(name, name) for name in ["a.md", "b.md", "c.md"]]
+        for file in files:
+            cache.get_or_load(ProcessCache.HEADER, file, lambda: "title")
+        cache.get_or_load(ProcessCache.HEADER, files[1], lambda: "title")  # mark "b.md" as recently used
+
+        self.assertEqual([key[2] for key in cache.entries], ["c.md", "b.md"])
+
+    def test_file_without_src_dir(self):
+        file = self.writeFile("a.md", "# A")
+        legacy = File("a.md", self.docs_dir, "", False)
+        legacy.abs_src_path = legacy.abs_src_path  # computed from src_dir on MkDocs >= 1.6
+        if hasattr(legacy, "src_dir"):
+            del legacy.src_dir  # MkDocs < 1.5 has no src_dir
+        load = mock.Mock(return_value="A")
+
+        self.assertEqual(self.cache.get_or_load(ProcessCache.HEADER, legacy, load), "A")
+        self.assertEqual(self.cache.get_or_load(ProcessCache.HEADER, file, load), "A")
+        load.assert_called_once()
+
+        self.cache.prune(self.docs_dir, [])
+        self.assertEqual(len(self.cache.entries), 0)
+
+    def test_prune(self):
+        files = [self.writeFile(name, name) for name in ["a.md", "b.md"]]
+        for file in files:
+            self.cache.get_or_load(ProcessCache.HEADER, file, lambda: "title")
+        other = File("a.md", os.path.join(self.docs_dir, "other"), "", False)
+        other_dir = os.path.join(self.docs_dir, "other")
+        self.cache.entries[(ProcessCache.HEADER, other_dir, other.src_path)] = ((0, 0), "other")
+
+        self.cache.prune(self.docs_dir, ["b.md"])
+        self.assertEqual([key[1:] for key in self.cache.entries], [(self.docs_dir, "b.md"), (other_dir, "a.md")])
+
+    def test_meta_batch(self):
+        file = self.writeFile(".pages", "title: Title\n")
+
+        with mock.patch("mkdocs_awesome_pages_plugin.meta.process_cache", self.cache):
+            self.assertEqual(MetaBatch().load(file).title, "Title")
+            with mock.patch("mkdocs_awesome_pages_plugin.meta.yaml.load") as load:
+                self.assertEqual(MetaBatch().load(file).title, "Title")
+                load.assert_not_called()
@@ -0,0 +1,42 @@
+import os
+import pstats
+import tempfile
+from unittest import TestCase
+
+from ..profiling import HookProfiler
+
+
+def busy_function():
+    return sum(range(1000))
+
+
+class TestHookProfiler(TestCase):
+    def setUp(self):
+        temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_directory.cleanup)
+        self.directory = os.path.join(temp_directory.name, "profile")
+
+    def test_dump_stats(self):
+        profiler = HookProfiler(self.directory)
+        with profiler.profile("on_nav"):
+            busy_function()
+
+        stats = pstats.Stats(profiler.path("on_nav"))
+        self.assertIn("busy_function", [function for _, _, function in stats.stats])
+
+    def test_dump_stats_on_exception(self):
+        profiler = HookProfiler(self.directory)
+        with self.assertRaises(ValueError):
+            with profiler.profile("on_files"):
+                raise ValueError
+
+        self.assertTrue(os.path.isfile(profiler.path("on_files")))
+
+    def test_top_summary(self):
+        profiler = HookProfiler(self.directory, top=5)
+        with self.assertLogs("mkdocs.plugins.awesome-pages", "INFO") as logs:
+            with profiler.profile("on_config"):
+                busy_function()
+
+        self.assertIn("profile of on_config", logs.output[0])
+        self.assertIn("busy_function", logs.output[0])
@@ -0,0 +1,94 @@
+import os
+import time
+from typing import Callable, List
+
+from mkdocs.structure.files import File, Files
+from mkdocs.structure.nav import Section
+from mkdocs.structure.pages import Page
+
+from ..meta import Meta, MetaBatch, MetaNavItem, MetaNavRestItem
+from ..navigation import NavigationMeta
+from ..options import Options
+from ..plugin import AwesomePagesPlugin
+from .navigation.base import NavigationTestCase
+
+
+class TestScaling(NavigationTestCase):
+    """Rest handling must scale linearly: ten times the pages may take roughly ten times as long, not a hundred"""
+
+    SMALL = 10_000
+    LARGE = 100_000
+    MAX_RATIO = 30
+
+    @staticmethod
+    def createPages(count: int, directory: str = "") -> List[Page]:
+        docs_dir = os.path.abspath("docs")
+        return [
+            Page("Page {}".format(i), File(os.path.join(directory, "{}.md".format(i)), docs_dir, "", False), {})
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def measure(run: Callable[[], None]) -> float:
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    def assertLinear(self, create_run: Callable[[int], Callable[[], None]]):
+        small = self.measure(create_run(self.SMALL))
+        large = self.measure(create_run(self.LARGE))
+        self.assertLess(large, small * self.MAX_RATIO, "{:.3f}s vs {:.3f}s".format(large, small))
+
+    def test_generate_rest_blocks(self):
+        def create_run(count: int):
+            plugin = AwesomePagesPlugin()
+            plugin.rest_items.append(MetaNavRestItem("... | regex=5\\.md$"))
+            plugin.rest_items.append(MetaNavRestItem("..."))
+            pages = self.createPages(count // 2)
+            section_pages = self.createPages(count // 2, "section")
+            explicit_files = {page.file.src_path for page in pages[: count // 100] + section_pages[: count // 100]}
+            # the remaining top-level pages that aren't matched by the regex plus the section
+            expected_all = len([page for page in pages[count // 100 :] if not page.file.src_path.endswith("5.md")]) + 1
+
+            def run():
+                items = pages + [Section("Section", list(section_pages))]
+                blocks = plugin._generate_rest_blocks(items, explicit_files)
+                self.assertEqual(len(items), count // 100 + 1)
+                self.assertEqual(len(blocks[plugin.rest_items.all]), expected_all)
+
+            return run
+
+        self.assertLinear(create_run)
+
+    def test_nav_rest(self):
+        def create_run(count: int):
+            pages = self.createPages(count)
+            nav = [MetaNavItem("{}.md".format(i)) for i in range(0, count, 100)] + [MetaNavRestItem("...")]
+
+            def run():
+                navigation = self.createAwesomeNavigation(pages + [Meta(nav=nav)])
+                self.assertEqual(len(navigation.items), count)
+
+            return run
+
+        self.assertLinear(create_run)
+
+    def test_gather_metadata(self):
+        def create_run(count: int):
+            docs_dir = os.path.abspath("docs")
+            sections = [Section(str(i), self.createPages(10, str(i))) for i in range(count // 10)]
+            meta_files = [File(os.path.join(str(i), ".pages"), docs_dir, "", False) for i in range(count // 10)]
+            files = Files([page.file for section in sections for page in section.children] + meta_files)
+            options = Options(filename=".pages", collapse_single_pages=False, strict=True)
+
+            def run():
+                # The meta files don't exist, which is handled like a missing meta file
+                meta = NavigationMeta(sections, options, files, set(), MetaBatch())
+                self.assertEqual(meta.sections[sections[-1]].path, meta_files[-1].src_path)
+
+            return run
+
+        self.assertLinear(create_run)
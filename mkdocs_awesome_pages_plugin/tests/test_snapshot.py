@@ -0,0 +1,73 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from mkdocs.structure.files import File
+from mkdocs.structure.nav import Link, Section
+from mkdocs.structure.pages import Page
+
+from ..snapshot import NavSnapshot
+
+
+class TestNavSnapshot(TestCase):
+    def setUp(self):
+        temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_directory.cleanup)
+        self.docs_dir = temp_directory.name
+        self.snapshot = NavSnapshot(os.path.join(self.docs_dir, "cache", "nav.json"))
+
+    def page(self, path: str, title=None) -> Page:
+        with open(os.path.join(self.docs_dir, path), "w") as f:
+            f.write("# {}\n".format(path))
+        return Page(title, File(path, self.docs_dir, "", False), {})
+
+    def test_save_and_load(self):
+        a, b = self.page("a.md"), self.page("b.md", "B")
+        self.snapshot.save("fingerprint", [Section("Section", [b, Link("Link", "https://example.com")]), a])
+
+        new_a, new_b = self.page("a.md"), self.page("b.md")
+        items = self.snapshot.load("fingerprint", [new_a, new_b])
+
+        self.assertEqual(len(items), 2)
+        self.assertEqual(items[0].title, "Section")
+        self.assertIs(items[0].children[0], new_b)
+        self.assertEqual(new_b.title, "B")
+        self.assertEqual((items[0].children[1].title, items[0].children[1].url), ("Link", "https://example.com"))
+        self.assertIs(items[1], new_a)
+
+    def test_fingerprint_mismatch(self):
+        self.snapshot.save("fingerprint", [self.page("a.md")])
+        self.assertIsNone(self.snapshot.load("other", [self.page("a.md")]))
+
+    def test_missing_page(self):
+        self.snapshot.save("fingerprint", [self.page("a.md")])
+        self.assertIsNone(self.snapshot.load("fingerprint", [self.page("b.md")]))
+
+    def test_missing_snapshot(self):
+        self.assertIsNone(self.snapshot.load("fingerprint", []))
+
+    def test_fingerprint(self):
+        items = [self.page("a.md"), Section("Section", [self.page("b.md")])]
+        fingerprint = NavSnapshot.fingerprint({}, {}, items, headers=False)
+
+        self.assertEqual(NavSnapshot.fingerprint({}, {}, items, headers=False), fingerprint)
+        self.assertNotEqual(NavSnapshot.fingerprint({"order": "asc"}, {}, items, headers=False), fingerprint)
+        self.assertNotEqual(NavSnapshot.fingerprint({}, {".pages": b"title: A\n"}, items, headers=False), fingerprint)
+        self.assertNotEqual(NavSnapshot.fingerprint({}, {}, items[:1], headers=False), fingerprint)
+        self.assertNotEqual(
+            NavSnapshot.fingerprint({}, {}, [items[0], items[1].children[0]], headers=False), fingerprint
+        )
+        self.assertNotEqual(NavSnapshot.fingerprint({}, {}, items, headers=True), fingerprint)
+
+    def test_fingerprint_unreadable_page(self):
+        missing = Page(None, File("missing.md", self.docs_dir, "", False), {})
+        self.assertIsNotNone(NavSnapshot.fingerprint({}, {}, [missing], headers=False))
+        self.assertIsNone(NavSnapshot.fingerprint({}, {}, [missing], headers=True))
+
+    def test_read_meta_files(self):
+        with open(os.path.join(self.docs_dir, ".pages"), "w") as f:
+            f.write("title: Title\n")
+        meta_file = File(".pages", self.docs_dir, "", False)
+
+        self.assertEqual(NavSnapshot.read_meta_files([meta_file]), {".pages": b"title: Title\n"})
+        self.assertIsNone(NavSnapshot.read_meta_files([meta_file, File("missing.pages", self.docs_dir, "", False)]))
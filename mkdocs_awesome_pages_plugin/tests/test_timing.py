@@ -0,0 +1,64 @@
+from unittest import TestCase, mock
+
+from .. import timing
+
+
+class TestTiming(TestCase):
+    def setUp(self):
+        self.addCleanup(timing.stop)
+
+    def test_disabled(self):
+        @timing.timed("function")
+        def function(value):
+            return value * 2
+
+        self.assertEqual(function(21), 42)
+        timing.count("counter")
+        with timing.phase("phase"):
+            pass
+        self.assertIsNone(timing.stop())
+
+    def test_phases_and_counters(self):
+        @timing.timed("function")
+        def function():
+            timing.count("counter", 2)
+
+        timings = timing.start()
+        with mock.patch(
+            "mkdocs_awesome_pages_plugin.timing.time.perf_counter", side_effect=[1.0, 1.5, 2.0, 2.5, 3.0, 4.0]
+        ):
+            function()
+            with timing.phase("phase"):
+                function()
+
+        self.assertIs(timing.stop(), timings)
+        self.assertEqual(
+            timings.to_dict(),
+            {
+                "phases": {"function": {"calls": 2, "seconds": 1.0}, "phase": {"calls": 1, "seconds": 2.0}},
+                "counters": {"counter": 4},
+            },
+        )
+
+    def test_recursion_is_timed_once(self):
+        @timing.timed("function")
+        def function(depth):
+            if depth > 0:
+                function(depth - 1)
+
+        timings = timing.start()
+        with mock.patch("mkdocs_awesome_pages_plugin.timing.time.perf_counter", side_effect=[1.0, 3.0]):
+            function(3)
+
+        self.assertEqual(timings.phases["function"], [4, 2.0])
+
+    def test_exception(self):
+        @timing.timed("function")
+        def function():
+            raise ValueError
+
+        timings = timing.start()
+        with self.assertRaises(ValueError):
+            function()
+        self.assertEqual(timings.phases["function"][0], 1)
+        self.assertIsNotNone(timings.enter("function"))  # no longer considered running
@@ -0,0 +1,35 @@
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from ..utils import atomic_write
+
+
+class TestAtomicWrite(TestCase):
+    def setUp(self):
+        temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_directory.cleanup)
+        self.directory = temp_directory.name
+        self.path = os.path.join(self.directory, "sub", "file.bin")
+
+    def read(self) -> bytes:
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def test_creates_directory(self):
+        atomic_write(self.path, b"data")
+        self.assertEqual(self.read(), b"data")
+
+    def test_replaces_file(self):
+        atomic_write(self.path, b"old")
+        atomic_write(self.path, b"new")
+        self.assertEqual(self.read(), b"new")
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["file.bin"])
+
+    def test_failure_keeps_old_file(self):
+        atomic_write(self.path, b"old")
+        with mock.patch("os.replace", side_effect=OSError("failed")):
+            with self.assertRaises(OSError):
+                atomic_write(self.path, b"new")
+        self.assertEqual(self.read(), b"old")
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["file.bin"])
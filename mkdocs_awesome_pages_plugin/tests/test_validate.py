@@ -0,0 +1,80 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from ..validate import validate_all, validate_file
+
+
+class TestValidate(TestCase):
+    def setUp(self):
+        temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_directory.cleanup)
+        self.docs_dir = temp_directory.name
+
+    def write(self, rel_path: str, contents: str = ""):
+        path = os.path.join(self.docs_dir, os.path.normpath(rel_path))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(contents)
+
+    def test_valid(self):
+        self.write("a.md")
+        self.write("section/b.md")
+        self.write(".pages", "nav:\n  - section\n  - Link: https://example.com\n  - Group:\n    - a.md\n  - ...\n")
+
+        self.assertEqual(validate_file(self.docs_dir, ".pages"), (".pages", [], []))
+
+    def test_invalid_attribute(self):
+        self.write(".pages", "title: [Title]\n")
+
+        result = validate_file(self.docs_dir, ".pages")
+        self.assertEqual(len(result.errors), 1)
+        self.assertIn('"title"', result.errors[0])
+
+    def test_duplicate_rest_item(self):
+        self.write(".pages", "nav:\n  - ...\n  - ...\n")
+
+        result = validate_file(self.docs_dir, ".pages")
+        self.assertEqual(len(result.errors), 1)
+        self.assertIn("Duplicate rest entry", result.errors[0])
+
+    def test_nav_entry_not_found(self):
+        self.write("a.md")
+        self.write("image.png")
+        self.write(".pages", "nav:\n  - a.md\n  - b.md\n  - Group:\n    - image.png\n")
+
+        result = validate_file(self.docs_dir, ".pages")
+        self.assertEqual(
+            result.errors,
+            ['Nav entry "b.md" not found. [.pages]', 'Nav entry "image.png" not found. [.pages]'],
+        )
+
+    def test_nav_entry_not_found_without_strict(self):
+        self.write(".pages", "nav:\n  - b.md\n")
+
+        result = validate_file(self.docs_dir, ".pages", strict=False)
+        self.assertEqual(result.errors, [])
+        self.assertEqual(result.warnings, ['Nav entry "b.md" not found. [.pages]'])
+
+    def test_rules_outside_root(self):
+        self.write("section/.pages", "rules:\n  - match: a\n    title: A\n")
+
+        result = validate_file(self.docs_dir, os.path.join("section", ".pages"))
+        self.assertEqual(result.errors, [])
+        self.assertEqual(len(result.warnings), 1)
+
+    def test_all_errors_are_reported(self):
+        for jobs in (1, 2):
+            with self.subTest(jobs=jobs):
+                self.write("a/.pages", "title: 1\n")
+                self.write("b/.pages", "nav:\n  - missing.md\n")
+                self.write("c/.pages", "title: C\n")
+                self.write(".hidden/.pages", "title: 1\n")
+
+                results = validate_all(self.docs_dir, ".pages", jobs=jobs)
+
+                self.assertEqual(
+                    [result.path for result in results],
+                    [os.path.join(directory, ".pages") for directory in ("a", "b", "c")],
+                )
+                self.assertEqual([len(result.errors) for result in results], [1, 1, 0])
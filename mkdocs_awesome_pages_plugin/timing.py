@@ -0,0 +1,104 @@
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+
+class Timings:
+    """Wall time and call count per phase of a build, plus counters of the files that were read"""
+
+    def __init__(self):
+        self.phases: Dict[str, List[float]] = {}  # name -> [calls, seconds]
+        self.counters: Dict[str, int] = {}
+        self._running: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def enter(self, name: str) -> Optional[float]:
+        # Only the outermost call of a recursive phase is timed, so nothing is counted twice
+        running = self._running.get(name, 0)
+        self._running[name] = running + 1
+        return time.perf_counter() if running == 0 else None
+
+    def exit(self, name: str, start: Optional[float]):
+        self._running[name] -= 1
+        phase = self.phases.setdefault(name, [0, 0.0])
+        phase[0] += 1
+        if start is not None:
+            phase[1] += time.perf_counter() - start
+
+    def count(self, name: str, amount: int = 1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def to_dict(self) -> dict:
+        return {
+            "phases": {name: {"calls": calls, "seconds": seconds} for name, (calls, seconds) in self.phases.items()},
+            "counters": dict(self.counters),
+        }
+
+    def summary(self) -> str:
+        lines = [
+            "{}: {:.3f}s ({} calls)".format(name, seconds, calls) for name, (calls, seconds) in self.phases.items()
+        ]
+        lines.extend("{}: {}".format(name, value) for name, value in self.counters.items())
+        return "\n".join(lines)
+
+    def write(self, path: str):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+# Timings of the build in progress, None if instrumentation is off
+_current: Optional[Timings] = None
+
+
+def start() -> Timings:
+    global _current
+    _current = Timings()
+    return _current
+
+
+def stop() -> Optional[Timings]:
+    global _current
+    timings, _current = _current, None
+    return timings
+
+
+def count(name: str, amount: int = 1):
+    if _current is not None:
+        _current.count(name, amount)
+
+
+@contextmanager
+def phase(name: str):
+    timings = _current
+    if timings is None:
+        yield
+        return
+    start_time = timings.enter(name)
+    try:
+        yield
+    finally:
+        timings.exit(name, start_time)
+
+
+def timed(name: str) -> Callable[[Callable], Callable]:
+    """Decorator recording the calls of a function as a phase, adds a single check when instrumentation is off"""
+
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            timings = _current
+            if timings is None:
+                return function(*args, **kwargs)
+            start_time = timings.enter(name)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                timings.exit(name, start_time)
+
+        return wrapper
+
+    return decorator
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from typing import Optional
 
 
@@ -38,3 +39,17 @@ def join_paths(path1: Optional[str], path2: Optional[str]) -> Optional[str]:
     """Joins two paths if neither of them is None"""
     if path1 is not None and path2 is not None:
         return os.path.join(path1, path2)
+
+
+def atomic_write(path: str, data: bytes):
+    """Writes data to a temporary file next to path and moves it in place, so readers never see a partial file"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
@@ -0,0 +1,75 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import List, NamedTuple, Optional, Set, Union
+
+from mkdocs.utils import is_markdown_file
+
+from .discovery import walk_meta_files
+from .meta import Meta, MetaNavItem, MetaNavRestItem
+from .navigation import NavEntryNotFound, RulesOutsideRootHaveNoEffect
+
+
+class ValidationResult(NamedTuple):
+    path: str
+    errors: List[str]
+    warnings: List[str]
+
+
+def validate_all(
+    docs_dir: str, filename: Union[str, List[str]], strict: bool = True, jobs: Optional[int] = None
+) -> List[ValidationResult]:
+    """Validates all meta files below docs_dir without building the site, in a process pool unless jobs is 1"""
+    paths = walk_meta_files(docs_dir, filename)
+    validate = partial(validate_file, docs_dir, strict=strict)
+    if jobs == 1 or len(paths) < 2:
+        return [validate(path) for path in paths]
+
+    jobs = jobs or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        # Several files per task, so the cost of sending them between processes doesn't outweigh the parsing
+        return list(executor.map(validate, paths, chunksize=max(1, len(paths) // (jobs * 4))))
+
+
+def validate_file(docs_dir: str, rel_path: str, strict: bool = True) -> ValidationResult:
+    """Parses a meta file and resolves its nav entries against the listing of its directory"""
+    result = ValidationResult(rel_path, [], [])
+    try:
+        meta = Meta.load_from(os.path.join(docs_dir, rel_path))
+    except Exception as e:
+        result.errors.append(str(e))
+        return result
+    meta.path = rel_path  # Use the relative path
+
+    rel_dir = os.path.dirname(rel_path)
+    if meta.rules and rel_dir:
+        result.warnings.append(str(RulesOutsideRootHaveNoEffect(os.path.basename(rel_path), rel_path)))
+
+    if meta.nav is not None:
+        entries = _nav_entries(os.path.join(docs_dir, rel_dir))
+        for value in _missing_nav_entries(meta.nav, entries):
+            message = str(NavEntryNotFound(value, rel_path))
+            (result.errors if strict else result.warnings).append(message)
+    return result
+
+
+def _nav_entries(directory: str) -> Set[str]:
+    # Pages and directories can appear in the navigation, other files never do
+    entries = set()
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir() or is_markdown_file(entry.name):
+                entries.add(entry.name)
+    return entries
+
+
+def _missing_nav_entries(nav: List[MetaNavItem], entries: Set[str]) -> List[str]:
+    missing = []
+    for item in nav:
+        if isinstance(item, MetaNavRestItem):
+            continue
+        if isinstance(item.value, list):
+            missing.extend(_missing_nav_entries(item.value, entries))
+        elif item.value not in entries and item.title is None:
+            missing.append(item.value)  # entries with a title that aren't found become links
+    return missing